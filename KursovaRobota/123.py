@@ -1,135 +1,90 @@
+import argparse
 import tkinter as tk
 from tkinter import messagebox, Button, Label, Frame, ttk, Canvas
-import random
 import os
-import math
-from PIL import Image, ImageTk
-from typing import List, Tuple, Optional, Dict, Union, Callable
+from collections import deque
+from typing import TYPE_CHECKING, List, Tuple, Optional, Dict, Union, Callable
 from abc import ABC, abstractmethod
-
-
-# Шаблон проєктування Singleton для колоди карт
-class Deck:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Deck, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-
-    def _initialize(self):
-        self.suits = ['hearts', 'diamonds', 'clubs', 'spades']
-        self.ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
-        self.values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
-                       'jack': 10, 'queen': 10, 'king': 10, 'ace': 11}
-        self.cards = []
-        self.reset()
-
-    def reset(self):
-        """Метод для скидання колоди і створення нових карт."""
-        self.cards = [(rank, suit) for suit in self.suits for rank in self.ranks]
-        random.shuffle(self.cards)
-
-    def deal_card(self) -> Optional[Tuple[str, str]]:
-        """Роздати одну карту з колоди."""
-        if not self.cards:
-            return None
-        return self.cards.pop()
-
-    def get_card_value(self, card: Tuple[str, str]) -> int:
-        """Отримати числове значення карти."""
-        rank, _ = card
-        return self.values[rank]
-
-
-class Card:
-    def __init__(self, rank: str, suit: str):
-        self.rank = rank
-        self.suit = suit
-        self.value = Deck().get_card_value((rank, suit))
-        self.image = None
-
-    def get_image(self, card_width: int, card_height: int) -> ImageTk.PhotoImage:
-        """Завантажити зображення карти."""
-        image_path = f"cards/{self.rank}_of_{self.suit}.png"
-
-
-        if not os.path.exists(image_path):
-            image_path = "cards/back.png"
-
-        image = Image.open(image_path)
-        image = image.resize((card_width, card_height), Image.LANCZOS)
-        photo = ImageTk.PhotoImage(image)
-        self.image = photo
-        return photo
-
-
-class Hand:
-    def __init__(self):
-        self.cards: List[Card] = []
-        self.value = 0
-        self.aces = 0
-
-    def add_card(self, card: Card) -> None:
-        """Додати карту в руку і обчислити значення руки."""
-        self.cards.append(card)
-        self.value += card.value
-
-
-        if card.rank == 'ace':
-            self.aces += 1
-
-
-        while self.value > 21 and self.aces:
-            self.value -= 10
-            self.aces -= 1
-
-    def clear(self) -> None:
-        """Очистити руку."""
-        self.cards = []
-        self.value = 0
-        self.aces = 0
-
-
-class Player:
-    def __init__(self, name: str):
-        self.name = name
-        self.hand = Hand()
-        self.chips = 1000
-
-    def bet(self, amount: int) -> None:
-        """Зробити ставку."""
-        if amount <= self.chips:
-            self.chips -= amount
-        else:
-            raise ValueError("Недостатньо фішок")
-
-    def win_bet(self, amount: int) -> None:
-        """Виграти ставку."""
-        self.chips += amount * 2
-
-    def push(self, amount: int) -> None:
-        """Нічия (поверненя ставки)."""
-        self.chips += amount
+from game_models import Shoe, Card, Player
+from shuffler import ShufflePrefetcher, ContinuousShoe
+from image_cache import CardImageCache, CARDS_DIR
+from wheel_renderer import create_wheel_renderer
+from card_table import CardRow
+from animation import AnimationScheduler
+from counting import CountTracker
+from ledger import Ledger, WIN as WIN_KIND, PUSH as PUSH_KIND, REFUND
+from event_log import EventLog
+from strategy import StrategyTable, HIT, STAND, table_path as strategy_table_path
+from roulette_engine import (WHEEL_NUMBERS, NUMBER_COLORS, settle as settle_roulette, is_valid_bet,
+                             SpinPlan, GAME as ROULETTE_GAME)
+from rng import SeedStream, python_random
+from metrics import (METRICS, MetricsReporter, instrument_methods, instrument_frames, instrument_widgets)
+from blackjack_engine import (DEALER_STAND_VALUE, DEALER_BUST, PLAYER_BUST, BLACKJACK, WIN, LOSE, PUSH,
+                              settle, draw_card, BlackjackRound, RoundStats, Policy, play_round, stand_on_policy,
+                              round_record, GAME as BLACKJACK_GAME)
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+
+RESULT_MESSAGES = {
+    DEALER_BUST: "Дилер перебрав! Ви виграли!",
+    PLAYER_BUST: "Перебір! Ви програли.",
+    BLACKJACK: "Блекджек! Ви виграли!",
+    WIN: "Ви виграли!",
+    LOSE: "Ви програли.",
+    PUSH: "Нічия!",
+}
+
+ADVICE_MESSAGES = {
+    HIT: "Порада: взяти карту",
+    STAND: "Порада: достатньо",
+}
+
+FRAME_INTERVAL_MS = 20  # тривалість одного кадру траєкторії SpinPlan
+
+AUTO_PLAY_ROUNDS = 1000
+AUTO_PLAY_REFRESH = 250  # раундів між оновленнями підсумків під час автогри
+HISTORY_ROUNDS = 1000  # скільки останніх зіграних раундів зберігати для відтворення
 
 
 class BlackjackGame:
-    def __init__(self, parent_frame, player):
+    def __init__(self, parent_frame, player, decks: int = 1, penetration: float = 0.75, show_count: bool = False,
+                 seed: Optional[int] = None, shuffler: Optional[ShufflePrefetcher] = None,
+                 continuous_shuffle: bool = False):
         self.parent_frame = parent_frame
         self.player = player
+        self.show_count = show_count
 
 
-        self.deck = Deck()
+        if continuous_shuffle:
+            self.deck = ContinuousShoe(decks, seed)
+        else:
+            # Наступне тасування готується у фоні, тож new_game не тасує на потоці інтерфейсу
+            self.deck = Shoe(decks, penetration, seed, shuffler)
+        self.count_tracker = CountTracker(self.deck)
+        if player.events is not None:
+            self.deck.add_observer(player.events)  # кожна роздана карта потрапляє в журнал подій
         self.dealer = Player("Дилер")
         self.bet_amount = 0
+        self.last_bet = 10  # ставка для автогри
         self.game_over = True
+        self.auto_playing = False
+        # Записи зіграних раундів для blackjack_engine.replay_round()
+        self.history: "deque[dict]" = deque(maxlen=HISTORY_ROUNDS)
+        self.shoe_state = None
+        self.actions: List[str] = []
 
 
         self.card_width = 80
         self.card_height = 120
 
 
+        # Таблиця базової стратегії (будується один раз командою: python strategy.py --decks N)
+        strategy_path = strategy_table_path(decks)
+        self.strategy = StrategyTable.load(strategy_path) if os.path.exists(strategy_path) else None
+
+
         self.setup_ui()
 
 
@@ -159,6 +114,16 @@ class BlackjackGame:
                                bg="#2c3e50", fg="white", font=("Arial", 14))
         self.bet_label.pack(side=tk.LEFT, padx=5)
 
+        self.advice_label = Label(self.info_frame, text="",
+                                  bg="#2c3e50", fg="#f1c40f", font=("Arial", 14))
+        self.advice_label.pack(side=tk.LEFT, padx=5)
+
+        self.count_label = Label(self.info_frame, text="",
+                                 bg="#2c3e50", fg="#95a5a6", font=("Arial", 12))
+        if self.show_count:
+            self.count_label.pack(side=tk.LEFT, padx=5)
+            self.update_count_display()
+
         self.result_label = Label(self.info_frame, text="",
                                   bg="#2c3e50", fg="white", font=("Arial", 14))
         self.result_label.pack(side=tk.RIGHT, padx=5)
@@ -168,8 +133,8 @@ class BlackjackGame:
                                   bg="#34495e", fg="white", font=("Arial", 14))
         self.dealer_title.pack(anchor=tk.W)
 
-        self.dealer_cards_frame = Frame(self.dealer_frame, bg="#34495e")
-        self.dealer_cards_frame.pack(pady=10)
+        self.dealer_cards = CardRow(self.dealer_frame, self.card_width, self.card_height, bg="#34495e")
+        self.dealer_cards.pack(pady=10)
 
         self.dealer_value = Label(self.dealer_frame, text="",
                                   bg="#34495e", fg="white", font=("Arial", 12))
@@ -179,8 +144,8 @@ class BlackjackGame:
                                   bg="#2c3e50", fg="white", font=("Arial", 14))
         self.player_title.pack(anchor=tk.W)
 
-        self.player_cards_frame = Frame(self.player_frame, bg="#2c3e50")
-        self.player_cards_frame.pack(pady=10)
+        self.player_cards = CardRow(self.player_frame, self.card_width, self.card_height, bg="#2c3e50")
+        self.player_cards.pack(pady=10)
 
         self.player_value = Label(self.player_frame, text="",
                                   bg="#2c3e50", fg="white", font=("Arial", 12))
@@ -199,6 +164,10 @@ class BlackjackGame:
                                       command=self.new_game, font=("Arial", 12), bg="#e74c3c", fg="white")
         self.new_game_button.pack(side=tk.RIGHT, padx=5)
 
+        self.auto_play_button = Button(self.control_frame, text=f"Авто ×{AUTO_PLAY_ROUNDS}",
+                                       command=self.auto_play, font=("Arial", 12), bg="#9b59b6", fg="white")
+        self.auto_play_button.pack(side=tk.RIGHT, padx=5)
+
 
         self.bet_frame = Frame(self.control_frame, bg="#2c3e50")
         self.bet_frame.pack(side=tk.RIGHT, padx=20)
@@ -218,13 +187,24 @@ class BlackjackGame:
     def load_card_images(self):
         """Завантаження зображень карт."""
 
-        if not os.path.exists('cards'):
-            os.makedirs('cards')
+        if not os.path.isdir(CARDS_DIR):
             messagebox.showinfo("Інформація",
-                                "Будь ласка, додайте зображення карт у папку 'cards'.\n"
+                                f"Будь ласка, додайте зображення карт у папку '{CARDS_DIR}'.\n"
                                 "Назви файлів мають бути у форматі: 'rank_of_suit.png'\n"
                                 "Наприклад: 'ace_of_hearts.png'")
 
+        # Декодуємо всі карти у фоні, щойно вкладку вперше намальовано:
+        # старт не чекає на PIL, а перша роздача - на PNG
+        self.warm_up_binding = self.chips_label.bind("<Expose>", self.warm_up_card_images, add="+")
+
+    def warm_up_card_images(self, event=None) -> None:
+        """Почати фонове декодування зображень карт (один раз)."""
+        if self.warm_up_binding is None:
+            return
+        self.chips_label.unbind("<Expose>", self.warm_up_binding)
+        self.warm_up_binding = None
+        self.parent_frame.after_idle(CardImageCache().warm_up, self.card_width, self.card_height)
+
     def update_chips_display(self):
         """Оновити відображення фішок."""
         self.chips_label.config(text=f"Фішки: {self.player.chips}")
@@ -236,9 +216,11 @@ class BlackjackGame:
 
         if amount <= self.player.chips:
             self.bet_amount = amount
+            self.last_bet = amount
             self.bet_label.config(text=f"Ставка: {self.bet_amount}")
             self.deal_cards()
             self.game_over = False
+            self.update_advice()
 
 
             self.toggle_bet_buttons(False)
@@ -281,27 +263,35 @@ class BlackjackGame:
 
 
         self.chips_label.config(text=f"Фішки: {self.player.chips}")
+        self.update_count_display()
 
         self.game_over = True
 
     def clear_cards(self) -> None:
         """Очистити відображення карт."""
-        for widget in self.player_cards_frame.winfo_children():
-            widget.destroy()
-
-        for widget in self.dealer_cards_frame.winfo_children():
-            widget.destroy()
+        self.player_cards.clear()
+        self.dealer_cards.clear()
 
     def deal_cards(self) -> None:
         """Роздати початкові карти."""
 
         try:
-            self.player.bet(self.bet_amount)
+            self.player.bet(self.bet_amount, BLACKJACK_GAME)
             self.chips_label.config(text=f"Фішки: {self.player.chips}")
         except ValueError as e:
             messagebox.showerror("Помилка", str(e))
             return
 
+        # Після авто-гри ставки доступні без "Нова гра": прибрати руки попереднього раунду
+        self.player.hand.clear()
+        self.dealer.hand.clear()
+        self.clear_cards()
+        self.result_label.config(text="")
+        self.dealer_value.config(text="")
+
+        self.deck.shuffle_if_needed()
+        self.shoe_state = self.deck.state()
+        self.actions = []
 
         for _ in range(2):
 
@@ -309,7 +299,7 @@ class BlackjackGame:
             if card_data:
                 card = Card(card_data[0], card_data[1])
                 self.player.hand.add_card(card)
-                self.display_card(card, self.player_cards_frame)
+                self.display_card(card, self.player_cards)
 
 
             card_data = self.deck.deal_card()
@@ -320,12 +310,9 @@ class BlackjackGame:
 
                 if _ == 0:
                     self.dealer_hidden_card = card
-                    back_image = self.get_card_back_image()
-                    label = Label(self.dealer_cards_frame, image=back_image)
-                    label.image = back_image
-                    label.pack(side=tk.LEFT, padx=2)
+                    self.dealer_cards.add(self.get_card_back_image())
                 else:
-                    self.display_card(card, self.dealer_cards_frame)
+                    self.display_card(card, self.dealer_cards)
 
 
         self.player_value.config(text=f"Сума: {self.player.hand.value}")
@@ -334,31 +321,22 @@ class BlackjackGame:
         if self.player.hand.value == 21:
             self.stand()
 
-    def display_card(self, card: Card, frame: Frame) -> None:
-        """Відобразити карту на екрані."""
+    def display_card(self, card: Card, row: CardRow, index: Optional[int] = None) -> None:
+        """Відобразити карту на наступному місці ряду або замінити карту на місці index."""
         try:
-            photo = card.get_image(self.card_width, self.card_height)
-            label = Label(frame, image=photo)
-            label.image = photo
-            label.pack(side=tk.LEFT, padx=2)
+            photo, text = card.get_image(self.card_width, self.card_height), ""
         except Exception as e:
 
-            label = Label(frame, text=f"{card.rank} of {card.suit}",
-                          bg="white", width=8, height=5)
-            label.pack(side=tk.LEFT, padx=2)
+            photo, text = None, f"{card.rank} of {card.suit}"
+        if index is None:
+            row.add(photo, text)
+        else:
+            row.set(index, photo, text)
 
-    def get_card_back_image(self) -> ImageTk.PhotoImage:
+    def get_card_back_image(self) -> "ImageTk.PhotoImage":
         """Отримати зображення звороту карти."""
         try:
-            image_path = "cards/back.png"
-            if not os.path.exists(image_path):
-
-                image = Image.new('RGB', (self.card_width, self.card_height), color='blue')
-            else:
-                image = Image.open(image_path)
-
-            image = image.resize((self.card_width, self.card_height), Image.LANCZOS)
-            return ImageTk.PhotoImage(image)
+            return CardImageCache().get_back(self.card_width, self.card_height)
         except Exception:
 
             return None
@@ -368,15 +346,19 @@ class BlackjackGame:
         if self.game_over:
             return
 
+        self.actions.append(HIT)
         card_data = self.deck.deal_card()
         if card_data:
             card = Card(card_data[0], card_data[1])
             self.player.hand.add_card(card)
-            self.display_card(card, self.player_cards_frame)
+            self.display_card(card, self.player_cards)
             self.player_value.config(text=f"Сума: {self.player.hand.value}")
+            self.update_advice()
 
             # Перевірка на перебір
             if self.player.hand.value > 21:
+                if self.player.events is not None:
+                    self.player.events.blackjack_settled(PLAYER_BUST, 0, self.player.chips)
                 self.end_game("Перебір! Ви програли.")
 
     def stand(self) -> None:
@@ -384,68 +366,126 @@ class BlackjackGame:
         if self.game_over:
             return
 
+        self.actions.append(STAND)
 
-        for widget in self.dealer_cards_frame.winfo_children():
-            widget.destroy()
-
-        self.display_card(self.dealer_hidden_card, self.dealer_cards_frame)
-        for card in self.dealer.hand.cards[1:]:
-            self.display_card(card, self.dealer_cards_frame)
+        # Відкрити закриту карту: інші карти дилера вже на своїх місцях
+        self.display_card(self.dealer_hidden_card, self.dealer_cards, 0)
 
         self.dealer_value.config(text=f"Сума: {self.dealer.hand.value}")
 
 
-        while self.dealer.hand.value < 17:
-            card_data = self.deck.deal_card()
-            if card_data:
-                card = Card(card_data[0], card_data[1])
-                self.dealer.hand.add_card(card)
-                self.display_card(card, self.dealer_cards_frame)
-                self.dealer_value.config(text=f"Сума: {self.dealer.hand.value}")
+        while self.dealer.hand.value < DEALER_STAND_VALUE:
+            card = draw_card(self.deck, self.dealer.hand)
+            self.display_card(card, self.dealer_cards)
+            self.dealer_value.config(text=f"Сума: {self.dealer.hand.value}")
 
 
         self.determine_winner()
 
     def determine_winner(self) -> None:
         """Визначення переможця гри."""
-        player_value = self.player.hand.value
-        dealer_value = self.dealer.hand.value
-
-
-        if dealer_value > 21:
-            self.player.win_bet(self.bet_amount)
-            self.end_game("Дилер перебрав! Ви виграли!")
+        outcome, payout = settle(self.player.hand, self.dealer.hand, self.bet_amount)
+        self.player.collect(payout, PUSH_KIND if outcome == PUSH else WIN_KIND, BLACKJACK_GAME)
+        if self.player.events is not None:
+            self.player.events.blackjack_settled(outcome, payout, self.player.chips)
+        self.end_game(RESULT_MESSAGES[outcome])
+
+    def update_count_display(self) -> None:
+        """Показати підрахунок карт. Оновлюється лише між раундами, коли всі карти відкриті."""
+        if not self.show_count:
+            return
+        tracker = self.count_tracker
+        self.count_label.config(text=f"Рахунок: {tracker.running_count:+d} "
+                                     f"(істинний {tracker.true_count:+.1f}), колод: {tracker.decks_left:.1f}")
+
+    def update_advice(self) -> None:
+        """Показати пораду базової стратегії для поточної руки."""
+        if self.strategy is None or self.game_over or len(self.dealer.hand.cards) < 2:
+            self.advice_label.config(text="")
+            return
+        action = self.strategy.advise(self.player.hand, self.dealer.hand.cards[1])
+        self.advice_label.config(text=ADVICE_MESSAGES[action])
+
+    def auto_play(self, rounds: int = AUTO_PLAY_ROUNDS, bet: Optional[int] = None,
+                  policy: Optional[Policy] = None) -> None:
+        """Зіграти серію раундів без показу карт.
+
+        Раунди йдуть через BlackjackRound; віджети оновлюються лише раз на
+        AUTO_PLAY_REFRESH раундів (фішки і відсоток виграшів), а карти
+        показуються тільки для останньої руки.
+        """
+        if not self.game_over or self.auto_playing:
+            return
+        bet = bet or self.last_bet
+        if policy is None:
+            policy = self.strategy.advise if self.strategy is not None else stand_on_policy()
 
-        elif player_value > 21:
-            self.end_game("Перебір! Ви програли.")
+        self.auto_playing = True
+        self.toggle_bet_buttons(False)
+        self.toggle_game_buttons(False)
+        self.auto_play_button.config(state=tk.DISABLED)
+        self.new_game_button.config(state=tk.DISABLED)
+        self.clear_cards()
+        self.advice_label.config(text="")
+        self.player_value.config(text="")
+        self.dealer_value.config(text="")
 
-        elif player_value == 21 and len(self.player.hand.cards) == 2:
+        game_round = BlackjackRound(self.player, self.deck, self.dealer, self.player.events)
+        self._auto_play_batch(game_round, RoundStats(), rounds, bet, policy)
 
-            self.player.chips += int(self.bet_amount * 2.5)
-            self.end_game("Блекджек! Ви виграли!")
+    def _auto_play_batch(self, game_round: BlackjackRound, stats: RoundStats, rounds: int, bet: int,
+                         policy: Policy) -> None:
+        for _ in range(min(AUTO_PLAY_REFRESH, rounds - stats.rounds)):
+            if bet > self.player.chips:
+                break
+            play_round(game_round, bet, policy)
+            stats.add(game_round)
+            self.history.append(game_round.record())
 
-        elif player_value > dealer_value:
-            self.player.win_bet(self.bet_amount)
-            self.end_game("Ви виграли!")
+        self.chips_label.config(text=f"Фішки: {self.player.chips}")
+        self.result_label.config(text=f"Авто: {stats.rounds}/{rounds}, виграші {stats.win_rate:.1%}")
+        if stats.rounds < rounds and bet <= self.player.chips:
+            # Дати циклу подій перемалювати підсумки перед наступною пачкою
+            self.parent_frame.after(1, self._auto_play_batch, game_round, stats, rounds, bet, policy)
+            return
+        self._finish_auto_play(game_round, stats)
 
-        elif dealer_value > player_value:
-            self.end_game("Ви програли.")
+    def _finish_auto_play(self, game_round: BlackjackRound, stats: RoundStats) -> None:
+        self.auto_playing = False
+        self.auto_play_button.config(state=tk.NORMAL)
+        self.new_game_button.config(state=tk.NORMAL)
+        self.toggle_bet_buttons(True)
+        self.bet_amount = 0
+        self.bet_label.config(text=f"Ставка: {self.bet_amount}")
 
-        else:
-            self.player.push(self.bet_amount)
-            self.end_game("Нічия!")
+        if not stats.rounds:
+            self.end_game("Недостатньо фішок!")
+            return
+        for card in self.player.hand.cards:
+            self.display_card(card, self.player_cards)
+        for card in self.dealer.hand.cards:
+            self.display_card(card, self.dealer_cards)
+        self.player_value.config(text=f"Сума: {self.player.hand.value}")
+        self.dealer_value.config(text=f"Сума: {self.dealer.hand.value}")
+        self.end_game(f"Авто: {stats.rounds} раундів, виграші {stats.win_rate:.1%}, результат {stats.net:+d}. "
+                      f"Остання рука: {RESULT_MESSAGES[game_round.outcome]}")
 
     def end_game(self, result_message: str) -> None:
         """Завершення гри і відображення результату."""
+        if self.shoe_state is not None:
+            self.history.append(round_record(self.deck, self.shoe_state, self.bet_amount, self.actions))
+            self.shoe_state = None
         self.result_label.config(text=result_message)
+        self.advice_label.config(text="")
         self.toggle_game_buttons(False)
         self.chips_label.config(text=f"Фішки: {self.player.chips}")
+        self.update_count_display()
         self.game_over = True
 
 
         if self.player.chips <= 0:
             messagebox.showinfo("Кінець гри", "У вас закінчились фішки. Гра завершена.")
-            self.player.chips = 1000  # Починаємо нову гру з початковою кількістю фішок
+            self.player.reset_chips()  # Починаємо нову гру з початковою кількістю фішок
 
 
 class RouletteState(ABC):
@@ -464,12 +504,17 @@ class RouletteState(ABC):
 
 class IdleState(RouletteState):
     def place_bet(self, game, bet_type: str):
+        if not is_valid_bet(bet_type):
+            messagebox.showerror("Помилка", f"Невідома ставка: {bet_type}")
+            return
         if game.bet_amount == 0:
             messagebox.showerror("Помилка", "Виберіть суму ставки!")
             return
         if game.bet_amount <= game.player.chips:
-            game.player.bet(game.bet_amount)
+            game.player.bet(game.bet_amount, ROULETTE_GAME)
             game.active_bets[bet_type] = game.active_bets.get(bet_type, 0) + game.bet_amount
+            if game.player.events is not None:
+                game.player.events.roulette_bet(bet_type, game.bet_amount)
             game.update_chips_display()
             game.result_label.config(text=f"Ставка на {bet_type} прийнята")
         else:
@@ -480,15 +525,22 @@ class IdleState(RouletteState):
             messagebox.showerror("Помилка", "Зробіть хоча б одну ставку!")
             return
         game.set_state(SpinningState())
-        game.spin_speed = random.uniform(0.1, 0.2)
-        game.ball_speed = random.uniform(0.15, 0.25)
+        game.spin_seed = game.seeds.next_seed()
+        # Результат відомий одразу; анімація лише показує траєкторію
+        game.spin_plan = SpinPlan.from_rng(python_random(game.spin_seed), game.angle, game.ball_angle)
+        game.spin_speed, game.ball_speed = game.spin_plan.spin_speed, game.spin_plan.ball_speed
         game.spinning_time = 0
+        if game.turbo_var.get():
+            game.skip_animation()
+            return
         game.result_label.config(text="Колесо крутиться...")
-        game.animate_wheel()
+        game.start_animation()
 
     def clear_bets(self, game):
-        for bet_amount in game.active_bets.values():
-            game.player.chips += bet_amount
+        for bet_type, bet_amount in game.active_bets.items():
+            game.player.collect(bet_amount, REFUND, ROULETTE_GAME)
+            if game.player.events is not None:
+                game.player.events.roulette_bet(bet_type, -bet_amount)
         game.active_bets.clear()
         game.bet_amount = 0
         game.bet_label.config(text=f"Ставка: {game.bet_amount}")
@@ -501,7 +553,8 @@ class SpinningState(RouletteState):
         messagebox.showinfo("Зачекайте", "Колесо крутиться, зачекайте результату!")
 
     def spin_wheel(self, game):
-        messagebox.showinfo("Зачекайте", "Колесо вже крутиться!")
+        # Повторне натискання пропускає анімацію
+        game.skip_animation()
 
     def clear_bets(self, game):
         messagebox.showinfo("Зачекайте", "Не можна очистити ставки під час обертання!")
@@ -522,9 +575,18 @@ class ResultState(RouletteState):
 
 
 class RouletteGame:
-    def __init__(self, parent_frame, player):
+    def __init__(self, parent_frame, player, render_mode: str = "canvas", seed: Optional[int] = None,
+                 turbo: bool = False, frames_per_tick: float = 1.0):
         self.parent_frame = parent_frame
         self.player = player
+        self.seeds = SeedStream(seed)  # окремий потік випадковості для кожного обертання
+        self.spin_seed = None
+        self.spin_plan: Optional[SpinPlan] = None
+        # Записи обертань для SpinPlan.replay(): seed і початкові кути колеса і кульки
+        self.history: "deque[dict]" = deque(maxlen=HISTORY_ROUNDS)
+        self.turbo = turbo  # одразу показувати результат без анімації
+        self.frames_per_tick = frames_per_tick  # >1 - коротша анімація тієї ж траєкторії
+        self.render_mode = render_mode  # "canvas" або "bitmap" (див. wheel_renderer)
         self.bet_amount = 0
         self.active_bets = {}
         self.wheel_radius = 150
@@ -537,20 +599,10 @@ class RouletteGame:
         self.spin_speed = 0
         self.ball_speed = 0
         self.spinning_time = 0
+        self.animation_id = None
         self.winner_number = None
-        self.numbers = [
-            0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10,
-            5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
-        ]
-        self.number_colors = {
-            0: "green",
-            1: "red", 2: "black", 3: "red", 4: "black", 5: "red", 6: "black",
-            7: "red", 8: "black", 9: "red", 10: "black", 11: "black", 12: "red",
-            13: "black", 14: "red", 15: "black", 16: "red", 17: "black", 18: "red",
-            19: "red", 20: "black", 21: "red", 22: "black", 23: "red", 24: "black",
-            25: "red", 26: "black", 27: "red", 28: "black", 29: "black", 30: "red",
-            31: "black", 32: "red", 33: "black", 34: "red", 35: "black", 36: "red"
-        }
+        self.numbers = list(WHEEL_NUMBERS)
+        self.number_colors = dict(NUMBER_COLORS)
         self.state = IdleState()  # Початковий стан
         self.setup_ui()
 
@@ -576,6 +628,8 @@ class RouletteGame:
         self.result_label.pack(side=tk.RIGHT, padx=5)
         self.wheel_canvas = Canvas(self.wheel_frame, width=500, height=400, bg="#34495e", highlightthickness=0)
         self.wheel_canvas.pack(pady=10)
+        self.wheel_renderer = create_wheel_renderer(self.render_mode, self.wheel_canvas, self)
+        self.animator = AnimationScheduler(self.wheel_canvas, fps=1000 / FRAME_INTERVAL_MS)
         self.draw_wheel()
 
         bet_types = [("red", "Червоне", "#e74c3c"), ("black", "Чорне", "#2c3e50"), ("green", "Зеро", "#2ecc71"),
@@ -592,6 +646,11 @@ class RouletteGame:
         self.clear_bets_button = Button(self.control_frame, text="Очистити ставки", command=self.clear_bets,
                                         font=("Arial", 12), bg="#e74c3c", fg="white", width=15)
         self.clear_bets_button.pack(side=tk.LEFT, padx=5, pady=5)
+        self.turbo_var = tk.BooleanVar(value=self.turbo)
+        self.turbo_check = tk.Checkbutton(self.control_frame, text="Турбо", variable=self.turbo_var,
+                                          font=("Arial", 12), bg="#2c3e50", fg="white", selectcolor="#34495e",
+                                          activebackground="#2c3e50", activeforeground="white")
+        self.turbo_check.pack(side=tk.LEFT, padx=5, pady=5)
         self.bet_amount_frame = Frame(self.control_frame, bg="#2c3e50")
         self.bet_amount_frame.pack(side=tk.RIGHT, padx=20)
         self.bet_amount_buttons = []
@@ -640,94 +699,107 @@ class RouletteGame:
         self.state.clear_bets(self)
 
     def draw_wheel(self):
-        self.wheel_canvas.delete("all")
-        self.wheel_canvas.create_oval(self.center_x - self.wheel_radius, self.center_y - self.wheel_radius,
-                                      self.center_x + self.wheel_radius, self.center_y + self.wheel_radius,
-                                      fill="#333333")
-        num_sectors = len(self.numbers)
-        angle_step = 360 / num_sectors
-        for i, num in enumerate(self.numbers):
-            start_angle = i * angle_step + self.angle
-            color = self.number_colors[num]
-            self.wheel_canvas.create_arc(self.center_x - self.wheel_radius, self.center_y - self.wheel_radius,
-                                         self.center_x + self.wheel_radius, self.center_y + self.wheel_radius,
-                                         start=start_angle, extent=angle_step, fill=color, outline="#ffffff")
-            text_angle = math.radians(start_angle + angle_step / 2)
-            text_x = self.center_x + (self.wheel_radius - 30) * math.cos(text_angle)
-            text_y = self.center_y - (self.wheel_radius - 30) * math.sin(text_angle)
-            self.wheel_canvas.create_text(text_x, text_y, text=str(num), fill="white" if color != "green" else "black",
-                                          font=("Arial", 8, "bold"))
-
-        if isinstance(self.state, SpinningState) or isinstance(self.state, ResultState):
-            ball_x = self.center_x + self.ball_distance * math.cos(self.ball_angle)
-            ball_y = self.center_y - self.ball_distance * math.sin(self.ball_angle)
-            self.wheel_canvas.create_oval(ball_x - self.ball_radius, ball_y - self.ball_radius,
-                                          ball_x + self.ball_radius, ball_y + self.ball_radius, fill="white")
-
-    def animate_wheel(self):
-        self.spinning_time += 1
-        self.angle += self.spin_speed
-        self.ball_angle += self.ball_speed
-        self.spin_speed *= 0.99
-        self.ball_speed *= 0.98
+        show_ball = isinstance(self.state, SpinningState) or isinstance(self.state, ResultState)
+        self.wheel_renderer.draw(self.angle, self.ball_angle, show_ball)
+
+    def start_animation(self):
+        self.animation_id = self.animator.start(self.animate_wheel, self._animation_done)
 
+    def animate_wheel(self, elapsed: float) -> bool:
+        """Показати колесо через elapsed секунд після запуску (кадри, що не встигли, пропускаються)."""
+        plan = self.spin_plan
+        self.spinning_time = min(elapsed * 1000 / FRAME_INTERVAL_MS * self.frames_per_tick, plan.frames)
+        self.angle, self.ball_angle = plan.at(self.spinning_time)
         self.draw_wheel()
-        if self.spinning_time < 100 or self.spin_speed > 0.01:
-            self.wheel_canvas.after(20, self.animate_wheel)
-        else:
-            self.stop_wheel()
+        return self.spinning_time < plan.frames
+
+    def _animation_done(self):
+        self.animation_id = None
+        self.stop_wheel()
+
+    def skip_animation(self):
+        """Одразу перейти до кінця обертання і розрахувати ставки."""
+        if not isinstance(self.state, SpinningState):
+            return
+        if self.animation_id is not None:
+            self.animator.cancel(self.animation_id)
+            self.animation_id = None
+        self.spinning_time = self.spin_plan.frames
+        self.angle, self.ball_angle = self.spin_plan.final_angle, self.spin_plan.final_ball_angle
+        self.draw_wheel()
+        self.stop_wheel()
 
     def stop_wheel(self):
-        num_sectors = len(self.numbers)
-        sector_angle = 360 / num_sectors
-        normalized_angle = math.degrees(self.ball_angle) % 360
-        sector = int(normalized_angle // sector_angle)
-        self.winner_number = self.numbers[sector]
+        self.winner_number = self.spin_plan.winner
+        self.history.append({
+            "seed": self.spin_seed,
+            "angle": self.spin_plan.angle,
+            "ball_angle": self.spin_plan.ball_angle,
+            "bets": dict(self.active_bets),
+            "winner": self.winner_number,
+        })
+        if self.player.events is not None:
+            self.player.events.spin(self.winner_number)
         winner_color = self.number_colors[self.winner_number]
         self.result_label.config(text=f"Випало: {self.winner_number} ({winner_color})")
         self.calculate_winnings()
         self.set_state(ResultState())
 
     def calculate_winnings(self):
-        total_winnings = 0
-        winner_color = self.number_colors[self.winner_number]
-        is_even = self.winner_number % 2 == 0 and self.winner_number != 0
-        is_low = 1 <= self.winner_number <= 18
-        for bet_type, amount in self.active_bets.items():
-            if bet_type == "red" and winner_color == "red":
-                total_winnings += amount * 2
-            elif bet_type == "black" and winner_color == "black":
-                total_winnings += amount * 2
-            elif bet_type == "green" and winner_color == "green":
-                total_winnings += amount * 36
-            elif bet_type == "even" and is_even:
-                total_winnings += amount * 2
-            elif bet_type == "odd" and not is_even and self.winner_number != 0:
-                total_winnings += amount * 2
-            elif bet_type == "1-18" and is_low:
-                total_winnings += amount * 2
-            elif bet_type == "19-36" and not is_low and self.winner_number != 0:
-                total_winnings += amount * 2
-            elif bet_type.startswith("number_"):
-                bet_number = int(bet_type.split("_")[1])
-                if bet_number == self.winner_number:
-                    total_winnings += amount * 36
+        total_winnings = settle_roulette(self.active_bets, self.winner_number)
         if total_winnings > 0:
-            self.player.chips += total_winnings
+            self.player.collect(total_winnings, game=ROULETTE_GAME)
             self.result_label.config(text=f"Ви виграли {total_winnings} фішок!")
         else:
             self.result_label.config(text="Ви програли!")
+        if self.player.events is not None:
+            self.player.events.roulette_settled(self.winner_number, total_winnings, self.player.chips)
         self.active_bets.clear()
         self.bet_amount = 0
         self.bet_label.config(text=f"Ставка: {self.bet_amount}")
         self.update_chips_display()
 
+def enable_metrics(path: Optional[str] = None, port: Optional[int] = None,
+                   interval: float = 10.0) -> MetricsReporter:
+    """Увімкнути вимірювання гарячих шляхів. Викликати до створення ігор,
+    бо кнопки запам'ятовують методи під час setup_ui."""
+    instrument_methods(BlackjackGame, ("hit", "stand", "place_bet"))
+    instrument_methods(RouletteGame, ("place_bet", "spin_wheel"))
+    instrument_frames(AnimationScheduler, "_tick", FRAME_INTERVAL_MS)
+    instrument_methods(CardImageCache, ("_decode",))
+    instrument_widgets()
+    METRICS.gauge("image_cache.decodes", lambda: CardImageCache().decodes)
+    METRICS.gauge("image_cache.atlas_decodes", lambda: CardImageCache().atlas_decodes)
+    return MetricsReporter(METRICS, path, port, interval)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Курсова робота: блекджек і рулетка")
+    parser.add_argument("--metrics", metavar="PATH", help="періодично записувати метрики у JSON-файл")
+    parser.add_argument("--metrics-port", type=int, help="віддавати метрики на http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics-interval", type=float, default=10.0, help="інтервал запису метрик, с")
+    parser.add_argument("--eager", action="store_true",
+                        help="створити обидві гри під час запуску, а не при першому відкритті вкладки")
+    parser.add_argument("--continuous-shuffle", action="store_true",
+                        help="блекджек з машиною безперервного тасування замість черевика з карткою зрізу")
+    parser.add_argument("--show-count", action="store_true",
+                        help="показувати в блекджеку підрахунок карт Hi-Lo (поточний та істинний рахунок)")
+    args = parser.parse_args()
+    reporter = None
+    if args.metrics or args.metrics_port is not None:
+        reporter = enable_metrics(args.metrics, args.metrics_port, args.metrics_interval)
+
     root = tk.Tk()
     root.title("Курсова робота")
     root.geometry("1000x700")
 
-    player = Player("Гравець")
+    ledger = Ledger("ledger.db")
+    events = EventLog("events.bin")
+    shuffler = ShufflePrefetcher()
+    player = Player("Гравець", ledger, events)
+    restored_chips = ledger.restore(player.name)
+    if restored_chips is not None:
+        player.chips = restored_chips
 
     notebook = ttk.Notebook(root)
     blackjack_frame = Frame(notebook, bg="#2c3e50")
@@ -737,7 +809,31 @@ if __name__ == "__main__":
     notebook.add(roulette_frame, text="Рулетка")
     notebook.pack(fill=tk.BOTH, expand=True)
 
-    blackjack_game = BlackjackGame(blackjack_frame, player)
-    roulette_game = RouletteGame(roulette_frame, player)
-
-    root.mainloop()
\ No newline at end of file
+    # Гра вкладки створюється лише тоді, коли вкладку вперше відкрито
+    games = {}
+    builders = {
+        str(blackjack_frame): lambda: BlackjackGame(blackjack_frame, player, shuffler=shuffler,
+                                                    continuous_shuffle=args.continuous_shuffle,
+                                                    show_count=args.show_count),
+        str(roulette_frame): lambda: RouletteGame(roulette_frame, player),
+    }
+
+    def build_selected_tab(event=None):
+        tab = notebook.select()
+        builder = builders.pop(tab, None)
+        if builder is not None:
+            games[tab] = builder()
+
+    if args.eager:
+        for tab in list(builders):
+            games[tab] = builders.pop(tab)()
+    else:
+        notebook.bind("<<NotebookTabChanged>>", build_selected_tab)
+        build_selected_tab()
+
+    root.mainloop()
+    ledger.close()
+    events.close()
+    shuffler.close()
+    if reporter is not None:
+        reporter.close()
\ No newline at end of file
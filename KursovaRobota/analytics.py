@@ -0,0 +1,262 @@
+import argparse
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from blackjack_engine import OUTCOMES, BLACKJACK as BLACKJACK_OUTCOME
+from event_log import (EventLogReader, BET, REFUND, SETTLE, STAKE, NO_GAME, BLACKJACK, ROULETTE)
+from roulette_engine import BET_KEYS, BET_MASKS, PAYOUT_MATRIX
+
+
+# Колонки таблиці раундів: один рядок на розрахований раунд
+ROUND_DTYPE = np.dtype([
+    ("round", "<u4"),
+    ("ts", "<f8"),
+    ("game", "u1"),
+    ("code", "<i2"),      # індекс результату в OUTCOMES або виграшне число
+    ("wagered", "<i8"),
+    ("payout", "<i8"),
+    ("balance", "<i8"),
+])
+# Колонки таблиці ставок рулетки: одна сума на (раунд, поле ставки)
+STAKE_DTYPE = np.dtype([
+    ("round", "<u4"),
+    ("bet", "<u2"),       # рядок у BET_KEYS
+    ("winner", "u1"),
+    ("amount", "<i8"),
+])
+GAME_NAMES = {BLACKJACK: "blackjack", ROULETTE: "roulette"}
+
+
+def bet_category(bet_key: str) -> str:
+    """Вид ставки: red, even, 1-18 ... або префікс для number_N, split_A_B, dozen_N і т.д."""
+    return bet_key.split("_")[0]
+
+
+BET_CATEGORIES = sorted({bet_category(key) for key in BET_KEYS})
+BET_CATEGORY_INDEX = np.array([BET_CATEGORIES.index(bet_category(key)) for key in BET_KEYS])
+
+
+def build_rounds(records: np.ndarray) -> np.ndarray:
+    """Таблиця раундів із записів журналу подій.
+
+    Кожна гра нумерує раунди окремо, тому ставки і повернення групуються
+    за ключем (гра, раунд) одним bincount, а раунд кожного запису
+    знаходиться через searchsorted серед ключів записів SETTLE. Записи без
+    гри (NO_GAME) до жодного раунду не належать і відкидаються.
+    """
+    settles = records[records["kind"] == SETTLE]
+    table = np.empty(len(settles), dtype=ROUND_DTYPE)
+    table["round"] = settles["round"]
+    table["ts"] = settles["ts"]
+    table["game"] = settles["game"]
+    table["code"] = settles["code"]
+    table["payout"] = settles["amount"]
+    table["balance"] = settles["balance"]
+
+    kinds = records["kind"]
+    chips = records[((kinds == BET) | (kinds == REFUND)) & (records["game"] != NO_GAME)]
+    position, found = _round_positions(round_keys(settles), round_keys(chips))
+    # BET записано від'ємною сумою, REFUND - додатною
+    table["wagered"] = -np.bincount(position[found], weights=chips["amount"][found], minlength=len(table))
+    return table
+
+
+def build_stakes(records: np.ndarray, rounds: np.ndarray) -> np.ndarray:
+    """Таблиця ставок рулетки: сума на кожне поле в кожному розрахованому раунді.
+
+    Повернуті ставки (від'ємні STAKE) взаємно знищуються з початковими при
+    групуванні за ключем (раунд, поле).
+    """
+    stakes = records[(records["kind"] == STAKE) & (records["game"] == ROULETTE)]
+    roulette = rounds[rounds["game"] == ROULETTE]
+    position, found = _round_positions(round_keys(roulette), round_keys(stakes))
+    stakes, position = stakes[found], position[found]
+
+    key = position.astype(np.int64) * len(BET_KEYS) + stakes["code"]
+    keys, inverse = np.unique(key, return_inverse=True)
+    amounts = np.bincount(inverse, weights=stakes["amount"]).astype(np.int64)
+    placed = amounts > 0
+    keys, amounts = keys[placed], amounts[placed]
+
+    table = np.empty(len(keys), dtype=STAKE_DTYPE)
+    table["round"] = roulette["round"][keys // len(BET_KEYS)]
+    table["bet"] = keys % len(BET_KEYS)
+    table["winner"] = roulette["code"][keys // len(BET_KEYS)]
+    table["amount"] = amounts
+    return table
+
+
+def round_keys(records: np.ndarray) -> np.ndarray:
+    """Ключ (гра, раунд) одним числом: раунди різних ігор можуть мати однакові номери."""
+    return records["game"].astype(np.int64) << 32 | records["round"]
+
+
+def _round_positions(keys: np.ndarray, record_keys: np.ndarray):
+    """Індекс раунду (у keys) для кожного запису і чи знайдено такий раунд."""
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    position = np.searchsorted(sorted_keys, record_keys)
+    found = position < len(sorted_keys)
+    found[found] = sorted_keys[position[found]] == record_keys[found]
+    position[found] = order[position[found]]
+    return position, found
+
+
+class ColumnStore:
+    """Таблиця, що зберігається по колонках: кожна колонка - окремий .npy файл.
+
+    Колонки завантажуються з mmap_mode="r", тож звіт читає з диска лише
+    ті колонки, які використовує. Кожен день чи файл журналу можна
+    зберегти в окремий каталог і потім об'єднати через concat().
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+
+    @classmethod
+    def from_table(cls, table: np.ndarray) -> "ColumnStore":
+        return cls({name: table[name] for name in table.dtype.names})
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name, column in self.columns.items():
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(column))
+
+    @classmethod
+    def load(cls, directory: str, dtype: np.dtype) -> "ColumnStore":
+        return cls({name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in dtype.names})
+
+    @classmethod
+    def concat(cls, stores: Iterable["ColumnStore"]) -> "ColumnStore":
+        stores = list(stores)
+        return cls({name: np.concatenate([store[name] for store in stores]) for name in stores[0].columns})
+
+
+def streaks(net: np.ndarray) -> Dict[str, float]:
+    """Серії виграшів і програшів підряд (нічия перериває серію)."""
+    if not len(net):
+        return {"longest_win": 0, "longest_loss": 0, "mean_win": 0.0, "mean_loss": 0.0}
+    sign = np.sign(net)
+    starts = np.r_[0, np.flatnonzero(np.diff(sign)) + 1]
+    lengths = np.diff(np.r_[starts, len(sign)])
+    wins, losses = lengths[sign[starts] > 0], lengths[sign[starts] < 0]
+    return {
+        "longest_win": int(wins.max()) if len(wins) else 0,
+        "longest_loss": int(losses.max()) if len(losses) else 0,
+        "mean_win": float(wins.mean()) if len(wins) else 0.0,
+        "mean_loss": float(losses.mean()) if len(losses) else 0.0,
+    }
+
+
+def game_report(rounds: ColumnStore, game: int) -> Dict[str, object]:
+    """RTP, дисперсія і серії для однієї гри."""
+    mask = rounds["game"] == game
+    wagered = rounds["wagered"][mask].astype(np.float64)
+    payout = rounds["payout"][mask].astype(np.float64)
+    net = payout - wagered
+    played = wagered > 0
+    per_unit = net[played] / wagered[played]
+    report = {
+        "rounds": int(mask.sum()),
+        "wagered": float(wagered.sum()),
+        "paid": float(payout.sum()),
+        "rtp": float(payout.sum() / wagered.sum()) if wagered.sum() else 0.0,
+        "mean_net": float(net.mean()) if len(net) else 0.0,
+        "variance": float(net.var()) if len(net) else 0.0,
+        "variance_per_unit": float(per_unit.var()) if len(per_unit) else 0.0,
+        "streaks": streaks(net),
+    }
+    if game == BLACKJACK:
+        counts = np.bincount(rounds["code"][mask], minlength=len(OUTCOMES))
+        report["outcomes"] = {outcome: int(n) for outcome, n in zip(OUTCOMES, counts)}
+        report["blackjack_rate"] = float(counts[OUTCOMES.index(BLACKJACK_OUTCOME)] / max(len(net), 1))
+    return report
+
+
+def bet_report(stakes: ColumnStore, by_category: bool = True) -> Dict[str, Dict[str, float]]:
+    """Частота виграшу і RTP для кожного виду ставки рулетки (або кожного поля окремо)."""
+    bet = stakes["bet"].astype(np.int64)
+    winner = stakes["winner"].astype(np.int64)
+    amount = stakes["amount"].astype(np.float64)
+    hits = (BET_MASKS[bet] >> winner) & 1
+    returned = amount * PAYOUT_MATRIX[bet, winner]
+
+    groups = BET_CATEGORY_INDEX[bet] if by_category else bet
+    names: List[str] = BET_CATEGORIES if by_category else list(BET_KEYS)
+    size = len(names)
+    count = np.bincount(groups, minlength=size)
+    hit_count = np.bincount(groups, weights=hits, minlength=size)
+    staked = np.bincount(groups, weights=amount, minlength=size)
+    paid = np.bincount(groups, weights=returned, minlength=size)
+    return {
+        names[i]: {
+            "bets": int(count[i]),
+            "hit_rate": float(hit_count[i] / count[i]),
+            "staked": float(staked[i]),
+            "rtp": float(paid[i] / staked[i]),
+        }
+        for i in np.flatnonzero(count)
+    }
+
+
+def report(rounds: ColumnStore, stakes: Optional[ColumnStore] = None) -> Dict[str, object]:
+    result: Dict[str, object] = {name: game_report(rounds, game) for game, name in GAME_NAMES.items()}
+    if stakes is not None and len(stakes):
+        result["roulette_bets"] = bet_report(stakes)
+    return result
+
+
+def load_events(path: str):
+    """Таблиці раундів і ставок з одного файлу журналу подій."""
+    records = EventLogReader(path).records
+    rounds = build_rounds(records)
+    return ColumnStore.from_table(rounds), ColumnStore.from_table(build_stakes(records, rounds))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Аналітика історії ігор")
+    parser.add_argument("logs", nargs="*", help="файли журналу подій (за замовчуванням events.bin)")
+    parser.add_argument("--columns", nargs="*", default=[],
+                        help="каталоги, збережені раніше через --save (rounds/ і stakes/ всередині)")
+    parser.add_argument("--save", help="зберегти таблиці по колонках у цей каталог")
+    args = parser.parse_args()
+    if not args.logs and not args.columns:
+        args.logs = ["events.bin"]
+
+    started = time.perf_counter()
+    round_parts, stake_parts = [], []
+    for path in args.logs:
+        rounds, stakes = load_events(path)
+        round_parts.append(rounds)
+        stake_parts.append(stakes)
+    for directory in args.columns:
+        round_parts.append(ColumnStore.load(os.path.join(directory, "rounds"), ROUND_DTYPE))
+        stake_parts.append(ColumnStore.load(os.path.join(directory, "stakes"), STAKE_DTYPE))
+    rounds, stakes = ColumnStore.concat(round_parts), ColumnStore.concat(stake_parts)
+    if args.save:
+        rounds.save(os.path.join(args.save, "rounds"))
+        stakes.save(os.path.join(args.save, "stakes"))
+
+    result = report(rounds, stakes)
+    for game in GAME_NAMES.values():
+        data = result[game]
+        if not data["rounds"]:
+            continue
+        print(f"{game}: {data['rounds']} раундів, RTP {data['rtp'] * 100:.2f}%, "
+              f"дисперсія на одиницю ставки {data['variance_per_unit']:.3f}")
+        print(f"  Найдовші серії: виграші {data['streaks']['longest_win']}, "
+              f"програші {data['streaks']['longest_loss']}")
+        if "outcomes" in data:
+            print("  " + ", ".join(f"{outcome}: {n}" for outcome, n in data["outcomes"].items()))
+    for category, data in result.get("roulette_bets", {}).items():
+        print(f"  {category:>8}: {data['bets']} ставок, виграш {data['hit_rate']:.4f}, RTP {data['rtp'] * 100:.2f}%")
+    print(f"Звіт за {time.perf_counter() - started:.2f} с")
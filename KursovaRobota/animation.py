@@ -0,0 +1,118 @@
+import math
+import time
+from tkinter import TclError
+from typing import Callable, Dict, Optional
+
+
+SLOT_EPSILON = 1e-6         # похибка float на межі кадрів сітки
+DEFAULT_FPS = 50           # 20 мс на кадр, як у початковій анімації колеса
+BACKGROUND_FPS = 4         # коли полотно не видно (інша вкладка, згорнуте вікно)
+
+# Крок анімації: отримує секунди від її початку, малює відповідний стан
+# і повертає False, коли анімація завершилась
+FrameCallback = Callable[[float], bool]
+
+
+class AnimationScheduler:
+    """Спільний цикл кадрів для анімацій одного віджета на основі часу.
+
+    Кожна анімація отримує реальний час від свого початку, а не номер кадру,
+    тому на перевантаженій машині вона триває стільки ж, лише з меншою
+    кількістю кадрів. Наступний кадр планується на наступну межу сітки
+    1/fps від початку циклу: якщо кадр запізнився або малювався довше за
+    бюджет, пропущені кадри не наздоганяються, а відкидаються (dropped_frames).
+    Поки анімацій немає, цикл зупинений і процесор не використовується;
+    поки віджет не видно, кадри йдуть з частотою background_fps.
+    """
+
+    def __init__(self, widget, fps: float = DEFAULT_FPS, background_fps: float = BACKGROUND_FPS,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.widget = widget
+        self.frame_time = 1 / fps
+        self.background_frame_time = 1 / background_fps
+        self.clock = clock
+        self.animations: Dict[int, list] = {}  # номер -> [час початку, callback, on_done]
+        self.frames = 0
+        self.dropped_frames = 0
+        self._next_id = 0
+        self._after_id = None
+        self._origin = 0.0
+        self._last_slot = 0
+        self._background = False
+
+    @property
+    def running(self) -> bool:
+        return bool(self.animations)
+
+    def start(self, callback: FrameCallback, on_done: Optional[Callable[[], None]] = None) -> int:
+        """Запустити анімацію; перший кадр (час 0) малюється одразу. Повертає номер для cancel()."""
+        animation_id = self._next_id
+        self._next_id += 1
+        now = self.clock()
+        self.animations[animation_id] = [now, callback, on_done]
+        if not callback(0.0):
+            self._finish(animation_id)
+            return animation_id
+        if self._after_id is None:
+            self._origin, self._last_slot = now, 0
+            self._schedule(now)
+        return animation_id
+
+    def cancel(self, animation_id: int) -> bool:
+        """Зупинити анімацію без виклику on_done. False, якщо вона вже завершилась."""
+        if self.animations.pop(animation_id, None) is None:
+            return False
+        if not self.animations:
+            self._stop()
+        return True
+
+    def finish(self, animation_id: int) -> None:
+        """Завершити анімацію достроково, викликавши on_done."""
+        if animation_id in self.animations:
+            self._finish(animation_id)
+
+    def cancel_all(self) -> None:
+        self.animations.clear()
+        self._stop()
+
+    def _tick(self) -> None:
+        self._after_id = None
+        now = self.clock()
+        slot = int((now - self._origin) / self.frame_time + SLOT_EPSILON)
+        if not self._background:
+            self.dropped_frames += max(slot - self._last_slot - 1, 0)
+        self._last_slot = slot
+        self.frames += 1
+        for animation_id, (started, callback, _) in list(self.animations.items()):
+            # Анімацію могли скасувати з callback-а іншої анімації
+            if animation_id in self.animations and not callback(now - started):
+                self._finish(animation_id)
+        if self.animations:
+            self._schedule(self.clock())
+
+    def _schedule(self, now: float) -> None:
+        self._background = not self._visible()
+        frame_time = self.background_frame_time if self._background else self.frame_time
+        # Наступна межа сітки кадрів після now: запізнення не накопичується
+        elapsed = now - self._origin
+        next_frame = (int(elapsed / frame_time + SLOT_EPSILON) + 1) * frame_time
+        delay_ms = max(math.ceil((next_frame - elapsed) * 1000), 1)
+        self._after_id = self.widget.after(delay_ms, self._tick)
+
+    def _visible(self) -> bool:
+        try:
+            return bool(self.widget.winfo_viewable())
+        except TclError:
+            return True
+
+    def _finish(self, animation_id: int) -> None:
+        _, _, on_done = self.animations.pop(animation_id)
+        if not self.animations:
+            self._stop()
+        if on_done is not None:
+            on_done()
+
+    def _stop(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
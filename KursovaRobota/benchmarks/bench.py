@@ -0,0 +1,317 @@
+"""Бенчмарки ігрових рушіїв і малювання.
+
+Запуск з каталогу KursovaRobota:
+    python benchmarks/bench.py                      # порівняти з baseline.json
+    python benchmarks/bench.py --update-baseline    # записати нові базові значення
+    python benchmarks/bench.py --xvfb               # запустити GUI-бенчмарки у віртуальному X-дисплеї
+
+Результати друкуються як JSON. Код виходу 1, якщо хоч один бенчмарк
+повільніший за базове значення більше ніж на --threshold і водночас більше
+ніж на NOISE_FLOOR_NS (для операцій у сотні наносекунд відносний шум
+більший за поріг).
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+GAME_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, GAME_DIR)
+
+from game_models import Shoe, Card, Hand
+from blackjack_engine import settle
+from image_cache import CardImageCache
+from card_atlas import ATLAS_PATH, CardAtlas
+import roulette_engine
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+NOISE_FLOOR_NS = 150.0
+MIN_SAMPLE_TIME = 0.001  # кожен замір - щонайменше 1 мс циклу, щоб таймер і шум не домінували
+DEFAULT_REPEATS = 15
+DEFAULT_CONFIRM = 2      # скільки разів перезапустити бенчмарк, що виглядає як регресія
+BASELINE_RUNS = 5        # базове значення - медіана кількох повних запусків, а не один вдалий
+
+BENCHMARKS: Dict[str, Callable[[], Callable[[], None]]] = {}
+GUI_BENCHMARKS = set()
+
+
+class SkipBenchmark(Exception):
+    """Бенчмарк не можна запустити в цьому середовищі (причина - текст винятку)."""
+
+
+def benchmark(name: str, gui: bool = False):
+    """Зареєструвати фабрику бенчмарку: вона готує дані і повертає функцію одного виміру."""
+    def register(factory):
+        BENCHMARKS[name] = factory
+        if gui:
+            GUI_BENCHMARKS.add(name)
+        return factory
+    return register
+
+
+def measure(operation: Callable[[], None], min_time: float = 0.2, repeats: int = DEFAULT_REPEATS) -> float:
+    """Медіанний час однієї операції в наносекундах.
+
+    Кількість викликів у замірі подвоюється, поки замір не триватиме
+    щонайменше max(MIN_SAMPLE_TIME, min_time / repeats); медіана repeats
+    замірів стійкіша до поодиноких пауз, ніж одиничний чи найкращий замір.
+    """
+    sample_time = max(MIN_SAMPLE_TIME, min_time / repeats)
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - started
+        if elapsed >= sample_time:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        samples.append((time.perf_counter() - started) / number)
+    return statistics.median(samples) * 1e9
+
+
+@benchmark("shoe_reset_6_decks")
+def bench_shoe_reset():
+    shoe = Shoe(6, seed=1)
+    return shoe.reset
+
+
+@benchmark("shoe_deal_card")
+def bench_deal_card():
+    shoe = Shoe(8, seed=1)
+    return shoe.deal_card
+
+
+@benchmark("hand_add_card")
+def bench_hand_add_card():
+    hand = Hand()
+    cards = [Card("ace", "hearts"), Card("6", "clubs"), Card("ace", "spades"), Card("king", "hearts")]
+
+    def run():
+        hand.clear()
+        for card in cards:
+            hand.add_card(card)
+    return run
+
+
+@benchmark("determine_winner")
+def bench_determine_winner():
+    player, dealer = Hand(), Hand()
+    for card in (Card("10", "hearts"), Card("9", "clubs")):
+        player.add_card(card)
+    for card in (Card("queen", "spades"), Card("7", "diamonds")):
+        dealer.add_card(card)
+    return lambda: settle(player, dealer, 100)
+
+
+@benchmark("calculate_winnings_all_bets")
+def bench_calculate_winnings():
+    bets = {bet_key: 10 for bet_key in roulette_engine.BET_KEYS}
+    return lambda: roulette_engine.settle(bets, 17)
+
+
+@benchmark("settle_many_10000_players")
+def bench_settle_many():
+    bets = {"red": 10, "number_17": 5, "dozen_2": 25, "split_17_20": 10}
+    slips = roulette_engine.slips_matrix([bets] * 10000)
+    return lambda: roulette_engine.settle_many(slips, 17)
+
+
+@benchmark("card_image_decode")
+def bench_image_decode():
+    # Окремий екземпляр без атласу: завжди вимірюється декодування PNG і LANCZOS
+    cache = object.__new__(CardImageCache)
+    cache._initialize(max_entries=128, atlas_path=None)
+    cache.atlas = None
+    return lambda: cache._decode("queen", "hearts", 80, 120)
+
+
+@benchmark("card_atlas_decode")
+def bench_atlas_decode():
+    if not os.path.exists(ATLAS_PATH):
+        raise SkipBenchmark("атлас не зібрано (python card_atlas.py)")
+    atlas = CardAtlas(ATLAS_PATH)
+    return lambda: atlas.image("queen", "hearts", 80, 120)
+
+
+@benchmark("card_get_image_cached", gui=True)
+def bench_get_image():
+    _tk_root()
+    card = Card("queen", "hearts")
+    card.get_image(80, 120)
+    return lambda: card.get_image(80, 120)
+
+
+def _draw_wheel_factory(render_mode: str):
+    def factory():
+        import tkinter as tk
+        game_module = importlib.import_module("123")
+        root = _tk_root()
+        frame = tk.Frame(root)
+        frame.pack()
+        game = game_module.RouletteGame(frame, game_module.Player("Бенчмарк"), render_mode=render_mode)
+        game.set_state(game_module.SpinningState())
+
+        def frame_step():
+            game.angle += 0.15
+            game.ball_angle += 0.2
+            game.draw_wheel()
+            root.update_idletasks()
+        return frame_step
+    return factory
+
+
+benchmark("draw_wheel_frame_canvas", gui=True)(_draw_wheel_factory("canvas"))
+benchmark("draw_wheel_frame_bitmap", gui=True)(_draw_wheel_factory("bitmap"))
+
+_root = None
+
+
+def _tk_root():
+    global _root
+    if _root is None:
+        import tkinter as tk
+        _root = tk.Tk()
+    return _root
+
+
+def start_xvfb() -> Optional[subprocess.Popen]:
+    """Запустити віртуальний X-дисплей, якщо його ще немає."""
+    if os.environ.get("DISPLAY") or not shutil.which("Xvfb"):
+        return None
+    display = ":99"
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return process
+
+
+def run(names, min_time: float) -> Dict[str, dict]:
+    results = {}
+    have_display = bool(os.environ.get("DISPLAY"))
+    for name in names:
+        if name in GUI_BENCHMARKS and not have_display:
+            results[name] = {"skipped": "немає X-дисплея (запустіть з --xvfb)"}
+            continue
+        try:
+            operation = BENCHMARKS[name]()
+        except SkipBenchmark as e:
+            results[name] = {"skipped": str(e)}
+            continue
+        ns = measure(operation, min_time)
+        results[name] = {"ns_per_op": round(ns, 1), "ops_per_sec": round(1e9 / ns, 1)}
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float,
+            noise_floor: float = NOISE_FLOOR_NS) -> Dict[str, dict]:
+    """Додати до результатів відношення до базових значень; повернути регресії."""
+    regressions = {}
+    for name, result in results.items():
+        base = baseline.get(name, {}).get("ns_per_op")
+        if base is None or "ns_per_op" not in result:
+            continue
+        ratio = result["ns_per_op"] / base
+        result["baseline_ns_per_op"] = base
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold and result["ns_per_op"] - base > noise_floor:
+            regressions[name] = result
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки KursovaRobota")
+    parser.add_argument("names", nargs="*", help="запустити лише ці бенчмарки")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="допустиме сповільнення відносно базового значення (0.25 = 25%%)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="мінімальний час виміру, с")
+    parser.add_argument("--noise-floor", type=float, default=NOISE_FLOOR_NS,
+                        help="сповільнення менше за цю кількість нс не вважається регресією")
+    parser.add_argument("--confirm", type=int, default=DEFAULT_CONFIRM,
+                        help="перезапусків бенчмарку, повільнішого за поріг, перш ніж вважати це регресією")
+    parser.add_argument("--xvfb", action="store_true", help="запустити Xvfb для GUI-бенчмарків")
+    parser.add_argument("--output", help="також записати JSON у файл")
+    args = parser.parse_args()
+
+    # Відносні шляхи до cards/ у грі рахуються від каталогу гри
+    os.chdir(GAME_DIR)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    xvfb = start_xvfb() if args.xvfb else None
+    try:
+        names = args.names or list(BENCHMARKS)
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            parser.error(f"невідомі бенчмарки: {', '.join(unknown)}")
+        results = run(names, args.min_time)
+        if args.update_baseline:
+            runs = [results] + [run(names, args.min_time) for _ in range(BASELINE_RUNS - 1)]
+            for name, result in results.items():
+                if "ns_per_op" in result:
+                    ns = statistics.median(r[name]["ns_per_op"] for r in runs)
+                    results[name] = {"ns_per_op": round(ns, 1), "ops_per_sec": round(1e9 / ns, 1)}
+        regressions = compare(results, baseline, args.threshold, args.noise_floor)
+        # Сповільнення може бути миттєвим навантаженням машини: регресія - лише якщо воно повторюється
+        for _ in range(0 if args.update_baseline else args.confirm):
+            if not regressions:
+                break
+            for name, result in run(sorted(regressions), args.min_time).items():
+                if result["ns_per_op"] < results[name]["ns_per_op"]:
+                    results[name] = result
+            regressions = compare(results, baseline, args.threshold, args.noise_floor)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "threshold": args.threshold,
+            "noise_floor_ns": args.noise_floor,
+            "confirm": args.confirm,
+        },
+        "results": results,
+        "regressions": sorted(regressions),
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    if args.update_baseline:
+        merged = dict(baseline)
+        merged.update({name: {"ns_per_op": result["ns_per_op"]}
+                       for name, result in results.items() if "ns_per_op" in result})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"meta": report["meta"], "results": merged}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game_models import Shoe, Card, Hand, Player
+from shuffler import ContinuousShoe
+from ledger import WIN as WIN_KIND, PUSH as PUSH_KIND
+
+
+# Назва гри для журналів фішок (Player.bet(..., game=GAME))
+GAME = "blackjack"
+
+# Правила столу (такі ж, як у BlackjackGame)
+DEALER_STAND_VALUE = 17
+BLACKJACK_PAYOUT = 2.5  # ставка повертається разом з виграшем 3:2
+
+# Дії гравця
+HIT = "hit"
+STAND = "stand"
+
+# Можливі результати раунду
+DEALER_BUST = "dealer_bust"
+PLAYER_BUST = "player_bust"
+BLACKJACK = "blackjack"
+WIN = "win"
+LOSE = "lose"
+PUSH = "push"
+OUTCOMES = (DEALER_BUST, PLAYER_BUST, BLACKJACK, WIN, LOSE, PUSH)
+WINNING_OUTCOMES = (DEALER_BUST, BLACKJACK, WIN)
+# Виплата (разом зі ставкою) для кожного результату в половинах ставки, щоб 3:2 лишалось цілим
+PAYOUT_HALVES = np.array([4, 0, int(BLACKJACK_PAYOUT * 2), 4, 0, 2], dtype=np.int64)
+
+MAX_SEATS = 7
+
+# Стратегія гравця: (рука гравця, відкрита карта дилера) -> HIT або STAND
+Policy = Callable[[Hand, Card], str]
+
+
+def is_blackjack(hand: Hand) -> bool:
+    """Перевірити, чи є в руці блекджек (21 з двох карт)."""
+    return hand.value == 21 and len(hand.cards) == 2
+
+
+def settle(player_hand: Hand, dealer_hand: Hand, bet: int) -> Tuple[str, int]:
+    """Визначити результат раунду і суму, яку потрібно повернути гравцю."""
+    player_value = player_hand.value
+    dealer_value = dealer_hand.value
+
+    if dealer_value > 21:
+        return DEALER_BUST, bet * 2
+    if player_value > 21:
+        return PLAYER_BUST, 0
+    if is_blackjack(player_hand):
+        return BLACKJACK, int(bet * BLACKJACK_PAYOUT)
+    if player_value > dealer_value:
+        return WIN, bet * 2
+    if dealer_value > player_value:
+        return LOSE, 0
+    return PUSH, bet
+
+
+def settle_seats(totals, card_counts, dealer_total, bets) -> Tuple[np.ndarray, np.ndarray]:
+    """Розрахувати всі місця за столом одним порівнянням масивів.
+
+    totals і card_counts - сума і кількість карт кожного місця, dealer_total -
+    сума дилера (число або масив, що транслюється, наприклад, стовпчик для
+    багатьох столів). Перевірки ті ж, що й у settle(), але перебір гравця
+    програє завжди, навіть якщо потім перебрав дилер. Повертає індекси
+    результатів в OUTCOMES і суми, які потрібно повернути гравцям.
+    """
+    totals = np.asarray(totals)
+    card_counts = np.asarray(card_counts)
+    dealer_total = np.asarray(dealer_total)
+    outcomes = np.select(
+        [totals > 21, dealer_total > 21, (totals == 21) & (card_counts == 2),
+         totals > dealer_total, dealer_total > totals],
+        [OUTCOMES.index(PLAYER_BUST), OUTCOMES.index(DEALER_BUST), OUTCOMES.index(BLACKJACK),
+         OUTCOMES.index(WIN), OUTCOMES.index(LOSE)],
+        default=OUTCOMES.index(PUSH),
+    )
+    payouts = np.asarray(bets, dtype=np.int64) * PAYOUT_HALVES[outcomes] // 2
+    return outcomes, payouts
+
+
+def draw_card(deck: Shoe, hand: Hand) -> Card:
+    """Взяти карту з черевика в руку."""
+    card_data = deck.deal_card()
+    card = Card(card_data[0], card_data[1])
+    hand.add_card(card)
+    return card
+
+
+def play_dealer(deck: Shoe, dealer_hand: Hand) -> List[Card]:
+    """Дилер бере карти, поки сума менша за 17. Повертає нові карти."""
+    drawn = []
+    while dealer_hand.value < DEALER_STAND_VALUE:
+        drawn.append(draw_card(deck, dealer_hand))
+    return drawn
+
+
+def round_record(deck: Shoe, shoe_state: Tuple[int, int, int], bet: int, actions: List[str]) -> dict:
+    """Запис раунду для replay_round(): черевик на момент першої роздачі, ставка і дії гравця."""
+    seed, shuffle_index, position = shoe_state
+    return {
+        "decks": deck.decks,
+        "penetration": deck.penetration,
+        "continuous": getattr(deck, "continuous", False),
+        "seed": seed,
+        "shuffle": shuffle_index,
+        "position": position,
+        "bet": bet,
+        "actions": list(actions),
+    }
+
+
+def stand_on_policy(stand_on: int = DEALER_STAND_VALUE) -> Policy:
+    """Брати карту, поки сума менша за stand_on."""
+    return lambda hand, upcard: HIT if hand.value < stand_on else STAND
+
+
+class BlackjackRound:
+    """Один раунд блекджеку без прив'язки до інтерфейсу."""
+
+    def __init__(self, player: Player, deck: Optional[Shoe] = None, dealer: Optional[Player] = None, events=None):
+        self.player = player
+        self.deck = deck if deck is not None else Shoe()
+        self.dealer = dealer if dealer is not None else Player("Дилер")
+        self.events = events  # необов'язковий event_log.EventLog
+        self.bet_amount = 0
+        self.finished = True
+        self.outcome: Optional[str] = None
+        self.payout = 0
+        self.shoe_state: Optional[Tuple[int, int, int]] = None
+        self.actions: List[str] = []
+
+    def start(self, bet: int) -> None:
+        """Прийняти ставку і роздати по дві карти гравцю та дилеру."""
+        if not self.finished:
+            raise RuntimeError("Раунд ще не завершено")
+
+        self.player.bet(bet, GAME)
+        self.bet_amount = bet
+        self.deck.shuffle_if_needed()
+        self.shoe_state = self.deck.state()
+        self.actions = []
+        self.player.hand.clear()
+        self.dealer.hand.clear()
+        self.finished = False
+        self.outcome = None
+        self.payout = 0
+
+        for _ in range(2):
+            draw_card(self.deck, self.player.hand)
+            draw_card(self.deck, self.dealer.hand)
+
+        # Блекджек одразу передає хід дилеру
+        if self.player.hand.value == 21:
+            self.stand()
+
+    def hit(self) -> Optional[Card]:
+        """Гравець бере ще одну карту."""
+        if self.finished:
+            return None
+
+        self.actions.append(HIT)
+        card = draw_card(self.deck, self.player.hand)
+        if self.player.hand.value > 21:
+            self._finish(PLAYER_BUST, 0)
+        return card
+
+    def stand(self) -> str:
+        """Гравець зупиняється, дилер добирає карти, раунд розраховується."""
+        if self.finished:
+            return self.outcome
+
+        self.actions.append(STAND)
+        play_dealer(self.deck, self.dealer.hand)
+        outcome, payout = settle(self.player.hand, self.dealer.hand, self.bet_amount)
+        self._finish(outcome, payout)
+        return outcome
+
+    def record(self) -> dict:
+        """Все, що потрібно, щоб відтворити раунд через replay_round()."""
+        return round_record(self.deck, self.shoe_state, self.bet_amount, self.actions)
+
+    def _finish(self, outcome: str, payout: int) -> None:
+        self.outcome = outcome
+        self.payout = payout
+        self.player.collect(payout, PUSH_KIND if outcome == PUSH else WIN_KIND, GAME)
+        if self.events is not None:
+            self.events.blackjack_settled(outcome, payout, self.player.chips)
+        self.finished = True
+
+
+class TableRound:
+    """Раунд за столом на кілька місць: спільний черевик і одна рука дилера.
+
+    Місця ходять по черзі (seat - місце, що зараз ходить). Дилер добирає
+    карти один раз після останнього місця, і лише якщо хоча б одне місце
+    не перебрало; потім усі місця розраховуються разом через settle_seats().
+    Місце зі ставкою 0 у раунді не грає.
+    """
+
+    def __init__(self, players: Sequence[Player], deck: Optional[Shoe] = None, dealer: Optional[Player] = None):
+        if not 1 <= len(players) <= MAX_SEATS:
+            raise ValueError(f"За столом може бути від 1 до {MAX_SEATS} місць")
+        self.players = list(players)
+        self.deck = deck if deck is not None else Shoe()
+        self.dealer = dealer if dealer is not None else Player("Дилер")
+        self.bets = np.zeros(len(self.players), dtype=np.int64)
+        self.payouts = np.zeros(len(self.players), dtype=np.int64)
+        self.outcomes: List[Optional[str]] = [None] * len(self.players)
+        self.seat: Optional[int] = None
+        self.finished = True
+
+    def start(self, bets: Sequence[int]) -> None:
+        """Прийняти ставки всіх місць і роздати карти по колу: місця, дилер, і ще раз."""
+        if not self.finished:
+            raise RuntimeError("Раунд ще не завершено")
+        if len(bets) != len(self.players):
+            raise ValueError("Потрібна ставка (або 0) для кожного місця")
+        if not any(bets):
+            raise ValueError("Потрібна хоча б одна ставка")
+        for player, bet in zip(self.players, bets):
+            if bet < 0 or bet > player.chips:
+                raise ValueError(f"Недостатньо фішок у гравця {player.name}")
+
+        for player, bet in zip(self.players, bets):
+            player.hand.clear()
+            if bet:
+                player.bet(bet, GAME)
+        self.bets[:] = bets
+        self.payouts[:] = 0
+        self.outcomes = [None] * len(self.players)
+        self.deck.shuffle_if_needed()
+        self.dealer.hand.clear()
+        self.finished = False
+
+        active = [player for player, bet in zip(self.players, bets) if bet]
+        for _ in range(2):
+            for player in active:
+                draw_card(self.deck, player.hand)
+            draw_card(self.deck, self.dealer.hand)
+        self.seat = -1
+        self._next_seat()
+
+    @property
+    def player(self) -> Optional[Player]:
+        """Гравець, що зараз ходить."""
+        return None if self.finished else self.players[self.seat]
+
+    def hit(self) -> Optional[Card]:
+        """Поточне місце бере карту; після перебору хід переходить далі."""
+        if self.finished:
+            return None
+        hand = self.players[self.seat].hand
+        card = draw_card(self.deck, hand)
+        if hand.value > 21:
+            self._next_seat()
+        return card
+
+    def stand(self) -> None:
+        if not self.finished:
+            self._next_seat()
+
+    def _next_seat(self) -> None:
+        """Передати хід наступному місцю зі ставкою (блекджек не ходить)."""
+        seat = self.seat + 1
+        while seat < len(self.players) and (not self.bets[seat] or self.players[seat].hand.value == 21):
+            seat += 1
+        self.seat = seat
+        if seat == len(self.players):
+            self._finish()
+
+    def _finish(self) -> None:
+        seated = np.flatnonzero(self.bets)
+        totals = np.array([self.players[i].hand.value for i in seated])
+        card_counts = np.array([len(self.players[i].hand.cards) for i in seated])
+        if (totals <= 21).any():
+            play_dealer(self.deck, self.dealer.hand)
+
+        outcomes, payouts = settle_seats(totals, card_counts, self.dealer.hand.value, self.bets[seated])
+        self.payouts[seated] = payouts
+        for i, outcome, payout in zip(seated, outcomes, payouts):
+            self.outcomes[i] = OUTCOMES[outcome]
+            self.players[i].collect(int(payout), PUSH_KIND if OUTCOMES[outcome] == PUSH else WIN_KIND, GAME)
+        self.seat = None
+        self.finished = True
+
+
+class RoundStats:
+    """Підсумки серії раундів."""
+
+    def __init__(self):
+        self.rounds = 0
+        self.wagered = 0
+        self.net = 0
+        self.outcomes: Dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+
+    def add(self, game_round: BlackjackRound) -> None:
+        self.rounds += 1
+        self.wagered += game_round.bet_amount
+        self.net += game_round.payout - game_round.bet_amount
+        self.outcomes[game_round.outcome] += 1
+
+    @property
+    def win_rate(self) -> float:
+        if not self.rounds:
+            return 0.0
+        return sum(self.outcomes[outcome] for outcome in WINNING_OUTCOMES) / self.rounds
+
+
+def play_round(game_round: BlackjackRound, bet: int, policy: Policy) -> str:
+    """Зіграти раунд від ставки до розрахунку за стратегією policy."""
+    game_round.start(bet)
+    upcard = game_round.dealer.hand.cards[1]  # cards[0] дилера закрита
+    while not game_round.finished:
+        if policy(game_round.player.hand, upcard) == HIT:
+            game_round.hit()
+        else:
+            game_round.stand()
+    return game_round.outcome
+
+
+def replay_round(record: dict) -> BlackjackRound:
+    """Відтворити раунд карта в карту із запису BlackjackRound.record()."""
+    if record.get("continuous"):
+        shoe = ContinuousShoe(record["decks"], record["seed"])
+    else:
+        shoe = Shoe(record["decks"], record["penetration"], record["seed"])
+    shoe.seek(record["shuffle"], record["position"])
+    player = Player("Повтор")
+    player.chips = record["bet"]
+    game_round = BlackjackRound(player, shoe)
+    game_round.start(record["bet"])
+    for action in record["actions"]:
+        if action == HIT:
+            game_round.hit()
+        else:
+            game_round.stand()
+    return game_round
@@ -0,0 +1,291 @@
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from game_models import CARD_VALUES, Shoe, Player
+from blackjack_engine import (DEALER_STAND_VALUE, BLACKJACK_PAYOUT, MAX_SEATS, PAYOUT_HALVES, BlackjackRound,
+                              settle_seats)
+from counting import CountTracker
+from rng import fresh_seed, numpy_generator
+
+
+# Максимальна кількість карт, яку може взяти одна рука (4 тузи, 4 двійки, 3 трійки ...)
+MAX_HAND_CARDS = 11
+
+
+def shoe_values(decks: int = 1) -> np.ndarray:
+    """Значення карт черевика в тому ж порядку, що й коди карт у Shoe."""
+    return np.tile(np.array(CARD_VALUES, dtype=np.int8), decks)
+
+
+@dataclass
+class SimulationResult:
+    hands: int
+    bet: int
+    mean_return: float       # середній чистий результат на одиницю ставки
+    std_return: float        # стандартне відхилення результату однієї руки
+    win_rate: float
+    push_rate: float
+    loss_rate: float
+    blackjack_rate: float
+    session_hands: int
+    session_mean: float      # середня зміна банкролу за сесію
+    session_std: float       # стандартне відхилення банкролу за сесію
+    elapsed: float
+
+    @property
+    def house_edge(self) -> float:
+        return -self.mean_return
+
+
+def _draw(values, rows, ptr, total, aces, mask) -> None:
+    """Векторно видати по карті всім рукам, для яких mask == True."""
+    drawn = np.where(mask, values[rows, ptr], 0)
+    ptr += mask
+    total += drawn
+    aces += drawn == 11
+    # Та ж обробка тузів, що й у Hand.add_card
+    while True:
+        soft = (total > 21) & (aces > 0)
+        if not soft.any():
+            break
+        total -= soft * 10
+        aces -= soft
+
+
+def play_batch(rng: np.random.Generator, n: int, stand_on: int = 17, decks: int = 1) -> np.ndarray:
+    """Зіграти n незалежних раундів (кожен зі свіжого черевика) і повернути
+    множник виплати для кожного (0, 1, 2 або 2.5)."""
+    values = rng.permuted(np.tile(shoe_values(decks), (n, 1)), axis=1)
+    rows = np.arange(n)
+    ptr = np.zeros(n, dtype=np.int64)
+    player_total = np.zeros(n, dtype=np.int16)
+    player_aces = np.zeros(n, dtype=np.int16)
+    player_cards = np.zeros(n, dtype=np.int16)
+    dealer_total = np.zeros(n, dtype=np.int16)
+    dealer_aces = np.zeros(n, dtype=np.int16)
+    everyone = np.ones(n, dtype=bool)
+
+    # Роздача як у BlackjackGame.deal_cards: гравець, дилер, гравець, дилер
+    for _ in range(2):
+        _draw(values, rows, ptr, player_total, player_aces, everyone)
+        _draw(values, rows, ptr, dealer_total, dealer_aces, everyone)
+    player_cards += 2
+    blackjack = player_total == 21
+
+    # Гравець бере карти, поки сума менша за stand_on
+    for _ in range(MAX_HAND_CARDS):
+        mask = player_total < stand_on
+        if not mask.any():
+            break
+        _draw(values, rows, ptr, player_total, player_aces, mask)
+        player_cards += mask
+
+    # Дилер грає лише проти рук без перебору
+    player_bust = player_total > 21
+    for _ in range(MAX_HAND_CARDS):
+        mask = (dealer_total < DEALER_STAND_VALUE) & ~player_bust
+        if not mask.any():
+            break
+        _draw(values, rows, ptr, dealer_total, dealer_aces, mask)
+
+    # Той самий порядок перевірок, що й у blackjack_engine.settle
+    dealer_bust = (dealer_total > 21) & ~player_bust
+    payout = np.select(
+        [player_bust, dealer_bust, blackjack & (player_cards == 2),
+         player_total > dealer_total, dealer_total > player_total],
+        [0.0, 2.0, BLACKJACK_PAYOUT, 2.0, 0.0],
+        default=1.0,
+    )
+    return payout
+
+
+def play_table_batch(rng: np.random.Generator, tables: int, seats: int, stand_on: int = 17,
+                     decks: int = 1) -> np.ndarray:
+    """Зіграти по раунду за tables столами на seats місць (кожен стіл - свіжий черевик).
+
+    Цикли йдуть лише по місцях і картах, а не по столах: кожен крок - одна
+    операція над масивом усіх столів. Дилер добирає один раз на стіл, а
+    розрахунок усіх місць - один виклик settle_seats. Повертає множники
+    виплати, масив (столи, місця).
+    """
+    if not 1 <= seats <= MAX_SEATS:
+        raise ValueError(f"За столом може бути від 1 до {MAX_SEATS} місць")
+    if (seats + 1) * MAX_HAND_CARDS > len(CARD_VALUES) * decks:
+        raise ValueError(f"Для {seats} місць потрібно більше колод у черевику")
+    values = rng.permuted(np.tile(shoe_values(decks), (tables, 1)), axis=1)
+    rows = np.arange(tables)
+    ptr = np.zeros(tables, dtype=np.int64)
+    totals = np.zeros((seats, tables), dtype=np.int16)   # місце - рядок, щоб totals[seat] був суцільним
+    aces = np.zeros((seats, tables), dtype=np.int16)
+    cards = np.zeros((seats, tables), dtype=np.int16)
+    dealer_total = np.zeros(tables, dtype=np.int16)
+    dealer_aces = np.zeros(tables, dtype=np.int16)
+    everyone = np.ones(tables, dtype=bool)
+
+    # Роздача по колу, як у TableRound.start: усі місця, дилер, і ще раз
+    for _ in range(2):
+        for seat in range(seats):
+            _draw(values, rows, ptr, totals[seat], aces[seat], everyone)
+        _draw(values, rows, ptr, dealer_total, dealer_aces, everyone)
+    cards += 2
+
+    for seat in range(seats):
+        for _ in range(MAX_HAND_CARDS):
+            mask = totals[seat] < stand_on
+            if not mask.any():
+                break
+            _draw(values, rows, ptr, totals[seat], aces[seat], mask)
+            cards[seat] += mask
+
+    # Дилер грає один раз, якщо за столом залишилась хоч одна рука без перебору
+    alive = (totals <= 21).any(axis=0)
+    for _ in range(MAX_HAND_CARDS):
+        mask = (dealer_total < DEALER_STAND_VALUE) & alive
+        if not mask.any():
+            break
+        _draw(values, rows, ptr, dealer_total, dealer_aces, mask)
+
+    outcomes, _ = settle_seats(totals.T, cards.T, dealer_total[:, None], 0)
+    return PAYOUT_HALVES[outcomes] / 2
+
+
+def simulate_table(rounds: int, seats: int = MAX_SEATS, stand_on: int = 17, seed: Optional[int] = None,
+                   chunk_size: int = 100_000, decks: int = 6) -> Tuple[np.ndarray, float]:
+    """Середній результат на одиницю ставки для кожного місця за rounds раундів і час."""
+    started = time.perf_counter()
+    rng = numpy_generator(seed if seed is not None else fresh_seed())
+    net = np.zeros(seats)
+    done = 0
+    while done < rounds:
+        n = min(chunk_size, rounds - done)
+        net += (play_table_batch(rng, n, seats, stand_on, decks) - 1.0).sum(axis=0)
+        done += n
+    return net / rounds, time.perf_counter() - started
+
+
+def simulate(hands: int, bet: int = 10, stand_on: int = 17, session_hands: int = 100,
+             seed: Optional[int] = None, chunk_size: int = 200_000, decks: int = 1) -> SimulationResult:
+    """Симуляція великої кількості рук блекджеку для оцінки переваги казино."""
+    started = time.perf_counter()
+    rng = numpy_generator(seed if seed is not None else fresh_seed())
+    net = np.empty(hands, dtype=np.float32)
+    done = 0
+    while done < hands:
+        n = min(chunk_size, hands - done)
+        net[done:done + n] = play_batch(rng, n, stand_on, decks) - 1.0
+        done += n
+
+    wins = np.count_nonzero(net > 0)
+    pushes = np.count_nonzero(net == 0)
+    blackjacks = np.count_nonzero(net == BLACKJACK_PAYOUT - 1.0)
+
+    sessions = hands // session_hands
+    if sessions:
+        session_totals = net[:sessions * session_hands].reshape(sessions, session_hands).sum(axis=1) * bet
+        session_mean = float(session_totals.mean())
+        session_std = float(session_totals.std())
+    else:
+        session_mean = session_std = 0.0
+
+    return SimulationResult(
+        hands=hands,
+        bet=bet,
+        mean_return=float(net.mean(dtype=np.float64)),
+        std_return=float(net.std(dtype=np.float64)),
+        win_rate=wins / hands,
+        push_rate=pushes / hands,
+        loss_rate=(hands - wins - pushes) / hands,
+        blackjack_rate=blackjacks / hands,
+        session_hands=session_hands,
+        session_mean=session_mean,
+        session_std=session_std,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+@dataclass
+class CountingResult:
+    hands: int
+    wagered: int
+    net: int
+    mean_bet: float
+    elapsed: float
+
+    @property
+    def player_edge(self) -> float:
+        """Результат гравця на одиницю поставлених фішок."""
+        return self.net / self.wagered if self.wagered else 0.0
+
+
+def simulate_counting(hands: int, decks: int = 6, penetration: float = 0.75, min_bet: int = 10,
+                      max_units: int = 8, stand_on: int = 17, seed: Optional[int] = None) -> CountingResult:
+    """Гра через справжній черевик з підрахунком Hi-Lo і ставками за істинним рахунком."""
+    started = time.perf_counter()
+    shoe = Shoe(decks, penetration, seed)
+    tracker = CountTracker(shoe)
+    player = Player("Бот")
+    game_round = BlackjackRound(player, shoe)
+    wagered = 0
+    player.chips = start_chips = 10 ** 12
+
+    for _ in range(hands):
+        shoe.shuffle_if_needed()
+        bet = min_bet * tracker.bet_units(max_units)
+        wagered += bet
+        game_round.start(bet)
+        while not game_round.finished and player.hand.value < stand_on:
+            game_round.hit()
+        game_round.stand()
+
+    return CountingResult(
+        hands=hands,
+        wagered=wagered,
+        net=player.chips - start_chips,
+        mean_bet=wagered / hands,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Монте-Карло симуляція блекджеку")
+    parser.add_argument("--hands", type=int, default=1_000_000)
+    parser.add_argument("--bet", type=int, default=10)
+    parser.add_argument("--stand-on", type=int, default=17)
+    parser.add_argument("--session", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--decks", type=int, default=None, help="колод у черевику (1, або 6 з --seats)")
+    parser.add_argument("--counting", action="store_true",
+                        help="грати через черевик з підрахунком Hi-Lo замість векторної симуляції")
+    parser.add_argument("--seats", type=int, default=None,
+                        help="столи на кілька місць зі спільним дилером (кількість раундів - --hands)")
+    args = parser.parse_args()
+
+    if args.decks is None:
+        # Як у simulate_table: столу на кілька місць однієї колоди не вистачає
+        args.decks = 6 if args.seats is not None else 1
+
+    if args.seats is not None:
+        if not 1 <= args.seats <= MAX_SEATS:
+            parser.error(f"--seats має бути від 1 до {MAX_SEATS}")
+        if (args.seats + 1) * MAX_HAND_CARDS > len(CARD_VALUES) * args.decks:
+            parser.error(f"для {args.seats} місць потрібно більше колод (--decks)")
+        seat_returns, elapsed = simulate_table(args.hands, args.seats, args.stand_on, args.seed, decks=args.decks)
+        print(f"Раундів: {args.hands} x {args.seats} місць за {elapsed:.2f} с "
+              f"({args.hands / elapsed:.0f} столів/с)")
+        print("Перевага казино за місцями: " + ", ".join(f"{-r * 100:.2f}%" for r in seat_returns))
+    elif args.counting:
+        counted = simulate_counting(args.hands, args.decks, min_bet=args.bet, stand_on=args.stand_on,
+                                    seed=args.seed)
+        print(f"Рук: {counted.hands} за {counted.elapsed:.2f} с, середня ставка {counted.mean_bet:.1f}")
+        print(f"Результат гравця: {counted.player_edge * 100:+.3f}% від поставленого")
+    else:
+        result = simulate(args.hands, args.bet, args.stand_on, args.session, args.seed, decks=args.decks)
+        print(f"Рук: {result.hands} за {result.elapsed:.2f} с")
+        print(f"Перевага казино: {result.house_edge * 100:.3f}%")
+        print(f"Виграші/нічиї/програші: {result.win_rate:.4f} / {result.push_rate:.4f} / {result.loss_rate:.4f}")
+        print(f"Блекджеки: {result.blackjack_rate:.4f}")
+        print(f"Банкрол за {result.session_hands} рук: {result.session_mean:+.1f} ± {result.session_std:.1f}")
@@ -0,0 +1,130 @@
+import argparse
+import os
+import struct
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from image_cache import CARDS_DIR, BACK_RANK, SUITS, RANKS, card_path
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+ATLAS_PATH = os.path.join(CARDS_DIR, "atlas.bin")
+ATLAS_MAGIC = b"KRCA"
+ATLAS_VERSION = 1
+ATLAS_HEADER = struct.Struct("<4sHHH")   # магія, версія, карт, розмірів
+SIZE_ENTRY = struct.Struct("<HHQ")       # ширина, висота, зсув пікселів від початку файлу
+ALIGNMENT = 64
+
+# Розміри за замовчуванням: стіл як зараз, більше вікно і HiDPI (x2)
+ATLAS_SIZES = ((80, 120), (120, 180), (160, 240))
+# Порядок карт в атласі: 52 карти як у Shoe (масть * 13 + ранг), потім зворот
+ATLAS_KEYS: List[Tuple[str, str]] = [(rank, suit) for suit in SUITS for rank in RANKS] + [(BACK_RANK, "")]
+
+
+def build_atlas(path: str = ATLAS_PATH, sizes: Sequence[Tuple[int, int]] = ATLAS_SIZES) -> int:
+    """Зібрати всі карти в один файл із заздалегідь зменшеними RGBA-пікселями.
+
+    Для кожного розміру карти лежать суцільним блоком (карт x висота x
+    ширина x 4), тому CardAtlas вирізає карту зрізом mmap без копіювання.
+    Відсутні зображення - помилка збірки, а не заміна зворотом під час гри.
+    Повертає розмір файлу в байтах.
+    """
+    from PIL import Image
+
+    missing = [card_path(rank, suit) for rank, suit in ATLAS_KEYS if not os.path.exists(card_path(rank, suit))]
+    if missing:
+        raise FileNotFoundError("Немає зображень карт: " + ", ".join(missing))
+
+    sources = []
+    for rank, suit in ATLAS_KEYS:
+        with Image.open(card_path(rank, suit)) as source:
+            sources.append(source.convert("RGBA"))
+
+    offset = _align(ATLAS_HEADER.size + SIZE_ENTRY.size * len(sizes))
+    entries, blocks = [], []
+    for width, height in sizes:
+        block = np.empty((len(ATLAS_KEYS), height, width, 4), dtype=np.uint8)
+        for i, source in enumerate(sources):
+            block[i] = np.asarray(source.resize((width, height), Image.LANCZOS))
+        entries.append(SIZE_ENTRY.pack(width, height, offset))
+        blocks.append((offset, block))
+        offset = _align(offset + block.nbytes)
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(ATLAS_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, len(ATLAS_KEYS), len(sizes)))
+        f.write(b"".join(entries))
+        for block_offset, block in blocks:
+            f.write(b"\0" * (block_offset - f.tell()))
+            f.write(block.tobytes())
+    os.replace(temp_path, path)
+    return os.path.getsize(path)
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class CardAtlas:
+    """Атлас карт, відображений у пам'ять.
+
+    Відкриття лише читає заголовок; пікселі потрапляють у пам'ять з диска
+    сторінками, коли карту вперше показують. Для розміру, якого в атласі
+    немає, береться найближчий більший варіант і зменшується (без файлів
+    PNG).
+    """
+
+    def __init__(self, path: str = ATLAS_PATH):
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, count, size_count = ATLAS_HEADER.unpack_from(data)
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION or count != len(ATLAS_KEYS):
+            raise ValueError(f"Файл {path} не є атласом карт версії {ATLAS_VERSION}")
+        self.variants: Dict[Tuple[int, int], np.ndarray] = {}
+        for i in range(size_count):
+            width, height, offset = SIZE_ENTRY.unpack_from(data, ATLAS_HEADER.size + i * SIZE_ENTRY.size)
+            block = data[offset:offset + count * height * width * 4]
+            self.variants[(width, height)] = block.reshape(count, height, width, 4)
+        self.index = {key: i for i, key in enumerate(ATLAS_KEYS)}
+
+    @property
+    def sizes(self) -> List[Tuple[int, int]]:
+        return sorted(self.variants)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.index
+
+    def pixels(self, rank: str, suit: str, width: int, height: int) -> Optional[np.ndarray]:
+        """RGBA-пікселі карти (вид на mmap) або None, якщо такого розміру в атласі немає."""
+        block = self.variants.get((width, height))
+        return None if block is None else block[self.index[(rank, suit)]]
+
+    def image(self, rank: str, suit: str, width: int, height: int) -> "Image.Image":
+        """PIL-зображення карти потрібного розміру."""
+        from PIL import Image
+
+        pixels = self.pixels(rank, suit, width, height)
+        if pixels is not None:
+            return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+        larger = [size for size in self.sizes if size[0] >= width and size[1] >= height]
+        source_size = min(larger) if larger else max(self.sizes)
+        source = self.image(rank, suit, *source_size)
+        return source.resize((width, height), Image.LANCZOS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Збірка атласу зображень карт")
+    parser.add_argument("--output", default=ATLAS_PATH)
+    parser.add_argument("--sizes", nargs="+", default=[f"{w}x{h}" for w, h in ATLAS_SIZES],
+                        help="розміри карт ШИРИНАxВИСОТА")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    atlas_sizes = [tuple(int(n) for n in size.split("x")) for size in args.sizes]
+    nbytes = build_atlas(args.output, atlas_sizes)
+    print(f"Атлас {len(ATLAS_KEYS)} карт x {len(atlas_sizes)} розмірів зібрано за "
+          f"{time.perf_counter() - started:.1f} с: {args.output} ({nbytes / 2 ** 20:.1f} МБ)")
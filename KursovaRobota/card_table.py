@@ -0,0 +1,76 @@
+from tkinter import Canvas
+from typing import List, Optional
+
+
+# Стільки місць ряд має одразу; з кількох колод рука буває довшою, тоді ряд розширюється
+MAX_CARDS = 11
+CARD_GAP = 4
+
+
+class CardRow:
+    """Ряд карт на одному Canvas із пулом місць, що використовуються повторно.
+
+    Елементи Canvas для кожного місця створюються один раз, при першій
+    карті на цьому місці. Роздача, відкриття закритої карти і очищення
+    лише змінюють зображення, ховають елементи і зсувають їх, тому за
+    раунд не створюється і не знищується жоден віджет. Якщо карт більше,
+    ніж max_cards, пул і ширина Canvas збільшуються.
+    """
+
+    def __init__(self, parent, card_width: int, card_height: int, bg: str, max_cards: int = MAX_CARDS):
+        self.card_width = card_width
+        self.card_height = card_height
+        self.max_cards = max_cards
+        self.width = max_cards * (card_width + CARD_GAP)
+        self.canvas = Canvas(parent, width=self.width, height=card_height, bg=bg, highlightthickness=0)
+        self.images: List[int] = []     # елемент-зображення для кожного місця
+        self.texts: List[int] = []      # текст замість зображення, якщо його не вдалося завантажити
+        self.photos: List[Optional[object]] = []  # посилання, щоб PhotoImage не зібрав збирач сміття
+        self.count = 0
+
+    def pack(self, **kwargs) -> None:
+        self.canvas.pack(**kwargs)
+
+    def add(self, photo=None, text: str = "") -> int:
+        """Показати карту на наступному вільному місці; повертає номер місця."""
+        index = self.count
+        if index >= self.max_cards:
+            self.max_cards = index + 1
+            self.width = self.max_cards * (self.card_width + CARD_GAP)
+            self.canvas.config(width=self.width)
+        if index == len(self.images):
+            self.images.append(self.canvas.create_image(0, 0, anchor="nw", state="hidden"))
+            self.texts.append(self.canvas.create_text(0, 0, width=self.card_width, fill="white",
+                                                      state="hidden"))
+            self.photos.append(None)
+        self.count += 1
+        self.set(index, photo, text)
+        self._layout()
+        return index
+
+    def set(self, index: int, photo=None, text: str = "") -> None:
+        """Замінити карту на місці index (наприклад, відкрити закриту карту дилера)."""
+        self.photos[index] = photo
+        if photo is not None:
+            self.canvas.itemconfig(self.images[index], image=photo, state="normal")
+            self.canvas.itemconfig(self.texts[index], state="hidden")
+        else:
+            self.canvas.itemconfig(self.images[index], state="hidden")
+            self.canvas.itemconfig(self.texts[index], text=text, state="normal")
+
+    def clear(self) -> None:
+        """Сховати всі карти; елементи залишаються для наступного раунду."""
+        for index in range(self.count):
+            self.canvas.itemconfig(self.images[index], state="hidden")
+            self.canvas.itemconfig(self.texts[index], state="hidden")
+            self.photos[index] = None
+        self.count = 0
+
+    def _layout(self) -> None:
+        """Розставити показані карти по центру ряду, як раніше це робив pack."""
+        step = self.card_width + CARD_GAP
+        left = (self.width - self.count * step) // 2 + CARD_GAP // 2
+        for index in range(self.count):
+            x = left + index * step
+            self.canvas.coords(self.images[index], x, 0)
+            self.canvas.coords(self.texts[index], x + self.card_width / 2, self.card_height / 2)
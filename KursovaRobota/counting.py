@@ -0,0 +1,60 @@
+from typing import Dict, List
+
+from game_models import CARD_VALUES, CARDS_PER_DECK, RANKS, Shoe
+
+
+# Система Hi-Lo: ваги за значенням карти (туз = 11)
+HI_LO = {2: 1, 3: 1, 4: 1, 5: 1, 6: 1, 7: 0, 8: 0, 9: 0, 10: -1, 11: -1}
+
+
+class CountTracker:
+    """Потоковий підрахунок карт для одного черевика.
+
+    Підписується на Shoe і оновлює всі значення за O(1) на кожну карту,
+    не переглядаючи Shoe.cards.
+    """
+
+    def __init__(self, shoe: Shoe, system: Dict[int, int] = HI_LO):
+        self.decks = shoe.decks
+        # Вага для кожного коду карти 0..51, щоб не шукати значення під час роздачі
+        self.tags = [system[value] for value in CARD_VALUES]
+        self.running_count = 0
+        self.cards_seen = 0
+        self.cards_left = 0
+        self.rank_counts: List[int] = []
+        shoe.add_observer(self)
+
+    def shoe_shuffled(self, shoe: Shoe) -> None:
+        self.running_count = 0
+        self.cards_seen = 0
+        self.cards_left = shoe.remaining()
+        self.rank_counts = [self.decks * 4] * len(RANKS)
+
+    def card_dealt(self, code: int) -> None:
+        self.running_count += self.tags[code]
+        self.rank_counts[code % len(RANKS)] -= 1
+        self.cards_seen += 1
+        self.cards_left -= 1
+
+    @property
+    def decks_left(self) -> float:
+        return self.cards_left / CARDS_PER_DECK
+
+    @property
+    def true_count(self) -> float:
+        """Поточний рахунок, поділений на кількість колод, що залишились."""
+        if self.cards_left <= 0:
+            return 0.0
+        return self.running_count / self.decks_left
+
+    def remaining_ranks(self) -> Dict[str, int]:
+        """Скільки карт кожного рангу ще в черевику."""
+        return dict(zip(RANKS, self.rank_counts))
+
+    def bet_units(self, max_units: int = 8) -> int:
+        """Розмір ставки в одиницях: одна одиниця, поки істинний рахунок не вище +1."""
+        return max(1, min(max_units, int(self.true_count)))
+
+    def advantage(self) -> bool:
+        """Чи на боці гравця перевага (істинний рахунок +2 і вище)."""
+        return self.true_count >= 2
@@ -0,0 +1,127 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from game_models import CARD_VALUES, VALUES, Shoe
+from blackjack_engine import DEALER_STAND_VALUE
+
+
+# Значення карт 2..11 (туз = 11) і їх індекси в кортежі складу черевика
+CARD_POINTS = tuple(range(2, 12))
+POINT_INDEX = {points: i for i, points in enumerate(CARD_POINTS)}
+
+# Фінальні суми дилера в порядку кортежу результатів; останній елемент - перебір
+FINAL_TOTALS = tuple(range(DEALER_STAND_VALUE, 22))
+BUST = "bust"
+OUTCOME_KEYS = FINAL_TOTALS + (BUST,)
+BUST_INDEX = len(FINAL_TOTALS)
+
+CACHE_SIZE = 1 << 20
+
+
+def shoe_composition(decks: int) -> Tuple[int, ...]:
+    """Склад повного черевика: кількість карт кожного значення 2..11."""
+    counts = [0] * len(CARD_POINTS)
+    for value in CARD_VALUES:
+        counts[POINT_INDEX[value]] += decks
+    return tuple(counts)
+
+
+def add_points(total: int, soft: bool, points: int) -> Tuple[int, bool]:
+    """Додати карту до суми так само, як Hand.add_card рахує тузи."""
+    total += points
+    aces = int(soft) + (points == 11)
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces > 0
+
+
+def remove_card(counts: Tuple[int, ...], index: int) -> Tuple[int, ...]:
+    """Склад черевика без однієї карти з індексом index."""
+    return counts[:index] + (counts[index] - 1,) + counts[index + 1:]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _outcomes(total: int, soft: bool, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    if total > 21:
+        result = [0.0] * len(OUTCOME_KEYS)
+        result[BUST_INDEX] = 1.0
+        return tuple(result)
+    if total >= DEALER_STAND_VALUE:
+        result = [0.0] * len(OUTCOME_KEYS)
+        result[total - DEALER_STAND_VALUE] = 1.0
+        return tuple(result)
+
+    remaining = sum(counts)
+    result = [0.0] * len(OUTCOME_KEYS)
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        p = count / remaining
+        new_total, new_soft = add_points(total, soft, CARD_POINTS[index])
+        for i, q in enumerate(_outcomes(new_total, new_soft, remove_card(counts, index))):
+            result[i] += p * q
+    return tuple(result)
+
+
+def dealer_outcomes(upcard: int, counts: Tuple[int, ...]) -> Tuple[float, ...]:
+    """Точні ймовірності фінальної суми дилера (17..21, потім перебір).
+
+    upcard - значення відкритої карти (туз = 11), counts - склад черевика
+    без неї. Закрита карта дилера вважається невідомою і береться з counts.
+    """
+    return _outcomes(upcard, upcard == 11, counts)
+
+
+def dealer_distribution(upcard: int, counts: Tuple[int, ...]) -> Dict[object, float]:
+    """Те саме, що dealer_outcomes, але словником {17: p, ..., 21: p, "bust": p}."""
+    return dict(zip(OUTCOME_KEYS, dealer_outcomes(upcard, counts)))
+
+
+def clear_cache() -> None:
+    """Звільнити пам'ять кешу рекурсії."""
+    _outcomes.cache_clear()
+
+
+class DealerOdds:
+    """Точний калькулятор шансів дилера, що стежить за складом черевика.
+
+    Кожна видана карта знімається з лічильників за O(1); результати для
+    однакового складу черевика беруться з кешу.
+    """
+
+    def __init__(self, decks: int = 1, counts: Optional[Tuple[int, ...]] = None):
+        self.decks = decks
+        self._counts: List[int] = list(counts if counts is not None else shoe_composition(decks))
+        self._key: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def from_shoe(cls, shoe: Shoe) -> "DealerOdds":
+        """Почати з карт, що ще лежать у черевику."""
+        return cls(shoe.decks, shoe.composition())
+
+    @property
+    def counts(self) -> Tuple[int, ...]:
+        if self._key is None:
+            self._key = tuple(self._counts)
+        return self._key
+
+    def remove(self, rank: str) -> None:
+        """Врахувати видану карту (ранг як у Card.rank)."""
+        self._counts[POINT_INDEX[VALUES[rank]]] -= 1
+        self._key = None
+
+    def reset(self) -> None:
+        """Новий черевик після перетасування."""
+        self._counts = list(shoe_composition(self.decks))
+        self._key = None
+
+    def outcomes(self, upcard: int) -> Tuple[float, ...]:
+        """Ймовірності для відкритої карти дилера, яку вже знято через remove()."""
+        return dealer_outcomes(upcard, self.counts)
+
+    def distribution(self, upcard: int) -> Dict[object, float]:
+        return dict(zip(OUTCOME_KEYS, self.outcomes(upcard)))
+
+    def bust_probability(self, upcard: int) -> float:
+        return self.outcomes(upcard)[BUST_INDEX]
@@ -0,0 +1,193 @@
+import argparse
+import os
+import struct
+import time
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from ledger import BET as BET_KIND, WIN as WIN_KIND, PUSH as PUSH_KIND, REFUND as REFUND_KIND, RESET as RESET_KIND
+from blackjack_engine import OUTCOMES, GAME as BLACKJACK_GAME
+from roulette_engine import GAME as ROULETTE_GAME, bet_row
+from write_behind import WriteBehind
+
+
+# Види записів
+DEAL = 1      # code - код карти 0..51
+SHUFFLE = 2   # code - номер тасування черевика
+BET = 3       # amount - ставка (від'ємна), balance - фішки після неї
+WIN = 4
+PUSH = 5
+REFUND = 6
+RESET = 7
+SPIN = 8      # code - виграшне число
+SETTLE = 9    # code - індекс результату в OUTCOMES (блекджек) або виграшне число (рулетка), amount - виплата
+STAKE = 10    # code - рядок ставки рулетки в BET_KEYS, amount - сума (від'ємна, якщо ставку повернуто)
+KIND_NAMES = {DEAL: "deal", SHUFFLE: "shuffle", BET: "bet", WIN: "win", PUSH: "push", REFUND: "refund",
+              RESET: "reset", SPIN: "spin", SETTLE: "settle", STAKE: "stake"}
+CHIP_KINDS = {BET_KIND: BET, WIN_KIND: WIN, PUSH_KIND: PUSH, REFUND_KIND: REFUND, RESET_KIND: RESET}
+
+# Гра, до якої належить запис
+NO_GAME = 0
+BLACKJACK = 1
+ROULETTE = 2
+GAMES = (BLACKJACK, ROULETTE)
+GAME_CODES = {BLACKJACK_GAME: BLACKJACK, ROULETTE_GAME: ROULETTE}
+OUTCOME_CODES = {outcome: i for i, outcome in enumerate(OUTCOMES)}
+
+# Один запис - 32 байти без вирівнювання, little-endian
+RECORD_DTYPE = np.dtype([
+    ("ts", "<f8"),
+    ("round", "<u4"),
+    ("code", "<i2"),
+    ("kind", "u1"),
+    ("game", "u1"),
+    ("amount", "<i8"),
+    ("balance", "<i8"),
+])
+LOG_MAGIC = b"KREV"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<4sHH8x")
+
+
+class EventLog(WriteBehind):
+    """Двійковий журнал подій раундів з потоковим записом.
+
+    record() лише кладе кортеж у чергу; потік WriteBehind збирає записи
+    пачками в масив RECORD_DTYPE і дописує їх у файл одним write(), тому
+    потік інтерфейсу не чекає на диск. Кожна гра має власний лічильник
+    раундів, що збільшується після запису SETTLE цієї гри, тож усі роздачі
+    і ставки раунду мають пару (game, round) його запису SETTLE, навіть
+    якщо раунди блекджеку і рулетки чергуються. Записи без гри (RESET)
+    мають game=NO_GAME і round=0.
+
+    Підписується на Shoe як спостерігач (card_dealt, shoe_shuffled).
+    """
+
+    closed_message = "Журнал подій закрито"
+
+    def __init__(self, path: str = "events.bin", batch_size: int = 4096, flush_interval: float = 0.25):
+        self.path = path
+        self.rounds: Dict[int, int] = dict.fromkeys(GAMES, 0)
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as f:
+                f.write(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, RECORD_DTYPE.itemsize))
+        else:
+            # Обрізати неповний запис, що міг залишитися після аварійного завершення
+            excess = (os.path.getsize(path) - LOG_HEADER.size) % RECORD_DTYPE.itemsize
+            if excess:
+                os.truncate(path, os.path.getsize(path) - excess)
+            self.rounds.update(_next_rounds(path))
+        self._file = open(path, "ab", buffering=0)
+
+        super().__init__("event-log-writer", batch_size, flush_interval)
+
+    def record(self, kind: int, code: int = 0, amount: int = 0, balance: int = 0, game: int = NO_GAME) -> None:
+        """Додати запис (без очікування на диск)."""
+        game_round = self.rounds.get(game, 0)
+        self._put((time.time(), game_round, code, kind, game, amount, balance))
+        if kind == SETTLE:
+            self.rounds[game] = game_round + 1
+
+    def chips(self, kind: str, amount: int, balance: int, game: Optional[str] = None) -> None:
+        """Зміна фішок гравця (вид як у ledger: bet, win, push ...; game як у blackjack_engine.GAME)."""
+        self.record(CHIP_KINDS[kind], amount=amount, balance=balance, game=GAME_CODES.get(game, NO_GAME))
+
+    def roulette_bet(self, bet_key: str, amount: int) -> None:
+        """Ставка рулетки на конкретне поле (для статистики за видами ставок)."""
+        self.record(STAKE, bet_row(bet_key), amount, game=ROULETTE)
+
+    def spin(self, winner_number: int) -> None:
+        self.record(SPIN, winner_number, game=ROULETTE)
+
+    def blackjack_settled(self, outcome: str, payout: int, balance: int) -> None:
+        """Завершити раунд блекджеку (outcome як у blackjack_engine)."""
+        self.record(SETTLE, OUTCOME_CODES[outcome], payout, balance, BLACKJACK)
+
+    def roulette_settled(self, winner_number: int, payout: int, balance: int) -> None:
+        """Завершити раунд рулетки."""
+        self.record(SETTLE, winner_number, payout, balance, ROULETTE)
+
+    def card_dealt(self, code: int) -> None:
+        self.record(DEAL, code, game=BLACKJACK)
+
+    def shoe_shuffled(self, shoe) -> None:
+        self.record(SHUFFLE, shoe.reshuffles - 1, game=BLACKJACK)
+
+    def _write_batch(self, batch: list) -> None:
+        self._file.write(np.array(batch, dtype=RECORD_DTYPE).tobytes())
+
+    def _writer_stopped(self) -> None:
+        self._file.close()
+
+
+def _next_rounds(path: str) -> Dict[int, int]:
+    """Номер наступного раунду кожної гри: після останнього записаного SETTLE."""
+    reader = EventLogReader(path)
+    rounds = {}
+    for game in GAMES:
+        settles = reader.of_kind(SETTLE, game)
+        if len(settles):
+            rounds[game] = int(settles["round"].max()) + 1
+    return rounds
+
+
+class EventLogReader:
+    """Читання журналу через відображення файлу в пам'ять.
+
+    records - масив NumPy поверх mmap без копіювання, тож зрізи, фільтри
+    за видом і агрегування по сотнях мільйонів записів не створюють
+    об'єктів Python на кожен запис. Неповний останній запис (якщо файл
+    читають під час запису) ігнорується.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, record_size = LOG_HEADER.unpack(f.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC or version != LOG_VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"Файл {path} не є журналом подій версії {LOG_VERSION}")
+        count = (os.path.getsize(path) - LOG_HEADER.size) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=LOG_HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def chunks(self, size: int = 1 << 20) -> Iterator[np.ndarray]:
+        """Пройти журнал шматками по size записів (кожен шматок - вид на mmap)."""
+        for start in range(0, len(self.records), size):
+            yield self.records[start:start + size]
+
+    def of_kind(self, kind: int, game: Optional[int] = None) -> np.ndarray:
+        mask = self.records["kind"] == kind
+        if game is not None:
+            mask &= self.records["game"] == game
+        return self.records[mask]
+
+    def round(self, game: int, number: int) -> np.ndarray:
+        """Усі записи раунду number гри game (раунди різних ігор можуть чергуватися)."""
+        return self.records[(self.records["game"] == game) & (self.records["round"] == number)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Перегляд двійкового журналу подій")
+    parser.add_argument("path", nargs="?", default="events.bin")
+    parser.add_argument("--tail", type=int, default=20, help="показати останні N записів")
+    args = parser.parse_args()
+
+    reader = EventLogReader(args.path)
+    kinds, counts = np.unique(reader.records["kind"], return_counts=True)
+    print(f"Записів: {len(reader)}, раундів: {len(reader.of_kind(SETTLE))}")
+    for kind, count in zip(kinds, counts):
+        print(f"  {KIND_NAMES.get(int(kind), kind)}: {count}")
+    for record in reader[-args.tail:]:
+        print(f"{time.strftime('%H:%M:%S', time.localtime(record['ts']))} "
+              f"гра {record['game']} раунд {record['round']} {KIND_NAMES.get(int(record['kind']))} code={record['code']} amount={record['amount']} "
+              f"balance={record['balance']}")
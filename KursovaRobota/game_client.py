@@ -0,0 +1,66 @@
+import json
+import socket
+from typing import Optional
+
+from game_server import DEFAULT_HOST, DEFAULT_PORT
+
+
+class GameClient:
+    """Синхронний клієнт сервера столів для екранів tkinter.
+
+    Запити на localhost займають частки мілісекунди, тому їх можна
+    викликати прямо з обробників кнопок.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_path: Optional[str] = None,
+                 timeout: float = 5.0):
+        if unix_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(unix_path)
+        else:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.sock.makefile("rwb")
+        self.next_id = 0
+
+    def request(self, op: str, **fields) -> dict:
+        """Надіслати запит і повернути стан столу. Помилки сервера стають ValueError."""
+        self.next_id += 1
+        message = dict(fields, id=self.next_id, op=op)
+        self.stream.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if not response.get("ok"):
+            raise ValueError(response.get("error"))
+        return response["state"]
+
+    def join(self, game: str, table: str, name: str) -> dict:
+        return self.request("join", game=game, table=table, name=name)
+
+    def bet(self, amount: int, bet_type: Optional[str] = None) -> dict:
+        if bet_type is None:
+            return self.request("bet", amount=amount)
+        return self.request("bet", amount=amount, bet_type=bet_type)
+
+    def deal(self) -> dict:
+        """Роздати раунд блекджеку, не чекаючи ставок усіх гравців за столом."""
+        return self.request("deal")
+
+    def hit(self) -> dict:
+        return self.request("hit")
+
+    def stand(self) -> dict:
+        return self.request("stand")
+
+    def spin(self) -> dict:
+        return self.request("spin")
+
+    def clear(self) -> dict:
+        return self.request("clear")
+
+    def state(self) -> dict:
+        return self.request("state")
+
+    def close(self) -> None:
+        self.stream.close()
+        self.sock.close()
@@ -0,0 +1,225 @@
+from array import array
+from typing import TYPE_CHECKING, List, Tuple, Optional
+from image_cache import CardImageCache
+from ledger import BET, WIN, PUSH, RESET
+from rng import fresh_seed, child_seed, python_random
+
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
+
+SUITS = ['hearts', 'diamonds', 'clubs', 'spades']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
+VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
+          'jack': 10, 'queen': 10, 'king': 10, 'ace': 11}
+
+# Карта в черевику зберігається як один байт: код = індекс масті * 13 + індекс рангу
+CARDS_PER_DECK = len(SUITS) * len(RANKS)
+CARD_TUPLES = [(rank, suit) for suit in SUITS for rank in RANKS]
+CARD_VALUES = [VALUES[rank] for rank, _ in CARD_TUPLES]
+
+MIN_DECKS = 1
+MAX_DECKS = 8
+
+
+def shuffled_cards(decks: int, seed: int, index: int) -> array:
+    """Коди карт черевика після тасування номер index (для seed-а seed)."""
+    cards = array('B', range(CARDS_PER_DECK)) * decks
+    python_random(child_seed(seed, index)).shuffle(cards)
+    return cards
+
+
+class Shoe:
+    """Черевик з кількох колод з картою зрізу.
+
+    Кожен стіл (чи симуляція) створює власний екземпляр, тому стан не
+    спільний. Карти лежать у компактному масиві байтів, а роздача лише
+    зсуває позицію, нічого не видаляючи.
+    """
+
+    def __init__(self, decks: int = 1, penetration: float = 0.75, seed: Optional[int] = None, shuffler=None):
+        if not MIN_DECKS <= decks <= MAX_DECKS:
+            raise ValueError(f"Кількість колод має бути від {MIN_DECKS} до {MAX_DECKS}")
+        if not 0 < penetration <= 1:
+            raise ValueError("Проникнення має бути в межах (0, 1]")
+
+        self.decks = decks
+        self.penetration = penetration
+        # Кожне тасування n отримує власний seed child_seed(seed, n), тому будь-який
+        # стан черевика відтворюється за (seed, n, position)
+        self.seed = seed if seed is not None else fresh_seed()
+        self.suits = SUITS
+        self.ranks = RANKS
+        self.values = VALUES
+        self.cards = array('B')
+        self.cut_card = int(CARDS_PER_DECK * decks * penetration)
+        self.position = 0
+        self.reshuffles = 0
+        self.observers = []
+        # Необов'язкове джерело готових тасувань (shuffler.ShufflePrefetcher)
+        self.shuffler = shuffler
+        self.reset()
+
+    def add_observer(self, observer) -> None:
+        """Підписати спостерігача на роздачу карт.
+
+        Спостерігач має методи card_dealt(code) і shoe_shuffled(shoe).
+        """
+        self.observers.append(observer)
+        observer.shoe_shuffled(self)
+
+    def remove_observer(self, observer) -> None:
+        self.observers.remove(observer)
+
+    def reset(self) -> None:
+        """Зібрати всі карти назад і перетасувати черевик."""
+        if self.shuffler is not None:
+            self.cards = self.shuffler.cards(self.decks, self.seed, self.reshuffles)
+        else:
+            self.cards = shuffled_cards(self.decks, self.seed, self.reshuffles)
+        self.position = 0
+        self.reshuffles += 1
+        for observer in self.observers:
+            observer.shoe_shuffled(self)
+
+    def state(self) -> Tuple[int, int, int]:
+        """Стан черевика для відтворення: (seed, номер тасування, позиція)."""
+        return self.seed, self.reshuffles - 1, self.position
+
+    def seek(self, shuffle_index: int, position: int) -> None:
+        """Відновити черевик у стані, збереженому через state()."""
+        self.reshuffles = shuffle_index
+        self.reset()
+        self.position = position
+
+    @property
+    def cut_card_reached(self) -> bool:
+        """Чи дійшла роздача до карти зрізу."""
+        return self.position >= self.cut_card
+
+    def shuffle_if_needed(self) -> bool:
+        """Перетасувати черевик, якщо пройдено карту зрізу. Викликається перед раундом."""
+        if self.cut_card_reached:
+            self.reset()
+            return True
+        return False
+
+    def composition(self) -> Tuple[int, ...]:
+        """Кількість карт кожного значення 2..11 (туз = 11), що залишились у черевику."""
+        counts = [0] * 10
+        for code in self.cards[self.position:]:
+            counts[CARD_VALUES[code] - 2] += 1
+        return tuple(counts)
+
+    def remaining(self) -> int:
+        """Кількість карт, що залишились у черевику."""
+        return len(self.cards) - self.position
+
+    def deal_code(self) -> int:
+        """Роздати одну карту як код 0..51."""
+        if self.position >= len(self.cards):
+            # Черевик закінчився посеред раунду - тасуємо, щоб рука не залишилась без карти
+            self.reset()
+        code = self.cards[self.position]
+        self.position += 1
+        for observer in self.observers:
+            observer.card_dealt(code)
+        return code
+
+    def deal_card(self) -> Tuple[str, str]:
+        """Роздати одну карту з черевика."""
+        return CARD_TUPLES[self.deal_code()]
+
+    def get_card_value(self, card: Tuple[str, str]) -> int:
+        """Отримати числове значення карти."""
+        rank, _ = card
+        return VALUES[rank]
+
+
+class Card:
+    def __init__(self, rank: str, suit: str):
+        self.rank = rank
+        self.suit = suit
+        self.value = VALUES[rank]
+        self.image = None
+
+    def get_image(self, card_width: int, card_height: int) -> "ImageTk.PhotoImage":
+        """Завантажити зображення карти."""
+        photo = CardImageCache().get(self.rank, self.suit, card_width, card_height)
+        self.image = photo
+        return photo
+
+
+class Hand:
+    def __init__(self):
+        self.cards: List[Card] = []
+        self.value = 0
+        self.aces = 0
+
+    def add_card(self, card: Card) -> None:
+        """Додати карту в руку і обчислити значення руки."""
+        self.cards.append(card)
+        self.value += card.value
+
+
+        if card.rank == 'ace':
+            self.aces += 1
+
+
+        while self.value > 21 and self.aces:
+            self.value -= 10
+            self.aces -= 1
+
+    def clear(self) -> None:
+        """Очистити руку."""
+        self.cards = []
+        self.value = 0
+        self.aces = 0
+
+
+START_CHIPS = 1000
+
+
+class Player:
+    def __init__(self, name: str, ledger=None, events=None):
+        self.name = name
+        self.hand = Hand()
+        self.chips = START_CHIPS
+        self.ledger = ledger  # необов'язковий ledger.Ledger для збереження балансу
+        self.events = events  # необов'язковий event_log.EventLog для аудиту раундів
+
+    def _record(self, kind: str, amount: int, game: Optional[str] = None) -> None:
+        if self.ledger is not None:
+            self.ledger.record(self.name, kind, amount, self.chips)
+        if self.events is not None:
+            self.events.chips(kind, amount, self.chips, game)
+
+    def bet(self, amount: int, game: Optional[str] = None) -> None:
+        """Зробити ставку (game - гра, до раунду якої вона належить, як blackjack_engine.GAME)."""
+        if amount <= 0:
+            raise ValueError("Ставка має бути додатною")
+        if amount <= self.chips:
+            self.chips -= amount
+            self._record(BET, -amount, game)
+        else:
+            raise ValueError("Недостатньо фішок")
+
+    def win_bet(self, amount: int) -> None:
+        """Виграти ставку."""
+        self.collect(amount * 2)
+
+    def push(self, amount: int) -> None:
+        """Нічия (поверненя ставки)."""
+        self.collect(amount, PUSH)
+
+    def collect(self, amount: int, kind: str = WIN, game: Optional[str] = None) -> None:
+        """Отримати фішки (виграш, нічия чи повернення ставки)."""
+        if amount:
+            self.chips += amount
+            self._record(kind, amount, game)
+
+    def reset_chips(self, amount: int = START_CHIPS) -> None:
+        """Почати знову з початковою кількістю фішок."""
+        delta = amount - self.chips
+        self.chips = amount
+        self._record(RESET, delta)
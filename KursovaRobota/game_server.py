@@ -0,0 +1,359 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Set
+
+from game_models import Shoe, Player, Hand
+from ledger import REFUND
+from rng import SeedStream, python_random
+from blackjack_engine import MAX_SEATS, TableRound
+from roulette_engine import GAME as ROULETTE_GAME, NUMBER_COLORS, POCKETS, slips_matrix, settle_many, is_valid_bet
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class ProtocolError(Exception):
+    """Помилка в запиті клієнта (повертається клієнту як ok=false)."""
+
+
+def bet_amount(request: dict) -> int:
+    """Сума ставки із запиту клієнта: лише додатне ціле число."""
+    amount = request["amount"]
+    if isinstance(amount, bool) or not isinstance(amount, (int, str)):
+        raise ProtocolError(f"Некоректна сума ставки: {amount!r}")
+    try:
+        amount = int(amount)
+    except ValueError:
+        raise ProtocolError(f"Некоректна сума ставки: {amount!r}")
+    if amount <= 0:
+        raise ProtocolError("Ставка має бути додатною")
+    return amount
+
+
+def hand_state(hand: Hand, hide_first: bool = False) -> dict:
+    cards = [[card.rank, card.suit] for card in hand.cards]
+    if hide_first and cards:
+        cards[0] = ["back", ""]
+        return {"cards": cards, "value": None}
+    return {"cards": cards, "value": hand.value}
+
+
+class BlackjackTable:
+    """Стіл блекджеку на MAX_SEATS місць: спільний черевик і одна рука дилера (TableRound).
+
+    Ставки приймаються між раундами. Раунд роздається, щойно поставили всі
+    гравці за столом, або раніше за запитом deal - тоді хто не поставив,
+    пропускає раунд. hit і stand приймаються лише від гравця, чия черга
+    (turn у стані). Гравець, що пішов посеред раунду, автоматично
+    зупиняється, а його місце звільняється після розрахунку.
+    """
+
+    game = "blackjack"
+
+    def __init__(self, table_id: str, seed: Optional[int] = None, decks: int = 6):
+        self.table_id = table_id
+        self.shoe = Shoe(decks, seed=seed)
+        self.dealer = Player("Дилер")
+        self.players: Dict[str, Player] = {}   # місця в порядку приєднання
+        self.bets: Dict[str, int] = {}         # ставки на наступний раунд
+        self.game_round: Optional[TableRound] = None
+        self.leaving: Set[str] = set()
+
+    @property
+    def in_round(self) -> bool:
+        return self.game_round is not None and not self.game_round.finished
+
+    def join(self, name: str) -> Player:
+        if name not in self.players:
+            if len(self.players) >= MAX_SEATS:
+                raise ProtocolError(f"За столом {self.table_id} немає вільних місць")
+            self.players[name] = Player(name)
+        self.leaving.discard(name)
+        return self.players[name]
+
+    def leave(self, name: str) -> None:
+        player = self.players.get(name)
+        if player is None:
+            return
+        self.bets.pop(name, None)
+        if self.in_round and player in self.game_round.players:
+            self.leaving.add(name)
+            self._advance()
+        else:
+            del self.players[name]
+            if self.bets and not self.in_round and len(self.bets) == len(self.players):
+                self.deal()
+
+    def handle(self, name: str, op: str, request: dict) -> dict:
+        player = self.players[name]
+        try:
+            if op == "bet":
+                self.place_bet(name, bet_amount(request))
+            elif op == "deal":
+                self.deal()
+            elif op in ("hit", "stand"):
+                if not self.in_round or self.game_round.player is not player:
+                    raise ProtocolError("Зараз не ваш хід")
+                if op == "hit":
+                    self.game_round.hit()
+                else:
+                    self.game_round.stand()
+                self._advance()
+            elif op != "state":
+                raise ProtocolError(f"Невідома операція: {op}")
+        except (ValueError, RuntimeError) as e:
+            raise ProtocolError(str(e))
+        return self.state(name)
+
+    def place_bet(self, name: str, amount: int) -> None:
+        """Ставка на наступний раунд; фішки списуються, коли раунд роздається."""
+        if self.in_round:
+            raise ProtocolError("Раунд уже йде, ставки приймаються після нього")
+        if amount > self.players[name].chips:
+            raise ProtocolError("Недостатньо фішок")
+        self.bets[name] = amount
+        if len(self.bets) == len(self.players):
+            self.deal()
+
+    def deal(self) -> None:
+        """Роздати раунд усім місцям, що поставили."""
+        if self.in_round:
+            raise ProtocolError("Раунд уже йде")
+        if not self.bets:
+            raise ProtocolError("Немає жодної ставки")
+        names = [name for name in self.players if name in self.bets]
+        self.game_round = TableRound([self.players[name] for name in names], self.shoe, self.dealer)
+        self.game_round.start([self.bets[name] for name in names])
+        self.bets.clear()
+        self._advance()
+
+    def _advance(self) -> None:
+        """Зупинити місця гравців, що пішли; після розрахунку звільнити їхні місця."""
+        while self.in_round and self.game_round.player.name in self.leaving:
+            self.game_round.stand()
+        if not self.in_round:
+            for name in self.leaving:
+                del self.players[name]
+            self.leaving.clear()
+
+    def _seat(self, player: Player) -> Optional[int]:
+        """Місце гравця в останньому раунді (None, якщо він у ньому не грав)."""
+        if self.game_round is None or player not in self.game_round.players:
+            return None
+        return self.game_round.players.index(player)
+
+    def state(self, name: str) -> dict:
+        player = self.players[name]
+        seat = self._seat(player)
+        return {
+            "chips": player.chips,
+            "bet": self.bets.get(name, int(self.game_round.bets[seat]) if seat is not None else 0),
+            "player": hand_state(player.hand),
+            "dealer": hand_state(self.dealer.hand, hide_first=self.in_round),
+            "finished": not self.in_round,
+            "outcome": self.game_round.outcomes[seat] if seat is not None else None,
+            "payout": int(self.game_round.payouts[seat]) if seat is not None else 0,
+            "turn": self.game_round.player.name if self.in_round else None,
+            "seats": [{"name": seat_name, "player": hand_state(seat_player.hand)}
+                      for seat_name, seat_player in self.players.items()],
+        }
+
+
+class RouletteTable:
+    """Стіл рулетки: ставки всіх гравців розраховуються одним множенням матриці."""
+
+    game = "roulette"
+
+    def __init__(self, table_id: str, seed: Optional[int] = None):
+        self.table_id = table_id
+        self.seeds = SeedStream(seed)
+        self.spin_seed: Optional[int] = None
+        self.players: Dict[str, Player] = {}
+        self.active_bets: Dict[str, Dict[str, int]] = {}
+        self.winner_number: Optional[int] = None
+
+    def join(self, name: str) -> Player:
+        if name not in self.players:
+            self.players[name] = Player(name)
+            self.active_bets[name] = {}
+        return self.players[name]
+
+    def leave(self, name: str) -> None:
+        self.players.pop(name, None)
+        self.active_bets.pop(name, None)
+
+    def handle(self, name: str, op: str, request: dict) -> dict:
+        player = self.players[name]
+        if op == "bet":
+            bet_type = request["bet_type"]
+            amount = bet_amount(request)
+            if not is_valid_bet(bet_type):
+                raise ProtocolError(f"Невідома ставка: {bet_type}")
+            try:
+                player.bet(amount, ROULETTE_GAME)
+            except ValueError as e:
+                raise ProtocolError(str(e))
+            bets = self.active_bets[name]
+            bets[bet_type] = bets.get(bet_type, 0) + amount
+        elif op == "clear":
+            player.collect(sum(self.active_bets[name].values()), REFUND, ROULETTE_GAME)
+            self.active_bets[name].clear()
+        elif op == "spin":
+            self.spin()
+        elif op != "state":
+            raise ProtocolError(f"Невідома операція: {op}")
+        return self.state(name)
+
+    def spin(self) -> int:
+        """Обертання для всього столу."""
+        # За spin_seed обертання можна відтворити: python_random(spin_seed).randrange(POCKETS)
+        self.spin_seed = self.seeds.next_seed()
+        self.winner_number = python_random(self.spin_seed).randrange(POCKETS)
+        names = list(self.players)
+        winnings = settle_many(slips_matrix(self.active_bets[n] for n in names), self.winner_number)
+        for name, amount in zip(names, winnings):
+            self.players[name].collect(int(amount), game=ROULETTE_GAME)
+            self.active_bets[name].clear()
+        return self.winner_number
+
+    def state(self, name: str) -> dict:
+        winner = self.winner_number
+        return {
+            "chips": self.players[name].chips,
+            "bets": dict(self.active_bets[name]),
+            "winner_number": winner,
+            "winner_color": NUMBER_COLORS[winner] if winner is not None else None,
+        }
+
+
+TABLE_TYPES = {
+    BlackjackTable.game: BlackjackTable,
+    RouletteTable.game: RouletteTable,
+}
+
+
+class GameServer:
+    """Асинхронний сервер багатьох столів.
+
+    Протокол: один JSON-об'єкт на рядок в обидва боки.
+    Запит:    {"id": 1, "op": "join", "game": "blackjack", "table": "bj-1", "name": "Гравець"}
+    Відповідь: {"id": 1, "ok": true, "state": {...}} або {"id": 1, "ok": false, "error": "..."}
+    Після join ті ж поля game/table/name не потрібні: з'єднання пам'ятає свій стіл.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.tables: Dict[str, object] = {}
+        self.connections = 0
+        # Кожен новий стіл отримує власний незалежний потік із дерева seed-ів сервера
+        self.seeds = SeedStream(seed)
+
+    def get_table(self, game: str, table_id: str):
+        table = self.tables.get(table_id)
+        if table is None:
+            try:
+                table_class = TABLE_TYPES[game]
+            except KeyError:
+                raise ProtocolError(f"Невідома гра: {game}")
+            table = table_class(table_id, self.seeds.next_seed())
+            self.tables[table_id] = table
+        elif table.game != game:
+            raise ProtocolError(f"Стіл {table_id} - це {table.game}")
+        return table
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        table = None
+        name = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = {}
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ProtocolError("Запит має бути JSON-об'єктом")
+                    response["id"] = request.get("id")
+                    op = request.get("op")
+                    if op == "join":
+                        new_table = self.get_table(request.get("game"), str(request.get("table")))
+                        new_name = str(request.get("name", f"player-{self.connections}"))
+                        # Спочатку місце за новим столом: якщо воно недоступне, гравець лишається за старим
+                        new_table.join(new_name)
+                        if table is not None and (table, name) != (new_table, new_name):
+                            table.leave(name)
+                        table, name = new_table, new_name
+                    elif table is None:
+                        raise ProtocolError("Спочатку потрібно приєднатися до столу (op=join)")
+                    state = table.state(name) if op == "join" else table.handle(name, op, request)
+                    response.update(ok=True, state=state)
+                except (ProtocolError, KeyError, TypeError, ValueError) as e:
+                    response.update(ok=False, error=str(e))
+                writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if table is not None:
+                table.leave(name)
+            writer.close()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    unix_path: Optional[str] = None) -> None:
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+async def _bench_blackjack_table(table: BlackjackTable, rounds: int) -> None:
+    name = "bot"
+    player = table.join(name)
+    player.chips = 10 ** 9
+    for _ in range(rounds):
+        table.handle(name, "bet", {"amount": 10})
+        while table.in_round:
+            table.handle(name, "hit" if player.hand.value < 17 else "stand", {})
+        # Віддати керування циклу подій, як це було б між повідомленнями клієнтів
+        await asyncio.sleep(0)
+
+
+def bench(tables: int, rounds: int, rounds_per_minute: float) -> None:
+    """Заміряти пропускну здатність одного процесу (одного ядра)."""
+    server = GameServer()
+    started = time.perf_counter()
+
+    async def run():
+        await asyncio.gather(*(_bench_blackjack_table(server.get_table("blackjack", f"bj-{i}"), rounds)
+                               for i in range(tables)))
+
+    asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    rounds_per_second = tables * rounds / elapsed
+    print(f"Столів: {tables}, раундів: {tables * rounds} за {elapsed:.2f} с")
+    print(f"Раундів за секунду на ядро: {rounds_per_second:.0f}")
+    print(f"Столів на ядро при {rounds_per_minute:g} раундах/хв: {rounds_per_second * 60 / rounds_per_minute:.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сервер столів блекджеку і рулетки")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="шлях до Unix-сокета замість TCP")
+    parser.add_argument("--seed", type=int, default=None, help="головний seed для відтворюваних столів")
+    parser.add_argument("--bench", action="store_true", help="заміряти столи на ядро і вийти")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--rounds-per-minute", type=float, default=2.0)
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.tables, args.rounds, args.rounds_per_minute)
+    else:
+        asyncio.run(GameServer(args.seed).serve(args.host, args.port, args.unix))
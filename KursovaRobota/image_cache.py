@@ -0,0 +1,161 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+
+CARDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cards")
+BACK_RANK = "back"
+SUITS = ['hearts', 'diamonds', 'clubs', 'spades']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'jack', 'queen', 'king', 'ace']
+
+
+def card_path(rank: str, suit: str) -> str:
+    """Шлях до файлу зображення карти."""
+    if rank == BACK_RANK:
+        return os.path.join(CARDS_DIR, "back.png")
+    return os.path.join(CARDS_DIR, f"{rank}_of_{suit}.png")
+
+
+# Шаблон проєктування Singleton: один кеш зображень на весь процес.
+# PIL імпортується при першому декодуванні, а не під час запуску гри.
+# Якщо зібрано атлас (python card_atlas.py), карти вирізаються з нього, а не з PNG.
+class CardImageCache:
+    _instance = None
+
+    def __new__(cls, max_entries: int = 128, atlas_path: Optional[str] = None):
+        if cls._instance is None:
+            cls._instance = super(CardImageCache, cls).__new__(cls)
+            cls._instance._initialize(max_entries, atlas_path)
+        return cls._instance
+
+    def _initialize(self, max_entries: int, atlas_path: Optional[str]):
+        self.max_entries = max_entries
+        self.atlas = self._open_atlas(atlas_path)
+        self.size: Optional[Tuple[int, int]] = None
+        # (rank, suit, width, height) -> зменшене PIL-зображення
+        self._images: "OrderedDict[Tuple[str, str, int, int], Image.Image]" = OrderedDict()
+        # (rank, suit, width, height) -> PhotoImage (створюється лише в потоці Tk)
+        self._photos: "OrderedDict[Tuple[str, str, int, int], ImageTk.PhotoImage]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
+        self.decodes = 0         # усі промахи кешу зображень (з атласу чи з PNG)
+        self.atlas_decodes = 0   # з них вирізано з атласу
+
+    def get(self, rank: str, suit: str, width: int, height: int) -> "ImageTk.PhotoImage":
+        """Отримати зображення карти потрібного розміру (декодується лише один раз)."""
+        key = (rank, suit, width, height)
+        with self._lock:
+            self._set_size(width, height)
+            photo = self._photos.get(key)
+            if photo is not None:
+                self._photos.move_to_end(key)
+                return photo
+
+        from PIL import ImageTk
+
+        image = self._get_resized(key)
+        photo = ImageTk.PhotoImage(image)
+        with self._lock:
+            self._photos[key] = photo
+            self._trim(self._photos)
+        return photo
+
+    def get_back(self, width: int, height: int) -> "ImageTk.PhotoImage":
+        """Отримати зображення звороту карти."""
+        return self.get(BACK_RANK, "", width, height)
+
+    def warm_up(self, width: int, height: int, background: bool = True) -> None:
+        """Наперед декодувати і зменшити всі 53 зображення.
+
+        Фоновий потік готує лише PIL-зображення, а PhotoImage створюються
+        при першому показі карти, бо Tk не можна викликати з інших потоків.
+        """
+        with self._lock:
+            self._set_size(width, height)
+        keys = [(rank, suit, width, height) for suit in SUITS for rank in RANKS]
+        keys.append((BACK_RANK, "", width, height))
+
+        def run():
+            for key in keys:
+                self._get_resized(key)
+
+        if not background:
+            run()
+            return
+        if self._warm_thread is not None and self._warm_thread.is_alive():
+            return
+        self._warm_thread = threading.Thread(target=run, name="card-image-warm-up", daemon=True)
+        self._warm_thread.start()
+
+    def clear(self) -> None:
+        """Звільнити всі закешовані зображення."""
+        with self._lock:
+            self._images.clear()
+            self._photos.clear()
+            self.size = None
+
+    def _get_resized(self, key: Tuple[str, str, int, int]) -> "Image.Image":
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                return image
+
+        rank, suit, width, height = key
+        image = self._decode(rank, suit, width, height)
+        with self._lock:
+            # Розмір міг змінитися, поки ми декодували у фоновому потоці
+            if self.size is None or self.size == (width, height):
+                self._images[key] = image
+                self._trim(self._images)
+        return image
+
+    def _decode(self, rank: str, suit: str, width: int, height: int) -> "Image.Image":
+        if self.atlas is not None:
+            if (rank, suit) not in self.atlas:
+                rank, suit = BACK_RANK, ""
+            image = self.atlas.image(rank, suit, width, height)
+            self.decodes += 1
+            self.atlas_decodes += 1
+            return image
+
+        from PIL import Image
+
+        image_path = card_path(rank, suit)
+        if not os.path.exists(image_path):
+            image_path = card_path(BACK_RANK, "")
+
+        if os.path.exists(image_path):
+            with Image.open(image_path) as source:
+                image = source.resize((width, height), Image.LANCZOS)
+        else:
+            image = Image.new('RGB', (width, height), color='blue')
+        self.decodes += 1
+        return image
+
+    @staticmethod
+    def _open_atlas(path: Optional[str]):
+        """Відобразити атлас у пам'ять; None, якщо його не зібрано (тоді читаються PNG)."""
+        from card_atlas import ATLAS_PATH, CardAtlas
+
+        try:
+            return CardAtlas(path or ATLAS_PATH)
+        except (OSError, ValueError):
+            return None
+
+    def _set_size(self, width: int, height: int) -> None:
+        """Якщо розмір карт змінився, старі зображення більше не потрібні."""
+        if self.size == (width, height):
+            return
+        if self.size is not None:
+            self._images.clear()
+            self._photos.clear()
+        self.size = (width, height)
+
+    def _trim(self, cache: OrderedDict) -> None:
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
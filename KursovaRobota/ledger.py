@@ -0,0 +1,119 @@
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+from write_behind import WriteBehind
+
+
+# Види записів у журналі
+BET = "bet"
+WIN = "win"
+PUSH = "push"
+REFUND = "refund"
+RESET = "reset"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts REAL NOT NULL,
+    player TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    balance INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_player ON events (player, id);
+CREATE TABLE IF NOT EXISTS snapshots (
+    player TEXT PRIMARY KEY,
+    event_id INTEGER NOT NULL,
+    balance INTEGER NOT NULL,
+    ts REAL NOT NULL
+);
+"""
+
+
+class Ledger(WriteBehind):
+    """Журнал фішок лише для дописування (SQLite у режимі WAL).
+
+    record() лише кладе запис у чергу, а потік WriteBehind пише записи
+    пачками в одній транзакції, тому запис у журнал не додає затримки до
+    ставок. Раз на snapshot_every записів (і під час close()) зберігається
+    знімок балансу кожного гравця, щоб відновлення при запуску читало лише
+    знімок і хвіст журналу.
+    """
+
+    def __init__(self, path: str = "ledger.db", batch_size: int = 512, flush_interval: float = 0.25,
+                 snapshot_every: int = 1000):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self._connection: Optional[sqlite3.Connection] = None
+        self._latest: Dict[str, Tuple[int, int]] = {}
+        self._since_snapshot = 0
+
+        connection = self._connect()
+        connection.executescript(SCHEMA)
+        connection.close()
+
+        super().__init__("ledger-writer", batch_size, flush_interval)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def record(self, player: str, kind: str, amount: int, balance: int) -> None:
+        """Додати запис до журналу (без очікування на диск)."""
+        self._put((time.time(), player, kind, amount, balance))
+
+    def restore(self, player: str) -> Optional[int]:
+        """Відновити баланс гравця: останній знімок плюс записи після нього."""
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT event_id, balance FROM snapshots WHERE player = ?",
+                                     (player,)).fetchone()
+            event_id, balance = row if row else (0, None)
+            tail = connection.execute("SELECT balance FROM events WHERE player = ? AND id > ? "
+                                      "ORDER BY id DESC LIMIT 1", (player, event_id)).fetchone()
+            return tail[0] if tail else balance
+        finally:
+            connection.close()
+
+    def history(self, player: str, limit: int = 100) -> List[Tuple[float, str, int, int]]:
+        """Останні записи гравця, від найновіших."""
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT ts, kind, amount, balance FROM events WHERE player = ? "
+                                      "ORDER BY id DESC LIMIT ?", (player, limit)).fetchall()
+        finally:
+            connection.close()
+
+    def _writer_started(self) -> None:
+        # З'єднання SQLite належить потоку, що його відкрив
+        self._connection = self._connect()
+
+    def _write_batch(self, batch: list) -> None:
+        connection = self._connection
+        with connection:
+            for ts, player, kind, amount, balance in batch:
+                cursor = connection.execute(
+                    "INSERT INTO events (ts, player, kind, amount, balance) VALUES (?, ?, ?, ?, ?)",
+                    (ts, player, kind, amount, balance))
+                self._latest[player] = (cursor.lastrowid, balance)
+        self._since_snapshot += len(batch)
+        if self._since_snapshot >= self.snapshot_every:
+            self._snapshot()
+
+    def _writer_stopped(self) -> None:
+        self._snapshot()
+        self._connection.close()
+
+    def _snapshot(self) -> None:
+        now = time.time()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO snapshots (player, event_id, balance, ts) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(player) DO UPDATE SET event_id = excluded.event_id, "
+                "balance = excluded.balance, ts = excluded.ts",
+                [(player, event_id, balance, now) for player, (event_id, balance) in self._latest.items()])
+        self._latest.clear()
+        self._since_snapshot = 0
@@ -0,0 +1,246 @@
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# Верхні межі кошиків гістограми, мс; останній кошик - усе, що довше
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 50, 100, 250, 500, 1000)
+PERCENTILES = (50, 90, 99)
+
+
+class Histogram:
+    """Гістограма тривалостей з фіксованими кошиками: запис за O(log кошиків), без зберігання зразків."""
+
+    def __init__(self, bounds: Iterable[float] = BUCKET_BOUNDS_MS):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """Верхня межа кошика, в який потрапляє q-й перцентиль."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        result = {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "max": round(self.max, 3),
+        }
+        for q in PERCENTILES:
+            result[f"p{q}"] = self.percentile(q)
+        result["buckets"] = {("inf" if i == len(self.bounds) else str(self.bounds[i])): n
+                             for i, n in enumerate(self.buckets) if n}
+        return result
+
+
+class Metrics:
+    """Реєстр гістограм, лічильників і датчиків.
+
+    Сам по собі нічого не вимірює: код гри змінюється лише через
+    instrument_* нижче, які викликаються тільки коли вимірювання увімкнено,
+    тому без них накладних витрат немає зовсім.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value_ms: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Значення, яке читається лише в момент знімка (наприклад, лічильник декодувань кешу)."""
+        self.gauges[name] = read
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            histograms = {name: h.snapshot() for name, h in sorted(self.histograms.items())}
+            counters = dict(sorted(self.counters.items()))
+        return {
+            "timestamp": time.time(),
+            "uptime": round(time.time() - self.started, 1),
+            "histograms_ms": histograms,
+            "counters": counters,
+            "gauges": {name: read() for name, read in sorted(self.gauges.items())},
+        }
+
+    def dump(self, path: str) -> None:
+        """Записати знімок у JSON-файл (атомарно, через тимчасовий файл)."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.time()
+
+
+METRICS = Metrics()
+
+
+def timed(name: str, method: Callable, metrics: Metrics = METRICS) -> Callable:
+    """Обгортка, що записує тривалість кожного виклику в гістограму name."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.observe(name, (time.perf_counter() - started) * 1000)
+    return wrapper
+
+
+def instrument_methods(cls: type, names: Iterable[str], metrics: Metrics = METRICS) -> None:
+    """Вимірювати тривалість методів класу (гістограми "Клас.метод")."""
+    for name in names:
+        setattr(cls, name, timed(f"{cls.__name__}.{name}", getattr(cls, name), metrics))
+
+
+def instrument_frames(cls: type, name: str, budget_ms: float, metrics: Metrics = METRICS) -> None:
+    """Вимірювати кадри анімації, що перепланує себе через after(budget_ms).
+
+    Окрім тривалості самого кадру (.work_ms), записує фактичний інтервал між
+    кадрами (.interval_ms): на перевантаженому циклі подій він більший за
+    бюджет. Кадри, що прийшли пізніше ніж через два бюджети, рахуються як
+    пропущені. Перший кадр нової анімації інтервалу не має.
+    """
+    method = getattr(cls, name)
+    prefix = f"{cls.__name__}.{name}"
+    last_frame: "weakref.WeakKeyDictionary[object, float]" = weakref.WeakKeyDictionary()
+    new_animation_ms = budget_ms * 10
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        previous = last_frame.get(self)
+        if previous is not None:
+            interval = (started - previous) * 1000
+            if interval < new_animation_ms:
+                metrics.observe(f"{prefix}.interval_ms", interval)
+                if interval > budget_ms * 2:
+                    metrics.increment(f"{prefix}.missed_frames")
+        last_frame[self] = started
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            metrics.observe(f"{prefix}.work_ms", (time.perf_counter() - started) * 1000)
+    setattr(cls, name, wrapper)
+
+
+def instrument_widgets(metrics: Metrics = METRICS) -> None:
+    """Рахувати створення і знищення віджетів Tk у всьому процесі."""
+    import tkinter as tk
+
+    create, destroy = tk.BaseWidget.__init__, tk.BaseWidget.destroy
+
+    @functools.wraps(create)
+    def counted_init(self, *args, **kwargs):
+        metrics.increment("tk.widgets_created")
+        create(self, *args, **kwargs)
+
+    @functools.wraps(destroy)
+    def counted_destroy(self):
+        metrics.increment("tk.widgets_destroyed")
+        destroy(self)
+
+    tk.BaseWidget.__init__ = counted_init
+    tk.BaseWidget.destroy = counted_destroy
+
+
+class MetricsReporter:
+    """Періодичний запис знімків у файл і/або HTTP-ендпоінт лише на 127.0.0.1."""
+
+    def __init__(self, metrics: Metrics = METRICS, path: Optional[str] = None, port: Optional[int] = None,
+                 interval: float = 10.0):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self.server = None
+
+        if path:
+            self._start(self._dump_loop, "metrics-dump")
+        if port is not None:
+            from http.server import ThreadingHTTPServer
+
+            self.server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+            self._start(self.server.serve_forever, "metrics-http")
+
+    def _start(self, target: Callable[[], None], name: str) -> None:
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _dump_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.metrics.dump(self.path)
+
+    def _handler(self) -> type:
+        from http.server import BaseHTTPRequestHandler
+
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(metrics.snapshot(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def close(self) -> None:
+        """Зупинити звітування і записати останній знімок."""
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.path:
+            self.metrics.dump(self.path)
@@ -0,0 +1,47 @@
+import random
+from typing import List, Optional
+
+import numpy as np
+
+
+def fresh_seed() -> int:
+    """Новий 128-бітний seed з ентропії ОС."""
+    return np.random.SeedSequence().entropy
+
+
+def child_seed(seed: int, index: int) -> int:
+    """Seed index-го нащадка в дереві SeedSequence.
+
+    Нащадки одного seed-а статистично незалежні, а будь-якого з них можна
+    отримати напряму за номером, не генеруючи попередні.
+    """
+    state = np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(4)
+    return int.from_bytes(state.tobytes(), "little")
+
+
+def python_random(seed: int) -> random.Random:
+    """Генератор random.Random для заданого seed-а."""
+    return random.Random(seed)
+
+
+def numpy_generator(seed: int) -> np.random.Generator:
+    """Генератор NumPy PCG64 для заданого seed-а."""
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed)))
+
+
+class SeedStream:
+    """Послідовність незалежних seed-ів для одного столу або одного працівника симуляції."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = seed if seed is not None else fresh_seed()
+        self.count = 0
+
+    def next_seed(self) -> int:
+        """Seed для наступного раунду, тасування чи обертання."""
+        seed = child_seed(self.seed, self.count)
+        self.count += 1
+        return seed
+
+    def spawn(self, n: int) -> List["SeedStream"]:
+        """Окремі потоки для n столів чи процесів."""
+        return [SeedStream(self.next_seed()) for _ in range(n)]
@@ -0,0 +1,231 @@
+import math
+import random
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from rng import python_random
+
+
+# Назва гри для журналів фішок (Player.bet(..., game=GAME))
+GAME = "roulette"
+
+# Порядок чисел на колесі і їх кольори (як у RouletteGame)
+WHEEL_NUMBERS = [
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10,
+    5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
+]
+NUMBER_COLORS = {
+    0: "green",
+    1: "red", 2: "black", 3: "red", 4: "black", 5: "red", 6: "black",
+    7: "red", 8: "black", 9: "red", 10: "black", 11: "black", 12: "red",
+    13: "black", 14: "red", 15: "black", 16: "red", 17: "black", 18: "red",
+    19: "red", 20: "black", 21: "red", 22: "black", 23: "red", 24: "black",
+    25: "red", 26: "black", 27: "red", 28: "black", 29: "black", 30: "red",
+    31: "black", 32: "red", 33: "black", 34: "red", 35: "black", 36: "red"
+}
+POCKETS = 37
+
+# Початкові швидкості колеса (градуси за кадр) і кульки (радіани за кадр)
+SPIN_SPEED_RANGE = (0.1, 0.2)
+BALL_SPEED_RANGE = (0.15, 0.25)
+
+# Загасання швидкостей за кадр і умова зупинки анімації колеса
+SPIN_DECAY = 0.99
+BALL_DECAY = 0.98
+MIN_SPIN_FRAMES = 100
+STOP_SPIN_SPEED = 0.01
+
+# Виплата разом зі ставкою (ставка 10 на число -> 360)
+STRAIGHT_PAYOUT = 36
+SPLIT_PAYOUT = 18
+STREET_PAYOUT = 12
+CORNER_PAYOUT = 9
+SIX_LINE_PAYOUT = 6
+DOZEN_PAYOUT = 3
+COLUMN_PAYOUT = 3
+EVEN_MONEY_PAYOUT = 2
+
+
+def _covered_numbers() -> Dict[str, List[int]]:
+    """Усі ставки столу і числа, які вони покривають."""
+    bets: Dict[str, List[int]] = {
+        "red": [n for n in range(1, POCKETS) if NUMBER_COLORS[n] == "red"],
+        "black": [n for n in range(1, POCKETS) if NUMBER_COLORS[n] == "black"],
+        "green": [0],
+        "even": [n for n in range(1, POCKETS) if n % 2 == 0],
+        "odd": [n for n in range(1, POCKETS) if n % 2 == 1],
+        "1-18": list(range(1, 19)),
+        "19-36": list(range(19, 37)),
+    }
+    for n in range(POCKETS):
+        bets[f"number_{n}"] = [n]
+    # Спліти: 0 з 1/2/3, сусіди в рядку і сусіди в колонці
+    for n in (1, 2, 3):
+        bets[f"split_0_{n}"] = [0, n]
+    for n in range(1, POCKETS):
+        if n % 3 != 0:
+            bets[f"split_{n}_{n + 1}"] = [n, n + 1]
+        if n + 3 < POCKETS:
+            bets[f"split_{n}_{n + 3}"] = [n, n + 3]
+    for n in range(1, POCKETS, 3):
+        bets[f"street_{n}"] = [n, n + 1, n + 2]
+        if n + 5 < POCKETS:
+            bets[f"sixline_{n}"] = list(range(n, n + 6))
+    for n in range(1, POCKETS - 3):
+        if n % 3 != 0:
+            bets[f"corner_{n}"] = [n, n + 1, n + 3, n + 4]
+    for i in range(3):
+        bets[f"dozen_{i + 1}"] = list(range(12 * i + 1, 12 * i + 13))
+        bets[f"column_{i + 1}"] = list(range(i + 1, POCKETS, 3))
+    return bets
+
+
+def _payout_for(bet_key: str) -> int:
+    kind = bet_key.split("_")[0]
+    if bet_key == "green":
+        return STRAIGHT_PAYOUT
+    return {
+        "number": STRAIGHT_PAYOUT,
+        "split": SPLIT_PAYOUT,
+        "street": STREET_PAYOUT,
+        "corner": CORNER_PAYOUT,
+        "sixline": SIX_LINE_PAYOUT,
+        "dozen": DOZEN_PAYOUT,
+        "column": COLUMN_PAYOUT,
+    }.get(kind, EVEN_MONEY_PAYOUT)
+
+
+def _build_tables():
+    coverage = _covered_numbers()
+    keys = list(coverage)
+    index = {key: i for i, key in enumerate(keys)}
+    masks = np.zeros(len(keys), dtype=np.int64)
+    matrix = np.zeros((len(keys), POCKETS), dtype=np.int64)
+    for i, key in enumerate(keys):
+        for n in coverage[key]:
+            masks[i] |= 1 << n
+            matrix[i, n] = _payout_for(key)
+    matrix.setflags(write=False)
+    masks.setflags(write=False)
+    return keys, index, masks, matrix
+
+
+# Індекс покриття, побудований один раз:
+#   BET_KEYS[i]        - назва ставки
+#   BET_INDEX[key]     - рядок ставки
+#   BET_MASKS[i]       - 37-бітна маска чисел, які виграють
+#   PAYOUT_MATRIX[i,n] - множник виплати ставки i, якщо випало число n
+BET_KEYS, BET_INDEX, BET_MASKS, PAYOUT_MATRIX = _build_tables()
+
+
+def is_valid_bet(bet_key: str) -> bool:
+    """Перевірити, чи існує така ставка на столі."""
+    return bet_key in BET_INDEX
+
+
+def bet_row(bet_key: str) -> int:
+    """Номер рядка ставки в PAYOUT_MATRIX."""
+    try:
+        return BET_INDEX[bet_key]
+    except KeyError:
+        raise ValueError(f"Невідома ставка: {bet_key}")
+
+
+def payout_vector(bet_key: str) -> np.ndarray:
+    """Множники виплати ставки для кожного з 37 чисел."""
+    return PAYOUT_MATRIX[bet_row(bet_key)]
+
+
+def slip_vector(bets: Dict[str, int]) -> np.ndarray:
+    """Перетворити словник ставок (як RouletteGame.active_bets) у вектор сум по рядках."""
+    slip = np.zeros(len(BET_KEYS), dtype=np.int64)
+    # Ключі словника різні, тож і рядки різні: достатньо одного присвоєння за індексами
+    slip[np.fromiter(map(bet_row, bets), np.intp, len(bets))] = np.fromiter(bets.values(), np.int64, len(bets))
+    return slip
+
+
+def slips_matrix(slips: Iterable[Dict[str, int]]) -> np.ndarray:
+    """Зібрати ставки багатьох гравців у матрицю (гравці x ставки)."""
+    slips = list(slips)
+    matrix = np.zeros((len(slips), len(BET_KEYS)), dtype=np.int64)
+    for player, bets in enumerate(slips):
+        for bet_key, amount in bets.items():
+            matrix[player, bet_row(bet_key)] += amount
+    return matrix
+
+
+def settle(bets: Dict[str, int], winner_number: int) -> int:
+    """Сума виграшу (разом зі ставками) для одного набору ставок одним скалярним добутком."""
+    return int(slip_vector(bets) @ PAYOUT_MATRIX[:, winner_number])
+
+
+def settle_many(slips: np.ndarray, winner_number: int) -> np.ndarray:
+    """Розрахувати виграші всіх гравців за одне обертання одним множенням матриці."""
+    return slips @ PAYOUT_MATRIX[:, winner_number]
+
+
+def winning_bets(winner_number: int) -> List[str]:
+    """Усі ставки, які виграють при цьому числі."""
+    bit = 1 << winner_number
+    return [BET_KEYS[i] for i in np.flatnonzero(BET_MASKS & bit)]
+
+
+def spin_parameters(rng: random.Random) -> Tuple[float, float]:
+    """Початкові швидкості колеса і кульки для одного обертання."""
+    return rng.uniform(*SPIN_SPEED_RANGE), rng.uniform(*BALL_SPEED_RANGE)
+
+
+def pocket_at(ball_angle: float) -> int:
+    """Число в секторі, де зупинилась кулька (ball_angle у радіанах)."""
+    sector = int((math.degrees(ball_angle) % 360) // (360 / POCKETS))
+    return WHEEL_NUMBERS[sector]
+
+
+def spin_frames(spin_speed: float) -> int:
+    """Кількість кадрів обертання: не менше MIN_SPIN_FRAMES і поки колесо не сповільниться до STOP_SPIN_SPEED."""
+    frames = max(MIN_SPIN_FRAMES, math.ceil(math.log(STOP_SPIN_SPEED / spin_speed) / math.log(SPIN_DECAY)))
+    # Округлення логарифма може помилитися на кадр в будь-який бік
+    while frames > MIN_SPIN_FRAMES and spin_speed * SPIN_DECAY ** (frames - 1) <= STOP_SPIN_SPEED:
+        frames -= 1
+    while spin_speed * SPIN_DECAY ** frames > STOP_SPIN_SPEED:
+        frames += 1
+    return frames
+
+
+def travel(speed: float, decay: float, frames: int) -> float:
+    """Шлях за frames кадрів, якщо швидкість щокадру множиться на decay (сума геометричної прогресії)."""
+    return speed * (1 - decay ** frames) / (1 - decay)
+
+
+class SpinPlan:
+    """Повна траєкторія одного обертання, обчислена в момент запуску.
+
+    Швидкості спадають геометрично, тому кут колеса і кульки після будь-якого
+    кадру, кількість кадрів і виграшне число відомі одразу. Анімація лише
+    показує цю траєкторію і може пропускати кадри або завершитися миттєво.
+    """
+
+    def __init__(self, angle: float, ball_angle: float, spin_speed: float, ball_speed: float):
+        self.angle = angle
+        self.ball_angle = ball_angle
+        self.spin_speed = spin_speed
+        self.ball_speed = ball_speed
+        self.frames = spin_frames(spin_speed)
+        self.final_angle, self.final_ball_angle = self.at(self.frames)
+        self.winner = pocket_at(self.final_ball_angle)
+
+    @classmethod
+    def from_rng(cls, rng: random.Random, angle: float = 0.0, ball_angle: float = 0.0) -> "SpinPlan":
+        return cls(angle, ball_angle, *spin_parameters(rng))
+
+    @classmethod
+    def replay(cls, record: dict) -> "SpinPlan":
+        """Відтворити обертання із запису {"seed", "angle", "ball_angle"} (див. RouletteGame.history)."""
+        return cls.from_rng(python_random(record["seed"]), record["angle"], record["ball_angle"])
+
+    def at(self, frame: float) -> Tuple[float, float]:
+        """Кути колеса і кульки після frame кадрів (frame може бути дробовим)."""
+        frame = min(max(frame, 0), self.frames)
+        return (self.angle + travel(self.spin_speed, SPIN_DECAY, frame),
+                self.ball_angle + travel(self.ball_speed, BALL_DECAY, frame))
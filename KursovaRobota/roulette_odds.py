@@ -0,0 +1,170 @@
+import argparse
+import time
+from fractions import Fraction
+from functools import reduce
+from math import gcd
+from typing import Dict, Optional
+
+import numpy as np
+
+from roulette_engine import PAYOUT_MATRIX, POCKETS, slip_vector
+
+
+# Стани з імовірністю, меншою за цю, не поширюються далі (їхня сума - SessionOdds.truncated)
+TAIL_EPSILON = 1e-20
+
+
+class SpinDistribution:
+    """Точний розподіл чистого результату одного обертання для набору ставок.
+
+    net[i] - зміна банкролу, pockets[i] - скільки з 37 чисел її дають.
+    """
+
+    def __init__(self, bets: Dict[str, int]):
+        self.bets = dict(bets)
+        self.stake = sum(self.bets.values())
+        returns = slip_vector(self.bets) @ PAYOUT_MATRIX  # виплата разом зі ставками для кожного числа
+        self.net, self.pockets = np.unique(returns - self.stake, return_counts=True)
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self.pockets / POCKETS
+
+    @property
+    def expected(self) -> Fraction:
+        """Точне очікування чистого результату за обертання."""
+        return Fraction(int(self.net @ self.pockets), POCKETS)
+
+    @property
+    def variance(self) -> Fraction:
+        mean = self.expected
+        return sum(Fraction(int(count), POCKETS) * (int(net) - mean) ** 2
+                   for net, count in zip(self.net, self.pockets))
+
+    def as_dict(self) -> Dict[int, Fraction]:
+        return {int(net): Fraction(int(count), POCKETS) for net, count in zip(self.net, self.pockets)}
+
+
+class SessionOdds:
+    """Точний розподіл банкролу після серії однакових обертань.
+
+    Банкрол - ланцюг Маркова з поглинальними станами: розорення (банкрол
+    менший за суму ставок, тож ставку вже не зробити) і, за бажанням,
+    досягнення цілі. Один крок - розріджений перехід: розподіл зсувається
+    на кожен можливий результат обертання (їх зазвичай 2-5), тому крок коштує
+    O(станів x результатів). Стани вимірюються в НСД усіх сум, а ширина
+    розподілу обрізається там, де ймовірність менша за TAIL_EPSILON.
+    """
+
+    def __init__(self, bets: Dict[str, int], bankroll: int, spins: int, target: Optional[int] = None):
+        self.spin = SpinDistribution(bets)
+        self.bankroll = bankroll
+        self.spins = spins
+        self.target = target
+        stake = self.spin.stake
+        if stake <= 0:
+            raise ValueError("Потрібна хоча б одна ставка")
+        if target is not None and target <= bankroll:
+            raise ValueError("Ціль має бути більшою за початковий банкрол")
+
+        amounts = [bankroll, stake] + [abs(int(net)) for net in self.spin.net]
+        if target is not None:
+            amounts.append(target)
+        self.unit = reduce(gcd, amounts)
+
+        deltas = self.spin.net // self.unit
+        probabilities = self.spin.probabilities
+        start = bankroll // self.unit
+        low = stake // self.unit  # стани нижче - розорення
+        max_up = max(int(deltas.max()), 0)
+        if target is not None:
+            high = target // self.unit  # стани від high - ціль досягнуто
+            size = high + max_up
+        else:
+            high = size = start + spins * max_up + 1
+
+        dist = np.zeros(size)
+        dist[start] = 1.0
+        self.ruin_by_spin = np.zeros(spins)
+        self.target_by_spin = np.zeros(spins)
+        self.truncated = 0.0
+
+        top = start  # найвищий стан, з якого ще грають
+        for step in range(spins):
+            if top >= low:
+                active = dist[low:top + 1].copy()
+                dist[low:top + 1] = 0.0
+                for delta, p in zip(deltas, probabilities):
+                    dist[low + delta:top + 1 + delta] += p * active
+                top = min(top + max_up, high - 1)
+                # Обрізати верхній хвіст, де ймовірність уже нехтовно мала
+                live = np.flatnonzero(dist[low:top + 1] > TAIL_EPSILON)
+                new_top = low + int(live[-1]) if len(live) else low - 1
+                if new_top < top:
+                    self.truncated += float(dist[new_top + 1:top + 1].sum())
+                    dist[new_top + 1:top + 1] = 0.0
+                    top = new_top
+            self.ruin_by_spin[step] = dist[:low].sum()
+            self.target_by_spin[step] = dist[high:].sum()
+
+        self.values = np.arange(size) * self.unit
+        self.distribution = dist
+
+    @property
+    def risk_of_ruin(self) -> float:
+        return float(self.ruin_by_spin[-1]) if self.spins else 0.0
+
+    @property
+    def target_probability(self) -> float:
+        return float(self.target_by_spin[-1]) if self.spins else 0.0
+
+    @property
+    def expected_final(self) -> float:
+        return float(self.values @ self.distribution)
+
+    @property
+    def expected_loss(self) -> float:
+        return self.bankroll - self.expected_final
+
+    @property
+    def std_final(self) -> float:
+        return float(np.sqrt(((self.values - self.expected_final) ** 2) @ self.distribution))
+
+    def percentile(self, q: float) -> int:
+        """Найменший банкрол, до якого (включно) потрапляє q відсотків сесій."""
+        cumulative = np.cumsum(self.distribution)
+        return int(self.values[min(np.searchsorted(cumulative, q / 100 - 1e-12), len(self.values) - 1)])
+
+
+def parse_slip(items) -> Dict[str, int]:
+    """Ставки з командного рядка у форматі red=10 number_17=5."""
+    bets: Dict[str, int] = {}
+    for item in items:
+        bet_key, _, amount = item.partition("=")
+        bets[bet_key] = bets.get(bet_key, 0) + int(amount or 10)
+    return bets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Точний ризик розорення для плану гри в рулетку")
+    parser.add_argument("bets", nargs="+", help="ставки на одне обертання: red=10 number_17=5 ...")
+    parser.add_argument("--bankroll", type=int, default=1000)
+    parser.add_argument("--spins", type=int, default=1000)
+    parser.add_argument("--target", type=int, default=None, help="зупинитися, досягнувши цього банкролу")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    odds = SessionOdds(parse_slip(args.bets), args.bankroll, args.spins, args.target)
+    elapsed = time.perf_counter() - started
+
+    spin = odds.spin
+    print(f"Ставка за обертання: {spin.stake}, очікування {float(spin.expected):+.4f} "
+          f"({spin.expected}), дисперсія {float(spin.variance):.2f}")
+    print("Результат обертання: " + ", ".join(f"{net:+d}: {p}" for net, p in spin.as_dict().items()))
+    print(f"Після {odds.spins} обертань (за {elapsed * 1000:.1f} мс):")
+    print(f"  Ризик розорення: {odds.risk_of_ruin:.6f}")
+    if args.target is not None:
+        print(f"  Досягнення цілі {args.target}: {odds.target_probability:.6f}")
+    print(f"  Очікуваний банкрол: {odds.expected_final:.2f} ± {odds.std_final:.2f}, "
+          f"очікувана втрата {odds.expected_loss:.2f}")
+    print("  Перцентилі: " + ", ".join(f"p{q}={odds.percentile(q)}" for q in (5, 25, 50, 75, 95)))
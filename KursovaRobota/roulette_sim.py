@@ -0,0 +1,205 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from roulette_engine import PAYOUT_MATRIX, POCKETS, bet_row
+from rng import SeedStream
+
+
+# Системи ставок: як змінюється кількість одиниць ставки після виграшу і програшу
+FLAT = "flat"
+MARTINGALE = "martingale"
+DALEMBERT = "dalembert"
+FIBONACCI = "fibonacci"
+SYSTEMS = (FLAT, MARTINGALE, DALEMBERT, FIBONACCI)
+
+FIBONACCI_UNITS = np.array([1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987, 1597, 2584, 4181,
+                            6765, 10946, 17711, 28657, 46368, 75025, 121393, 196418, 317811, 514229, 832040],
+                           dtype=np.int64)
+MAX_UNITS = 1 << 40  # Мартингейл без ліміту столу не повинен переповнити int64
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+@dataclass
+class BettingSystemResult:
+    system: str
+    bet: str
+    sessions: int
+    bankroll: int
+    unit: int
+    max_spins: int
+    risk_of_ruin: float          # частка сесій, що втратили банкрол (менше однієї ставки)
+    mean_time_to_ruin: float     # середня кількість обертань до розорення (серед розорених)
+    median_time_to_ruin: float
+    target_rate: float           # частка сесій, що досягли цілі
+    mean_spins: float
+    mean_final: float            # середній банкрол наприкінці сесії
+    std_final: float
+    final_percentiles: Dict[int, float]
+    wagered: float
+    net: float
+    elapsed: float
+    workers: int
+
+    @property
+    def return_to_player(self) -> float:
+        """Повернення на одиницю поставлених фішок (1 - перевага казино)."""
+        return 1 + self.net / self.wagered if self.wagered else 1.0
+
+
+def pocket_payouts(bet: str) -> np.ndarray:
+    """Виплата (разом зі ставкою) за одиницю ставки bet для кожного числа 0..36."""
+    return PAYOUT_MATRIX[bet_row(bet)].astype(np.int64)
+
+
+def next_units(system: str, units: np.ndarray, steps: np.ndarray, won: np.ndarray) -> np.ndarray:
+    """Кількість одиниць наступної ставки для кожної сесії (steps - позиція у Фібоначчі)."""
+    if system == FLAT:
+        return units
+    if system == MARTINGALE:
+        return np.where(won, 1, np.minimum(units * 2, MAX_UNITS))
+    if system == DALEMBERT:
+        return np.where(won, np.maximum(units - 1, 1), units + 1)
+    if system == FIBONACCI:
+        steps[:] = np.where(won, np.maximum(steps - 2, 0), np.minimum(steps + 1, len(FIBONACCI_UNITS) - 1))
+        return FIBONACCI_UNITS[steps]
+    raise ValueError(f"Невідома система ставок: {system}")
+
+
+def simulate_sessions(system: str, bet: str, sessions: int, bankroll: int, unit: int, max_spins: int,
+                      max_bet: Optional[int], target: Optional[int],
+                      seed: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Зіграти sessions сесій паралельно як масиви NumPy.
+
+    На кожному обертанні всі ще активні сесії отримують випадкове число,
+    виплату з PAYOUT_MATRIX і нову ставку за системою. Завершені сесії
+    (розорення, ціль або ліміт обертань) вилучаються з масивів.
+    Повертає фінальні банкроли, кількість зіграних обертань, ознаку
+    розорення і загальну суму ставок.
+    """
+    rng = np.random.default_rng(seed)
+    payouts = pocket_payouts(bet)
+
+    final = np.empty(sessions, dtype=np.int64)
+    spins = np.full(sessions, max_spins, dtype=np.int32)
+    ruined = np.zeros(sessions, dtype=bool)
+    wagered = 0.0
+
+    index = np.arange(sessions)
+    money = np.full(sessions, bankroll, dtype=np.int64)
+    units = np.ones(sessions, dtype=np.int64)
+    steps = np.zeros(sessions, dtype=np.int64)
+
+    for spin in range(1, max_spins + 1):
+        stake = units * unit
+        if max_bet is not None:
+            np.minimum(stake, max_bet, out=stake)
+        np.minimum(stake, money, out=stake)
+        wagered += float(stake.sum())
+
+        paid = payouts[rng.integers(0, POCKETS, size=len(money))]
+        money += stake * (paid - 1)
+        units = next_units(system, units, steps, paid > 0)
+
+        broke = money < unit
+        done = broke if target is None else broke | (money >= target)
+        if done.any():
+            finished = index[done]
+            final[finished] = money[done]
+            spins[finished] = spin
+            ruined[finished] = broke[done]
+            keep = ~done
+            index, money, units, steps = index[keep], money[keep], units[keep], steps[keep]
+            if not len(index):
+                break
+    final[index] = money
+    return final, spins, ruined, wagered
+
+
+def simulate(system: str = FLAT, bet: str = "red", sessions: int = 100_000, bankroll: int = 1000,
+             unit: int = 10, max_spins: int = 1000, max_bet: Optional[int] = None, target: Optional[int] = None,
+             seed: Optional[int] = None, workers: Optional[int] = None,
+             chunk_size: int = 50_000) -> BettingSystemResult:
+    """Оцінити систему ставок на колесі і виплатах RouletteGame.
+
+    Сесії діляться на пачки по chunk_size, які рахуються в пулі процесів;
+    кожна пачка має власний незалежний seed, тому результат при тому самому
+    seed не залежить від кількості процесів.
+    """
+    if system not in SYSTEMS:
+        raise ValueError(f"Невідома система ставок: {system}")
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    seeds = SeedStream(seed)
+    chunks = []
+    done = 0
+    while done < sessions:
+        n = min(chunk_size, sessions - done)
+        chunks.append((system, bet, n, bankroll, unit, max_spins, max_bet, target, seeds.next_seed()))
+        done += n
+
+    if workers == 1 or len(chunks) == 1:
+        parts = [simulate_sessions(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            parts = list(pool.map(simulate_sessions, *zip(*chunks)))
+
+    final = np.concatenate([part[0] for part in parts])
+    spins = np.concatenate([part[1] for part in parts])
+    ruined = np.concatenate([part[2] for part in parts])
+    wagered = sum(part[3] for part in parts)
+    ruin_times = spins[ruined]
+
+    return BettingSystemResult(
+        system=system,
+        bet=bet,
+        sessions=sessions,
+        bankroll=bankroll,
+        unit=unit,
+        max_spins=max_spins,
+        risk_of_ruin=float(ruined.mean()),
+        mean_time_to_ruin=float(ruin_times.mean()) if len(ruin_times) else float("nan"),
+        median_time_to_ruin=float(np.median(ruin_times)) if len(ruin_times) else float("nan"),
+        target_rate=float(np.count_nonzero(final >= target) / sessions) if target is not None else 0.0,
+        mean_spins=float(spins.mean()),
+        mean_final=float(final.mean()),
+        std_final=float(final.std()),
+        final_percentiles=dict(zip(PERCENTILES, np.percentile(final, PERCENTILES).tolist())),
+        wagered=wagered,
+        net=float(final.sum() - bankroll * sessions),
+        elapsed=time.perf_counter() - started,
+        workers=min(workers, len(chunks)),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Симуляція систем ставок у рулетці")
+    parser.add_argument("--system", choices=SYSTEMS + ("all",), default="all")
+    parser.add_argument("--bet", default="red", help="ставка як у RouletteGame: red, number_17, dozen_2 ...")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--bankroll", type=int, default=1000)
+    parser.add_argument("--unit", type=int, default=10)
+    parser.add_argument("--spins", type=int, default=1000, help="максимум обертань за сесію")
+    parser.add_argument("--max-bet", type=int, default=None, help="ліміт ставки столу")
+    parser.add_argument("--target", type=int, default=None, help="завершити сесію, досягнувши цього банкролу")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    for system in SYSTEMS if args.system == "all" else (args.system,):
+        result = simulate(system, args.bet, args.sessions, args.bankroll, args.unit, args.spins, args.max_bet,
+                          args.target, args.seed, args.workers)
+        print(f"{result.system}: {result.sessions} сесій за {result.elapsed:.2f} с ({result.workers} процесів)")
+        print(f"  Ризик розорення: {result.risk_of_ruin:.4f}, обертань до розорення: "
+              f"{result.mean_time_to_ruin:.1f} (медіана {result.median_time_to_ruin:.0f})")
+        if args.target is not None:
+            print(f"  Досягли цілі {args.target}: {result.target_rate:.4f}")
+        print(f"  Фінальний банкрол: {result.mean_final:.1f} ± {result.std_final:.1f}; "
+              + ", ".join(f"p{q}={value:.0f}" for q, value in result.final_percentiles.items()))
+        print(f"  Повернення гравцю: {result.return_to_player * 100:.3f}% від {result.wagered:.0f} поставлених")
@@ -0,0 +1,138 @@
+import argparse
+import threading
+import time
+from array import array
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from game_models import CARDS_PER_DECK, Shoe, shuffled_cards
+from rng import child_seed, python_random
+
+
+class ShufflePrefetcher:
+    """Готує наступне тасування черевика заздалегідь у фоні.
+
+    Shoe.reset() бере вже перетасовані карти через cards(); одразу після
+    цього в executor ставиться тасування з наступним номером. Тасування
+    детерміноване (child_seed(seed, номер)), тому результат той самий, що й
+    без попереднього тасування, а готовий масив лише присвоюється черевику.
+    Якщо потрібне інше тасування (seek, новий seed) або фонове ще не
+    готове, карти тасуються на місці або дочікуються.
+
+    Один екземпляр можна спільно використовувати для багатьох черевиків
+    (наприклад, усіх столів сервера); для симуляцій замість потоку можна
+    передати ProcessPoolExecutor.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None):
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(1, thread_name_prefix="shoe-prefetch")
+        self._lock = threading.Lock()
+        # (колод, seed) -> (номер тасування, майбутні карти): по одному наступному тасуванню на черевик
+        self._pending: Dict[Tuple[int, int], Tuple[int, Future]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def cards(self, decks: int, seed: int, index: int) -> array:
+        """Карти тасування index; наступне тасування починає готуватися у фоні."""
+        with self._lock:
+            pending = self._pending.pop((decks, seed), None)
+        if pending is not None and pending[0] == index:
+            self.hits += 1
+            cards = pending[1].result()
+        else:
+            self.misses += 1
+            cards = shuffled_cards(decks, seed, index)
+        self.prefetch(decks, seed, index + 1)
+        return cards
+
+    def prefetch(self, decks: int, seed: int, index: int) -> None:
+        future = self.executor.submit(shuffled_cards, decks, seed, index)
+        with self._lock:
+            self._pending[(decks, seed)] = (index, future)
+
+    def close(self) -> None:
+        with self._lock:
+            self._pending.clear()
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+
+class ContinuousShoe(Shoe):
+    """Модель машини безперервного тасування (CSM).
+
+    Після кожного раунду всі роздані карти повертаються в машину, тому
+    кожен раунд починається з повного набору, а карта зрізу не потрібна.
+    Карти не тасуються наперед: deal_code() вибирає випадкову карту з тих,
+    що залишились (крок тасування Фішера-Єйтса), тож роздача ніколи не
+    чекає на тасування. Номер тасування - номер раунду, тому state() і
+    seek() працюють так само, як у Shoe.
+    """
+
+    continuous = True
+
+    def __init__(self, decks: int = 1, seed: Optional[int] = None):
+        self._rng = None
+        super().__init__(decks, 1.0, seed)
+
+    def reset(self) -> None:
+        """Повернути всі карти в машину."""
+        self.cards = array('B', range(CARDS_PER_DECK)) * self.decks
+        self._rng = python_random(child_seed(self.seed, self.reshuffles))
+        self.position = 0
+        self.reshuffles += 1
+        for observer in self.observers:
+            observer.shoe_shuffled(self)
+
+    def seek(self, shuffle_index: int, position: int) -> None:
+        self.reshuffles = shuffle_index
+        self.reset()
+        for _ in range(position):
+            self._draw()
+
+    def shuffle_if_needed(self) -> bool:
+        """Перед кожним раундом роздані карти повертаються в машину."""
+        if self.position:
+            self.reset()
+            return True
+        return False
+
+    def deal_code(self) -> int:
+        if self.position >= len(self.cards):
+            self.reset()
+        code = self._draw()
+        for observer in self.observers:
+            observer.card_dealt(code)
+        return code
+
+    def _draw(self) -> int:
+        cards = self.cards
+        pick = self._rng.randrange(self.position, len(cards))
+        cards[self.position], cards[pick] = cards[pick], cards[self.position]
+        self.position += 1
+        return cards[self.position - 1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Час тасування черевика з попереднім тасуванням і без")
+    parser.add_argument("--decks", type=int, default=8)
+    parser.add_argument("--shuffles", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    def reset_time(shoe: Shoe) -> float:
+        """Середній час reset() на потоці, що роздає, у мкс."""
+        total = 0.0
+        for _ in range(args.shuffles):
+            time.sleep(0.0005)  # між тасуваннями роздаються карти, фонове тасування встигає завершитися
+            started = time.perf_counter()
+            shoe.reset()
+            total += time.perf_counter() - started
+        return total / args.shuffles * 1e6
+
+    print(f"Без попереднього тасування: {reset_time(Shoe(args.decks, seed=args.seed)):.1f} мкс")
+    prefetcher = ShufflePrefetcher()
+    print(f"З попереднім тасуванням: {reset_time(Shoe(args.decks, seed=args.seed, shuffler=prefetcher)):.1f} мкс "
+          f"(готових {prefetcher.hits}, на місці {prefetcher.misses})")
+    prefetcher.close()
+    print(f"Машина безперервного тасування: {reset_time(ContinuousShoe(args.decks, seed=args.seed)):.1f} мкс")
@@ -0,0 +1,151 @@
+import argparse
+import os
+import struct
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from game_models import Hand, Card
+from blackjack_engine import HIT, STAND
+from dealer_odds import (CARD_POINTS, POINT_INDEX, BUST_INDEX, FINAL_TOTALS, shoe_composition, add_points,
+                         remove_card, dealer_outcomes, clear_cache)
+
+
+ACTIONS = (STAND, HIT)
+
+MIN_TOTAL = 4
+TABLE_SHAPE = (len(CARD_POINTS), 22, 2, len(ACTIONS))  # відкрита карта дилера, сума, м'яка, дія
+
+TABLE_MAGIC = b"BJEV"
+TABLE_VERSION = 1
+TABLE_HEADER = struct.Struct("<4sHH")
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "strategy_tables")
+
+
+def stand_ev(total: int, upcard: int, counts: Tuple[int, ...]) -> float:
+    """Очікуваний результат (на одиницю ставки), якщо гравець зупиняється на total."""
+    outcomes = dealer_outcomes(upcard, counts)
+    ev = outcomes[BUST_INDEX]
+    for dealer_total, p in zip(FINAL_TOTALS, outcomes):
+        if total > dealer_total:
+            ev += p
+        elif total < dealer_total:
+            ev -= p
+    return ev
+
+
+@lru_cache(maxsize=None)
+def _best_ev(total: int, soft: bool, upcard: int, counts: Tuple[int, ...]) -> float:
+    return max(stand_ev(total, upcard, counts), hit_ev(total, soft, upcard, counts))
+
+
+@lru_cache(maxsize=None)
+def hit_ev(total: int, soft: bool, upcard: int, counts: Tuple[int, ...]) -> float:
+    """Очікуваний результат, якщо взяти карту і далі грати оптимально."""
+    remaining = sum(counts)
+    ev = 0.0
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        p = count / remaining
+        new_total, new_soft = add_points(total, soft, CARD_POINTS[index])
+        if new_total > 21:
+            ev -= p
+        else:
+            ev += p * _best_ev(new_total, new_soft, upcard, remove_card(counts, index))
+    return ev
+
+
+def build_table(decks: int = 1) -> np.ndarray:
+    """Побудувати таблицю EV для всіх сум гравця і відкритих карт дилера."""
+    full = shoe_composition(decks)
+    table = np.full(TABLE_SHAPE, np.nan, dtype=np.float32)
+    for up_index, upcard in enumerate(CARD_POINTS):
+        counts = remove_card(full, up_index)
+        for total in range(MIN_TOTAL, 22):
+            for soft in (False, True):
+                if soft and total < 12:
+                    continue
+                table[up_index, total, int(soft), 0] = stand_ev(total, upcard, counts)
+                table[up_index, total, int(soft), 1] = hit_ev(total, soft, upcard, counts)
+        # Кеші рекурсії для цієї відкритої карти більше не знадобляться
+        _best_ev.cache_clear()
+        hit_ev.cache_clear()
+        clear_cache()
+    return table
+
+
+def table_path(decks: int) -> str:
+    """Шлях до збереженої таблиці для заданої кількості колод."""
+    return os.path.join(TABLE_DIR, f"ev_{decks}deck.bin")
+
+
+class StrategyTable:
+    """Таблиця EV для hit/stand з пошуком за O(1)."""
+
+    def __init__(self, table: np.ndarray, decks: int):
+        self.table = table
+        self.decks = decks
+
+    def ev(self, total: int, soft: bool, upcard: int) -> Dict[str, float]:
+        values = self.table[POINT_INDEX[upcard], total, int(soft)]
+        return {action: float(value) for action, value in zip(ACTIONS, values)}
+
+    def best_action(self, total: int, soft: bool, upcard: int) -> str:
+        """Найкраща дія для суми гравця проти відкритої карти дилера (туз = 11)."""
+        if total >= 21:
+            return STAND
+        stand, hit = self.table[POINT_INDEX[upcard], max(total, MIN_TOTAL), int(soft)]
+        return HIT if hit > stand else STAND
+
+    def advise(self, hand: Hand, upcard: Card) -> str:
+        """Порада для руки Hand проти відкритої карти дилера."""
+        return self.best_action(hand.value, hand.aces > 0, upcard.value)
+
+    def save(self, path: str) -> None:
+        """Зберегти таблицю у компактному двійковому вигляді."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, self.decks))
+            f.write(self.table.astype("<f4").tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "StrategyTable":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, decks = TABLE_HEADER.unpack_from(data)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION:
+            raise ValueError(f"Файл {path} не є таблицею стратегії версії {TABLE_VERSION}")
+        table = np.frombuffer(data, dtype="<f4", offset=TABLE_HEADER.size).reshape(TABLE_SHAPE)
+        return cls(table, decks)
+
+    @classmethod
+    def for_decks(cls, decks: int = 1, path: Optional[str] = None) -> "StrategyTable":
+        """Завантажити таблицю з диска або побудувати і зберегти, якщо її ще немає."""
+        path = path or table_path(decks)
+        if os.path.exists(path):
+            return cls.load(path)
+        strategy = cls(build_table(decks), decks)
+        strategy.save(path)
+        return strategy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Побудова таблиці базової стратегії блекджеку")
+    parser.add_argument("--decks", type=int, default=1)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    strategy = StrategyTable(build_table(args.decks), args.decks)
+    output = args.output or table_path(args.decks)
+    strategy.save(output)
+    print(f"Таблицю для {args.decks} колод побудовано за {time.perf_counter() - started:.1f} с: {output}")
+    for soft in (False, True):
+        print("М'які суми" if soft else "Жорсткі суми")
+        print("     " + " ".join(f"{'A' if up == 11 else up:>2}" for up in CARD_POINTS))
+        for total in range(12 if soft else 8, 22):
+            row = " ".join(f"{strategy.best_action(total, soft, up)[0].upper():>2}" for up in CARD_POINTS)
+            print(f"{total:>4} {row}")
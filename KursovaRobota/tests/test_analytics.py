@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from blackjack_engine import GAME as BLACKJACK_GAME, OUTCOMES, LOSE, WIN as WIN_OUTCOME
+from roulette_engine import GAME as ROULETTE_GAME, bet_row
+from game_models import Player
+from event_log import (BET, REFUND, RESET, SETTLE, SPIN, STAKE, WIN, NO_GAME, BLACKJACK, ROULETTE, RECORD_DTYPE,
+                       EventLog)
+from analytics import ColumnStore, build_rounds, build_stakes, game_report, load_events
+
+
+def event(kind, game, round_number, code=0, amount=0):
+    return (0.0, round_number, code, kind, game, amount, 0)
+
+
+# Два раунди кожної гри впереміш: ставка рулетки робиться, поки рука блекджеку ще не розрахована
+HAND_BUILT_LOG = np.array([
+    event(RESET, NO_GAME, 0, amount=500),
+    event(BET, BLACKJACK, 0, amount=-10),
+    event(BET, ROULETTE, 0, amount=-100),
+    event(STAKE, ROULETTE, 0, bet_row("red"), 100),
+    event(BET, ROULETTE, 0, amount=-50),
+    event(STAKE, ROULETTE, 0, bet_row("number_17"), 50),
+    event(REFUND, ROULETTE, 0, amount=50),
+    event(STAKE, ROULETTE, 0, bet_row("number_17"), -50),
+    event(SETTLE, BLACKJACK, 0, OUTCOMES.index(LOSE), 0),
+    event(BET, BLACKJACK, 1, amount=-20),
+    event(SPIN, ROULETTE, 0, 3),
+    event(WIN, ROULETTE, 0, amount=200),
+    event(SETTLE, ROULETTE, 0, 3, 200),
+    event(BET, ROULETTE, 1, amount=-30),
+    event(STAKE, ROULETTE, 1, bet_row("black"), 30),
+    event(WIN, BLACKJACK, 1, amount=40),
+    event(SETTLE, BLACKJACK, 1, OUTCOMES.index(WIN_OUTCOME), 40),
+    event(SPIN, ROULETTE, 1, 0),
+    event(SETTLE, ROULETTE, 1, 0, 0),
+], dtype=RECORD_DTYPE)
+
+
+def test_rounds_are_grouped_by_game_and_round():
+    rounds = build_rounds(HAND_BUILT_LOG)
+    table = {(int(row["game"]), int(row["round"])): (int(row["wagered"]), int(row["payout"])) for row in rounds}
+    assert table == {
+        (BLACKJACK, 0): (10, 0),
+        (ROULETTE, 0): (100, 200),
+        (BLACKJACK, 1): (20, 40),
+        (ROULETTE, 1): (30, 0),
+    }
+
+
+def test_rtp_and_wagered_per_game():
+    rounds = ColumnStore.from_table(build_rounds(HAND_BUILT_LOG))
+    blackjack, roulette = game_report(rounds, BLACKJACK), game_report(rounds, ROULETTE)
+    assert (blackjack["rounds"], blackjack["wagered"], blackjack["paid"]) == (2, 30, 40)
+    assert blackjack["rtp"] == pytest.approx(40 / 30)
+    assert blackjack["outcomes"][LOSE] == blackjack["outcomes"][WIN_OUTCOME] == 1
+    assert (roulette["rounds"], roulette["wagered"], roulette["paid"]) == (2, 130, 200)
+    assert roulette["rtp"] == pytest.approx(200 / 130)
+    assert roulette["variance"] == pytest.approx(np.var([100, -30]))
+
+
+def test_refunded_stakes_cancel_out():
+    rounds = build_rounds(HAND_BUILT_LOG)
+    stakes = build_stakes(HAND_BUILT_LOG, rounds)
+    assert [(int(row["round"]), int(row["bet"]), int(row["winner"]), int(row["amount"])) for row in stakes] == [
+        (0, bet_row("red"), 3, 100),
+        (1, bet_row("black"), 0, 30),
+    ]
+
+
+def test_unsettled_round_is_not_counted():
+    open_round = np.array([event(BET, BLACKJACK, 2, amount=-10)], dtype=RECORD_DTYPE)
+    rounds = build_rounds(np.concatenate([HAND_BUILT_LOG, open_round]))
+    assert game_report(ColumnStore.from_table(rounds), BLACKJACK)["wagered"] == 30
+
+
+def test_interleaved_session_from_event_log(tmp_path):
+    path = str(tmp_path / "events.bin")
+    events = EventLog(path)
+    player = Player("Гравець", events=events)
+    player.bet(10, BLACKJACK_GAME)
+    player.bet(100, ROULETTE_GAME)
+    events.roulette_bet("red", 100)
+    events.blackjack_settled(LOSE, 0, player.chips)
+    events.spin(1)
+    player.collect(200, game=ROULETTE_GAME)
+    events.roulette_settled(1, 200, player.chips)
+    events.close()
+
+    rounds, stakes = load_events(path)
+    blackjack, roulette = game_report(rounds, BLACKJACK), game_report(rounds, ROULETTE)
+    assert (blackjack["wagered"], blackjack["rtp"]) == (10, 0.0)
+    assert (roulette["wagered"], roulette["paid"], roulette["rtp"]) == (100, 200, 2.0)
+    assert len(stakes) == 1
@@ -0,0 +1,76 @@
+from array import array
+
+import numpy as np
+import pytest
+
+from game_models import CARDS_PER_DECK, Shoe, Player
+from blackjack_engine import BlackjackRound, TableRound, play_round, stand_on_policy
+from blackjack_sim import play_batch, play_table_batch, simulate
+
+
+class RecordedPermutation:
+    """Генератор для play_batch, що запам'ятовує перестановку кожного черевика.
+
+    play_batch переставляє значення карт; з тих самих індексів збираються
+    коди карт для Shoe, тому рушій і симулятор грають однаковими черевиками.
+    """
+
+    def __init__(self, seed: int):
+        self.rng = np.random.default_rng(seed)
+        self.orders = None
+
+    def permuted(self, values: np.ndarray, axis: int) -> np.ndarray:
+        indices = np.tile(np.arange(values.shape[1]), (values.shape[0], 1))
+        self.orders = self.rng.permuted(indices, axis=axis)
+        return np.take_along_axis(values, self.orders, axis=axis)
+
+
+def shoe_from_order(order: np.ndarray, decks: int) -> Shoe:
+    shoe = Shoe(decks, penetration=1.0, seed=0)
+    shoe.cards = array('B', (order % CARDS_PER_DECK).tolist())
+    return shoe
+
+
+@pytest.mark.parametrize("stand_on", [12, 17])
+@pytest.mark.parametrize("decks", [1, 6])
+def test_play_batch_matches_blackjack_round(stand_on, decks):
+    rng = RecordedPermutation(seed=stand_on * 10 + decks)
+    payouts = play_batch(rng, 2000, stand_on=stand_on, decks=decks)
+
+    policy = stand_on_policy(stand_on)
+    for order, payout in zip(rng.orders, payouts):
+        player = Player("Тест")
+        game_round = BlackjackRound(player, shoe_from_order(order, decks))
+        play_round(game_round, 10, policy)
+        assert game_round.payout == payout * 10
+
+
+@pytest.mark.parametrize("seats", [1, 3, 7])
+def test_play_table_batch_matches_table_round(seats):
+    rng = RecordedPermutation(seed=seats)
+    payouts = play_table_batch(rng, 500, seats, decks=2)
+
+    players = [Player(f"Місце {seat}") for seat in range(seats)]
+    for order, table_payouts in zip(rng.orders, payouts):
+        table = TableRound(players, shoe_from_order(order, 2))
+        table.start([10] * seats)
+        while not table.finished:
+            if table.player.hand.value < 17:
+                table.hit()
+            else:
+                table.stand()
+        assert table.payouts.tolist() == (table_payouts * 10).tolist()
+        for player in players:
+            player.reset_chips()
+
+
+def test_play_table_batch_needs_enough_cards():
+    with pytest.raises(ValueError):
+        play_table_batch(np.random.default_rng(0), 10, 7, decks=1)
+
+
+def test_simulate_is_reproducible():
+    first = simulate(20_000, seed=7)
+    second = simulate(20_000, seed=7)
+    assert first.mean_return == second.mean_return
+    assert first.win_rate + first.push_rate + first.loss_rate == pytest.approx(1.0)
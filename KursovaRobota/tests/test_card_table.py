@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import card_table
+from card_table import CARD_GAP, MAX_CARDS, CardRow
+
+
+@pytest.fixture
+def row(monkeypatch):
+    monkeypatch.setattr(card_table, "Canvas", MagicMock())
+    return CardRow(None, 70, 100, bg="black")
+
+
+def test_row_grows_past_max_cards(row):
+    for number in range(MAX_CARDS + 3):
+        assert row.add(text=str(number)) == number
+    assert row.count == len(row.images) == MAX_CARDS + 3
+    assert row.width == (MAX_CARDS + 3) * (70 + CARD_GAP)
+    row.canvas.config.assert_called_with(width=row.width)
+
+
+def test_clear_reuses_items(row):
+    for _ in range(3):
+        row.add(text="A")
+    row.clear()
+    created = row.canvas.create_image.call_count
+    row.add(text="K")
+    assert (row.count, row.canvas.create_image.call_count) == (1, created)
@@ -0,0 +1,57 @@
+import pytest
+
+from game_models import CARD_VALUES, CARDS_PER_DECK, RANKS, Shoe
+from counting import HI_LO, CountTracker
+
+
+def test_running_and_true_count_follow_dealt_cards():
+    shoe = Shoe(6, seed=2)
+    tracker = CountTracker(shoe)
+    running = 0
+    for dealt in range(1, 150):
+        running += HI_LO[CARD_VALUES[shoe.deal_code()]]
+        assert tracker.running_count == running
+        assert tracker.cards_seen == dealt
+        assert tracker.cards_left == shoe.remaining()
+        assert tracker.true_count == pytest.approx(running / (shoe.remaining() / CARDS_PER_DECK))
+
+
+def test_remaining_ranks_match_shoe():
+    shoe = Shoe(2, seed=3)
+    tracker = CountTracker(shoe)
+    for _ in range(40):
+        shoe.deal_code()
+    remaining = dict.fromkeys(RANKS, 0)
+    for code in shoe.cards[shoe.position:]:
+        remaining[RANKS[code % len(RANKS)]] += 1
+    assert tracker.remaining_ranks() == remaining
+
+
+def test_full_shoe_counts_back_to_zero():
+    shoe = Shoe(1, penetration=1.0, seed=4)
+    tracker = CountTracker(shoe)
+    for _ in range(CARDS_PER_DECK):
+        shoe.deal_code()
+    assert tracker.running_count == 0
+    assert tracker.true_count == 0.0
+
+
+def test_shuffle_resets_count():
+    shoe = Shoe(6, penetration=0.5, seed=5)
+    tracker = CountTracker(shoe)
+    while not shoe.cut_card_reached:
+        shoe.deal_code()
+    assert tracker.cards_seen
+    shoe.shuffle_if_needed()
+    assert (tracker.running_count, tracker.cards_seen, tracker.cards_left) == (0, 0, 6 * CARDS_PER_DECK)
+
+
+@pytest.mark.parametrize("running, decks_left, units, advantage", [
+    (-6, 3, 1, False), (3, 3, 1, False), (6, 3, 2, True), (60, 3, 8, True),
+])
+def test_bet_units_and_advantage(running, decks_left, units, advantage):
+    tracker = CountTracker(Shoe(6, seed=6))
+    tracker.running_count = running
+    tracker.cards_left = decks_left * CARDS_PER_DECK
+    assert tracker.bet_units() == units
+    assert tracker.advantage() is advantage
@@ -0,0 +1,71 @@
+from functools import lru_cache
+
+import pytest
+
+from dealer_odds import (BUST, BUST_INDEX, CARD_POINTS, OUTCOME_KEYS, POINT_INDEX, DealerOdds, add_points,
+                         dealer_distribution, dealer_outcomes, remove_card, shoe_composition)
+from blackjack_engine import DEALER_STAND_VALUE
+
+
+def composition(**cards):
+    """Склад черевика з кількох значень, наприклад composition(p7=1, p10=1)."""
+    counts = [0] * len(CARD_POINTS)
+    for name, count in cards.items():
+        counts[POINT_INDEX[int(name[1:])]] = count
+    return tuple(counts)
+
+
+@lru_cache(maxsize=None)
+def infinite_deck(total, soft):
+    """Ймовірності для нескінченної колоди: кожна карта 1/13, десятка 4/13."""
+    if total > 21:
+        return tuple(float(key == BUST) for key in OUTCOME_KEYS)
+    if total >= DEALER_STAND_VALUE:
+        return tuple(float(key == total) for key in OUTCOME_KEYS)
+    result = [0.0] * len(OUTCOME_KEYS)
+    for points in CARD_POINTS:
+        p = (4 if points == 10 else 1) / 13
+        for i, q in enumerate(infinite_deck(*add_points(total, soft, points))):
+            result[i] += p * q
+    return tuple(result)
+
+
+@pytest.mark.parametrize("decks", [1, 6])
+def test_probabilities_sum_to_one(decks):
+    counts = shoe_composition(decks)
+    for upcard in CARD_POINTS:
+        assert sum(dealer_outcomes(upcard, remove_card(counts, POINT_INDEX[upcard]))) == pytest.approx(1.0)
+
+
+def test_exact_distribution_of_a_small_shoe():
+    # Закрита карта: 7 (17) або 10 (20), по 1/2
+    assert dealer_distribution(10, composition(p7=1, p10=1)) == {17: 0.5, 18: 0.0, 19: 0.0, 20: 0.5, 21: 0.0,
+                                                                  BUST: 0.0}
+    # 6 + 10 = 16, дилер бере ще десятку і перебирає
+    assert dealer_distribution(6, composition(p10=2))[BUST] == 1.0
+    # Туз і закрита 6 - м'які 17, дилер стоїть; туз і 10 - 21
+    distribution = dealer_distribution(11, composition(p6=1, p10=1))
+    assert (distribution[17], distribution[21], distribution[BUST]) == (0.5, 0.5, 0.0)
+
+
+def test_many_decks_approach_infinite_deck():
+    counts = shoe_composition(1000)
+    for upcard in CARD_POINTS:
+        exact = dealer_outcomes(upcard, remove_card(counts, POINT_INDEX[upcard]))
+        assert exact == pytest.approx(infinite_deck(upcard, upcard == 11), abs=1e-3)
+
+
+@pytest.mark.parametrize("upcard, bust", [(2, 0.3536), (5, 0.4165), (6, 0.4232), (7, 0.2623), (10, 0.2122)])
+def test_known_infinite_deck_bust_rates(upcard, bust):
+    # Дилер стоїть на будь-яких 17, без перевірки закритої карти на блекджек
+    assert infinite_deck(upcard, upcard == 11)[BUST_INDEX] == pytest.approx(bust, abs=5e-4)
+
+
+def test_tracker_matches_function():
+    odds = DealerOdds(decks=1)
+    for rank in ("6", "king", "9"):
+        odds.remove(rank)
+    counts = remove_card(remove_card(remove_card(shoe_composition(1), POINT_INDEX[6]), POINT_INDEX[10]),
+                         POINT_INDEX[9])
+    assert odds.outcomes(6) == dealer_outcomes(6, counts)
+    assert odds.bust_probability(6) == odds.distribution(6)[BUST]
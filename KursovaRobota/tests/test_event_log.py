@@ -0,0 +1,81 @@
+import pytest
+
+from game_models import Shoe, Player
+from blackjack_engine import BlackjackRound
+from roulette_engine import GAME as ROULETTE_GAME
+from event_log import (BET, DEAL, NO_GAME, RESET, SETTLE, STAKE, WIN, BLACKJACK, ROULETTE, EventLog,
+                       EventLogReader)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "events.bin")
+
+
+def play_interleaved(events: EventLog, rounds: int = 3) -> Player:
+    """Ставка рулетки робиться до розрахунку кожної руки блекджеку, виплата рулетки - після."""
+    player = Player("Гравець", events=events)
+    player.chips = 10 ** 6
+    shoe = Shoe(6, seed=41)
+    shoe.add_observer(events)
+    game_round = BlackjackRound(player, shoe, events=events)
+    for number in range(rounds):
+        game_round.start(10)
+        player.bet(100, ROULETTE_GAME)
+        events.roulette_bet("red", 100)
+        game_round.stand()
+        events.spin(number)
+        player.collect(200, game=ROULETTE_GAME)
+        events.roulette_settled(number, 200, player.chips)
+    return player
+
+
+def test_chip_records_carry_their_game_and_round(log_path):
+    events = EventLog(log_path)
+    play_interleaved(events)
+    events.close()
+
+    records = EventLogReader(log_path).records
+    assert not (records["game"] == NO_GAME).any()
+    for game in (BLACKJACK, ROULETTE):
+        settles = records[(records["kind"] == SETTLE) & (records["game"] == game)]
+        assert settles["round"].tolist() == [0, 1, 2]
+        for number in range(3):
+            in_round = records[(records["game"] == game) & (records["round"] == number)]
+            assert (in_round["kind"] == SETTLE).sum() == 1
+            bets = in_round[in_round["kind"] == BET]
+            assert bets["amount"].tolist() == ([-10] if game == BLACKJACK else [-100])
+
+    roulette = records[records["game"] == ROULETTE]
+    assert set(roulette["kind"][roulette["round"] == 0]) >= {BET, STAKE, WIN, SETTLE}
+    assert (records["kind"][records["game"] == BLACKJACK] == DEAL).any()
+
+
+def test_reader_round_selects_one_game(log_path):
+    events = EventLog(log_path)
+    play_interleaved(events, rounds=2)
+    events.close()
+
+    reader = EventLogReader(log_path)
+    first = reader.round(ROULETTE, 1)
+    assert set(first["game"]) == {ROULETTE}
+    assert first["amount"][first["kind"] == SETTLE].tolist() == [200]
+
+
+def test_reopened_log_continues_each_game(log_path):
+    events = EventLog(log_path)
+    play_interleaved(events, rounds=2)
+    events.close()
+
+    events = EventLog(log_path)
+    assert events.rounds == {BLACKJACK: 2, ROULETTE: 2}
+    player = play_interleaved(events, rounds=1)
+    player.reset_chips()
+    events.close()
+
+    records = EventLogReader(log_path).records
+    last_settles = records[records["kind"] == SETTLE][-2:]
+    assert last_settles["round"].tolist() == [2, 2]
+    reset = records[records["kind"] == RESET]
+    assert reset["game"].tolist() == [NO_GAME]
+
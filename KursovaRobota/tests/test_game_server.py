@@ -0,0 +1,193 @@
+import asyncio
+import json
+
+import pytest
+
+from game_models import Player
+from blackjack_engine import MAX_SEATS
+from game_server import BlackjackTable, GameServer, ProtocolError, bet_amount
+
+
+@pytest.mark.parametrize("amount, expected", [(10, 10), ("25", 25)])
+def test_bet_amount_accepts_positive_integers(amount, expected):
+    assert bet_amount({"amount": amount}) == expected
+
+
+@pytest.mark.parametrize("amount", [0, -500, "-5", "abc", "1.5e3", 1.5, True, None, [10]])
+def test_bet_amount_rejects_invalid_amounts(amount):
+    with pytest.raises(ProtocolError):
+        bet_amount({"amount": amount})
+
+
+@pytest.mark.parametrize("amount", [0, -10])
+def test_player_rejects_non_positive_bet(amount):
+    player = Player("Тест")
+    chips = player.chips
+    with pytest.raises(ValueError):
+        player.bet(amount)
+    assert player.chips == chips
+
+
+def run_session(requests, game_server=None):
+    """Прогнати запити через GameServer.handle_client по справжньому TCP-з'єднанню."""
+    game_server = game_server or GameServer(seed=1)
+
+    async def session():
+        server = await asyncio.start_server(game_server.handle_client, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for request in requests:
+            line = request if isinstance(request, bytes) else json.dumps(request).encode() + b"\n"
+            writer.write(line)
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    return asyncio.run(session())
+
+
+@pytest.mark.parametrize("game, extra", [("blackjack", {}), ("roulette", {"bet_type": "red"})])
+def test_invalid_bets_get_error_reply_and_keep_connection(game, extra):
+    bad_amounts = [-500, 0, "abc", 1.5, None]
+    responses = run_session(
+        [{"id": 0, "op": "join", "game": game, "table": "t1", "name": "Гравець"}]
+        + [dict(extra, id=i + 1, op="bet", amount=amount) for i, amount in enumerate(bad_amounts)]
+        + [{"id": 99, "op": "state"}]
+    )
+
+    assert responses[0]["ok"]
+    start_chips = responses[0]["state"]["chips"]
+    for response in responses[1:-1]:
+        assert response["ok"] is False
+        assert response["error"]
+    assert responses[-1]["ok"]
+    assert responses[-1]["state"]["chips"] == start_chips
+
+
+def test_protocol_errors_are_reported():
+    responses = run_session([
+        b"not json\n",
+        b"[1]\n",
+        b"3\n",
+        b"\"x\"\n",
+        b"null\n",
+        {"id": 1, "op": "hit"},
+        {"id": 2, "op": "join", "game": "poker", "table": "t1"},
+        {"id": 3, "op": "join", "game": "blackjack", "table": "t1", "name": "Гравець"},
+        {"id": 4, "op": "bet"},
+        {"id": 5, "op": "bet", "amount": 100},
+    ])
+    assert [response["ok"] for response in responses] == [False] * 7 + [True, False, True]
+    assert all(response["error"] for response in responses[1:5])
+    assert responses[-1]["state"]["bet"] == 100
+
+
+def finish_turns(table: BlackjackTable) -> None:
+    while table.in_round:
+        table.handle(table.game_round.player.name, "stand", {})
+
+
+def test_blackjack_table_seats_share_one_dealer():
+    table = BlackjackTable("bj", seed=51)
+    for name in ("А", "Б", "В"):
+        table.join(name)
+
+    assert not table.handle("А", "bet", {"amount": 10})["player"]["cards"]
+    table.handle("Б", "bet", {"amount": 20})
+    state = table.handle("В", "bet", {"amount": 30})
+    assert table.game_round is not None and state["bet"] == 30
+    states = [table.state(name) for name in ("А", "Б", "В")]
+    assert len({str(s["dealer"]) for s in states}) == 1
+    assert [s["bet"] for s in states] == [10, 20, 30]
+
+    finish_turns(table)
+    for name, bet in (("А", 10), ("Б", 20), ("В", 30)):
+        state = table.state(name)
+        assert state["finished"] and state["outcome"] is not None
+        assert state["chips"] == 1000 - bet + state["payout"]
+        assert state["dealer"]["value"] == table.dealer.hand.value
+
+
+def test_only_current_seat_may_move():
+    table = BlackjackTable("bj", seed=52)
+    table.join("А")
+    table.join("Б")
+    with pytest.raises(ProtocolError):
+        table.handle("А", "hit", {})
+    table.handle("А", "bet", {"amount": 10})
+    table.handle("Б", "bet", {"amount": 10})
+    while table.in_round:
+        turn = table.state("А")["turn"]
+        other = "Б" if turn == "А" else "А"
+        with pytest.raises(ProtocolError):
+            table.handle(other, "stand", {})
+        with pytest.raises(ProtocolError):
+            table.handle(other, "bet", {"amount": 10})
+        table.handle(turn, "stand", {})
+
+
+def test_deal_starts_round_without_waiting_for_everyone():
+    table = BlackjackTable("bj", seed=53)
+    table.join("А")
+    table.join("Глядач")
+    with pytest.raises(ProtocolError):
+        table.handle("А", "deal", {})
+    table.handle("А", "bet", {"amount": 10})
+    assert not table.in_round
+    table.handle("Глядач", "deal", {})
+    assert [player.name for player in table.game_round.players] == ["А"]
+    finish_turns(table)
+    assert table.state("Глядач")["outcome"] is None
+    assert table.state("Глядач")["chips"] == 1000
+
+
+def test_leaving_mid_round_stands_and_frees_seat():
+    table = BlackjackTable("bj", seed=54)
+    table.join("А")
+    table.join("Б")
+    table.handle("А", "bet", {"amount": 10})
+    table.handle("Б", "bet", {"amount": 10})
+    leaving = table.state("А")["turn"]
+    if leaving is None:
+        pytest.skip("обидва місця отримали блекджек")
+    table.leave(leaving)
+    assert table.state("Б" if leaving == "А" else "А")["turn"] != leaving
+    finish_turns(table)
+    assert leaving not in table.players
+
+
+def test_leaving_player_unblocks_waiting_bets():
+    table = BlackjackTable("bj", seed=55)
+    table.join("А")
+    table.join("Б")
+    table.handle("А", "bet", {"amount": 10})
+    table.leave("Б")
+    assert table.game_round is not None
+    assert [player.name for player in table.game_round.players] == ["А"]
+
+
+def test_table_has_limited_seats():
+    table = BlackjackTable("bj", seed=56)
+    for seat in range(MAX_SEATS):
+        table.join(str(seat))
+    with pytest.raises(ProtocolError):
+        table.join("зайвий")
+
+
+def test_join_full_table_keeps_current_seat():
+    game_server = GameServer(seed=1)
+    full = game_server.get_table("blackjack", "full")
+    for seat in range(MAX_SEATS):
+        full.join(str(seat))
+    responses = run_session([
+        {"id": 1, "op": "join", "game": "blackjack", "table": "home", "name": "Гравець"},
+        {"id": 2, "op": "join", "game": "blackjack", "table": "full", "name": "Гравець"},
+        {"id": 3, "op": "bet", "amount": 10},
+    ], game_server)
+    assert [response["ok"] for response in responses] == [True, False, True]
+    assert responses[-1]["state"]["bet"] == 10
+    assert "Гравець" not in full.players
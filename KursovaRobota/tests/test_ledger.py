@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from game_models import Player
+from ledger import BET, WIN, Ledger
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "ledger.db")
+
+
+def snapshots(path):
+    connection = sqlite3.connect(path)
+    try:
+        return dict(connection.execute("SELECT player, balance FROM snapshots").fetchall())
+    finally:
+        connection.close()
+
+
+def test_balance_survives_close_and_reopen(db_path):
+    ledger = Ledger(db_path)
+    player = Player("Гравець", ledger)
+    player.bet(100)
+    player.collect(250)
+    player.bet(30)
+    ledger.close()
+
+    ledger = Ledger(db_path)
+    assert ledger.restore("Гравець") == 1000 - 100 + 250 - 30
+    assert ledger.restore("Інший") is None
+    assert [row[1:] for row in ledger.history("Гравець")] == [(BET, -30, 1120), (WIN, 250, 1150), (BET, -100, 900)]
+    ledger.close()
+
+
+def test_close_writes_pending_records_and_snapshot(db_path):
+    ledger = Ledger(db_path, flush_interval=60.0, snapshot_every=10 ** 6)
+    for i in range(1, 2001):
+        ledger.record("Гравець", WIN, 1, 1000 + i)
+    ledger.close()
+
+    connection = sqlite3.connect(db_path)
+    assert connection.execute("SELECT COUNT(*) FROM events").fetchone() == (2000,)
+    connection.close()
+    assert snapshots(db_path) == {"Гравець": 3000}
+
+
+def test_snapshot_every_n_records_and_restore_from_tail(db_path):
+    ledger = Ledger(db_path, batch_size=5, snapshot_every=10)
+    for i in range(1, 13):
+        ledger.record("Гравець", WIN, 1, 1000 + i)
+        ledger.flush()
+    assert snapshots(db_path) == {"Гравець": 1010}
+    assert ledger.restore("Гравець") == 1012
+    ledger.close()
+
+
+def test_flush_waits_for_writer(db_path):
+    ledger = Ledger(db_path)
+    ledger.record("Гравець", BET, -10, 990)
+    assert ledger.flush(timeout=5)
+    assert ledger.restore("Гравець") == 990
+    ledger.close()
+
+
+def test_closed_ledger_rejects_records(db_path):
+    ledger = Ledger(db_path)
+    ledger.close()
+    ledger.close()
+    with pytest.raises(RuntimeError):
+        ledger.record("Гравець", BET, -10, 990)
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from game_models import Shoe, Player
+from shuffler import ContinuousShoe
+from blackjack_engine import BlackjackRound, play_round, replay_round, stand_on_policy
+from roulette_engine import SpinPlan
+from rng import SeedStream, python_random
+
+
+def cards(hand):
+    return [(card.rank, card.suit) for card in hand.cards]
+
+
+@pytest.mark.parametrize("shoe_class", [Shoe, ContinuousShoe])
+def test_seek_restores_saved_state(shoe_class):
+    shoe = shoe_class(2, seed=11)
+    for _ in range(300):
+        shoe.deal_code()
+    state = shoe.state()
+    upcoming = [shoe.deal_card() for _ in range(20)]
+
+    restored = shoe_class(2, seed=state[0])
+    restored.seek(*state[1:])
+    assert [restored.deal_card() for _ in range(20)] == upcoming
+
+
+@pytest.mark.parametrize("shoe", [Shoe(6, seed=13), Shoe(1, penetration=0.6, seed=14), ContinuousShoe(6, seed=15)],
+                         ids=["6-decks", "1-deck", "continuous"])
+def test_replay_round_reproduces_every_round(shoe):
+    player = Player("Тест")
+    player.chips = 10 ** 6
+    game_round = BlackjackRound(player, shoe)
+    choose = random.Random(0)
+    for _ in range(300):
+        play_round(game_round, 10, stand_on_policy(choose.choice([12, 15, 17])))
+        replayed = replay_round(game_round.record())
+        assert cards(replayed.player.hand) == cards(player.hand)
+        assert cards(replayed.dealer.hand) == cards(game_round.dealer.hand)
+        assert (replayed.outcome, replayed.payout) == (game_round.outcome, game_round.payout)
+
+
+def test_seed_stream_is_deterministic():
+    first, second = SeedStream(21), SeedStream(21)
+    seeds = [first.next_seed() for _ in range(5)]
+    assert seeds == [second.next_seed() for _ in range(5)]
+    assert len(set(seeds)) == len(seeds)
+
+
+def test_spin_plan_replay():
+    seeds = SeedStream(22)
+    angle, ball_angle = 0.0, 0.0
+    for _ in range(20):
+        seed = seeds.next_seed()
+        plan = SpinPlan.from_rng(python_random(seed), angle, ball_angle)
+        record = {"seed": seed, "angle": angle, "ball_angle": ball_angle}
+        replayed = SpinPlan.replay(record)
+        assert replayed.winner == plan.winner
+        assert replayed.at(plan.frames) == plan.at(plan.frames)
+        angle, ball_angle = plan.at(plan.frames)
@@ -0,0 +1,91 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from roulette_engine import (BET_KEYS, BET_MASKS, NUMBER_COLORS, PAYOUT_MATRIX, POCKETS, WHEEL_NUMBERS, bet_row,
+                             is_valid_bet, settle, settle_many, slip_vector, slips_matrix, winning_bets)
+
+
+def covered(bet_key):
+    return [n for n in range(POCKETS) if PAYOUT_MATRIX[bet_row(bet_key), n]]
+
+
+def layout_position(number):
+    """Рядок і колонка числа на полі 12 x 3."""
+    return (number - 1) // 3, (number - 1) % 3
+
+
+def test_bet_counts_per_kind():
+    kinds = Counter(key.split("_")[0] for key in BET_KEYS)
+    assert kinds == {"number": 37, "split": 60, "street": 12, "corner": 22, "sixline": 11, "dozen": 3, "column": 3,
+                     "red": 1, "black": 1, "green": 1, "even": 1, "odd": 1, "1-18": 1, "19-36": 1}
+    assert len(BET_KEYS) == 155
+
+
+def test_splits_join_neighbouring_numbers():
+    for key in BET_KEYS:
+        if not key.startswith("split_"):
+            continue
+        a, b = covered(key)
+        if a == 0:
+            assert b in (1, 2, 3)
+            continue
+        (row_a, col_a), (row_b, col_b) = layout_position(a), layout_position(b)
+        assert abs(row_a - row_b) + abs(col_a - col_b) == 1, key
+
+
+def test_corners_and_six_lines_are_blocks_of_the_layout():
+    for key in BET_KEYS:
+        kind = key.split("_")[0]
+        if kind not in ("corner", "sixline"):
+            continue
+        rows, cols = zip(*map(layout_position, covered(key)))
+        if kind == "corner":
+            assert len(set(rows)) == 2 and len(set(cols)) == 2, key
+        else:
+            assert len(set(rows)) == 2 and len(set(cols)) == 3, key
+        assert max(rows) - min(rows) == 1
+
+
+def test_colors_match_wheel():
+    assert sorted(WHEEL_NUMBERS) == list(range(POCKETS))
+    assert covered("red") == [n for n in range(1, POCKETS) if NUMBER_COLORS[n] == "red"]
+    assert len(covered("red")) == len(covered("black")) == 18
+
+
+def test_every_bet_returns_36_over_all_pockets():
+    # Однонульова рулетка: виплата x кількість чисел = 36 для кожної ставки, тобто RTP 36/37
+    assert (PAYOUT_MATRIX.sum(axis=1) == 36).all()
+
+
+def test_masks_match_payout_matrix():
+    bits = (BET_MASKS[:, None] >> np.arange(POCKETS)) & 1
+    assert ((PAYOUT_MATRIX > 0) == bits.astype(bool)).all()
+    for number in range(POCKETS):
+        assert winning_bets(number) == [key for key in BET_KEYS if number in covered(key)]
+
+
+def test_settle_matches_manual_payout():
+    bets = {"red": 10, "number_17": 5, "split_17_20": 10, "dozen_2": 25, "column_2": 4}
+    # 17 - чорне, друга дюжина, друга колонка
+    assert settle(bets, 17) == 5 * 36 + 10 * 18 + 25 * 3 + 4 * 3
+    assert settle(bets, 0) == 0
+    assert settle({}, 5) == 0
+
+
+def test_settle_matches_settle_many():
+    choose = random.Random(61)
+    slips = [{key: choose.randrange(1, 50) for key in choose.sample(BET_KEYS, choose.randrange(1, 20))}
+             for _ in range(200)]
+    matrix = slips_matrix(slips)
+    for number in range(POCKETS):
+        assert settle_many(matrix, number).tolist() == [settle(slip, number) for slip in slips]
+    assert (matrix == np.array([slip_vector(slip) for slip in slips])).all()
+
+
+def test_unknown_bet_is_rejected():
+    assert not is_valid_bet("split_3_4")
+    with pytest.raises(ValueError):
+        settle({"split_3_4": 10}, 3)
@@ -0,0 +1,52 @@
+from fractions import Fraction
+from math import comb
+
+import numpy as np
+import pytest
+
+from roulette_odds import SessionOdds, SpinDistribution, parse_slip
+
+P_RED = 18 / 37
+
+
+def test_spin_distribution_is_exact():
+    spin = SpinDistribution({"red": 10, "number_17": 5})
+    # 17 чорне: виграє лише число; червоне: лише колір; решта (зокрема 0) - програш
+    assert spin.as_dict() == {-15: Fraction(18, 37), 5: Fraction(18, 37), 165: Fraction(1, 37)}
+    assert spin.expected == Fraction(-15, 37)
+    red = SpinDistribution({"red": 10})
+    assert red.variance == 100 - Fraction(10, 37) ** 2
+
+
+def test_even_money_session_is_binomial():
+    odds = SessionOdds({"red": 10}, bankroll=1000, spins=12)
+    expected = np.zeros_like(odds.distribution)
+    for wins in range(13):
+        expected[(1000 + 10 * (2 * wins - 12)) // odds.unit] = comb(12, wins) * P_RED ** wins * (1 - P_RED) ** (12 - wins)
+    assert odds.distribution == pytest.approx(expected, abs=1e-15)
+    assert odds.risk_of_ruin == 0.0
+    assert odds.expected_loss == pytest.approx(12 * 10 / 37)
+
+
+def test_absorbing_values_match_gamblers_ruin():
+    # Ставка 10 на червоне з 50 до 100: класична задача про розорення гравця з кроком 10
+    odds = SessionOdds({"red": 10}, bankroll=50, spins=5000, target=100)
+    ratio = (1 - P_RED) / P_RED
+    win = (1 - ratio ** 5) / (1 - ratio ** 10)
+    assert odds.target_probability == pytest.approx(win, abs=1e-12)
+    assert odds.risk_of_ruin == pytest.approx(1 - win, abs=1e-12)
+    assert (np.diff(odds.ruin_by_spin) >= 0).all()
+
+
+def test_single_all_in_spin():
+    odds = SessionOdds({"red": 10}, bankroll=10, spins=1)
+    assert odds.risk_of_ruin == pytest.approx(19 / 37)
+    assert odds.percentile(50) == 0 and odds.percentile(95) == 20
+
+
+def test_invalid_plans_are_rejected():
+    with pytest.raises(ValueError):
+        SessionOdds({}, bankroll=100, spins=10)
+    with pytest.raises(ValueError):
+        SessionOdds({"red": 10}, bankroll=100, spins=10, target=100)
+    assert parse_slip(["red=10", "red", "number_17=5"]) == {"red": 20, "number_17": 5}
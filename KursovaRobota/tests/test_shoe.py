@@ -0,0 +1,62 @@
+from collections import Counter
+
+import pytest
+
+from game_models import CARDS_PER_DECK, CARD_TUPLES, MAX_DECKS, Shoe
+
+
+@pytest.mark.parametrize("decks", [1, 6, MAX_DECKS])
+def test_shoe_holds_every_card_decks_times(decks):
+    shoe = Shoe(decks, seed=1)
+    assert len(shoe.cards) == CARDS_PER_DECK * decks
+    assert Counter(shoe.cards) == {code: decks for code in range(CARDS_PER_DECK)}
+    assert sum(shoe.composition()) == shoe.remaining() == CARDS_PER_DECK * decks
+
+
+@pytest.mark.parametrize("decks, penetration", [(0, 0.75), (MAX_DECKS + 1, 0.75), (6, 0), (6, 1.5)])
+def test_invalid_shoe_is_rejected(decks, penetration):
+    with pytest.raises(ValueError):
+        Shoe(decks, penetration)
+
+
+def test_deal_moves_position_without_removing_cards():
+    shoe = Shoe(2, seed=3)
+    expected = [CARD_TUPLES[code] for code in shoe.cards[:10]]
+    assert [shoe.deal_card() for _ in range(10)] == expected
+    assert shoe.position == 10
+    assert len(shoe.cards) == 2 * CARDS_PER_DECK
+    assert shoe.remaining() == 2 * CARDS_PER_DECK - 10
+
+
+def test_shuffle_only_after_cut_card():
+    shoe = Shoe(6, penetration=0.5, seed=4)
+    assert shoe.cut_card == 6 * CARDS_PER_DECK // 2
+
+    for _ in range(shoe.cut_card - 1):
+        shoe.deal_code()
+    assert not shoe.cut_card_reached
+    assert not shoe.shuffle_if_needed()
+
+    shoe.deal_code()
+    assert shoe.cut_card_reached
+    assert shoe.shuffle_if_needed()
+    assert shoe.position == 0
+    assert shoe.reshuffles == 2
+
+
+def test_empty_shoe_reshuffles_mid_round():
+    shoe = Shoe(1, penetration=1.0, seed=5)
+    for _ in range(CARDS_PER_DECK):
+        shoe.deal_code()
+    shoe.deal_code()
+    assert shoe.position == 1
+    assert shoe.reshuffles == 2
+
+
+def test_same_seed_gives_same_shuffles():
+    first, second = Shoe(6, seed=9), Shoe(6, seed=9)
+    for _ in range(3):
+        assert first.cards == second.cards
+        first.reset()
+        second.reset()
+    assert first.cards != Shoe(6, seed=10).cards
@@ -0,0 +1,120 @@
+import random
+
+import numpy as np
+import pytest
+
+from game_models import Shoe, Hand, Player
+from blackjack_engine import (MAX_SEATS, OUTCOMES, BlackjackRound, TableRound, draw_card, play_dealer, play_round,
+                              settle, settle_seats, stand_on_policy)
+
+
+def cards(hand):
+    return [(card.rank, card.suit) for card in hand.cards]
+
+
+def play_table(table: TableRound, bets, stand_on: int = 17) -> None:
+    table.start(bets)
+    while not table.finished:
+        if table.player.hand.value < stand_on:
+            table.hit()
+        else:
+            table.stand()
+
+
+def test_settle_seats_matches_settle():
+    shoe = Shoe(6, seed=31)
+    choose = random.Random(31)
+    totals, card_counts, dealer_totals, bets, expected = [], [], [], [], []
+    for _ in range(5000):
+        shoe.shuffle_if_needed()
+        player_hand, dealer_hand = Hand(), Hand()
+        for _ in range(2):
+            draw_card(shoe, player_hand)
+            draw_card(shoe, dealer_hand)
+        stand_on = choose.choice([12, 15, 17, 19])
+        while player_hand.value < stand_on:
+            draw_card(shoe, player_hand)
+        # Як у BlackjackRound: проти перебору дилер не добирає
+        if player_hand.value <= 21:
+            play_dealer(shoe, dealer_hand)
+        bet = choose.randrange(1, 501)
+
+        totals.append(player_hand.value)
+        card_counts.append(len(player_hand.cards))
+        dealer_totals.append(dealer_hand.value)
+        bets.append(bet)
+        expected.append(settle(player_hand, dealer_hand, bet))
+
+    outcomes, payouts = settle_seats(totals, card_counts, dealer_totals, bets)
+    assert [(OUTCOMES[outcome], int(payout)) for outcome, payout in zip(outcomes, payouts)] == expected
+
+
+def test_player_bust_loses_even_if_dealer_busts():
+    outcomes, payouts = settle_seats([25, 18], [3, 2], 24, [10, 10])
+    assert [OUTCOMES[outcome] for outcome in outcomes] == ["player_bust", "dealer_bust"]
+    assert payouts.tolist() == [0, 20]
+
+
+def test_settle_seats_broadcasts_dealer_per_table():
+    totals = np.array([[21, 20, 17], [19, 23, 19]])
+    card_counts = np.array([[2, 3, 2], [2, 3, 3]])
+    outcomes, payouts = settle_seats(totals, card_counts, np.array([[20], [19]]), 10)
+    assert [[OUTCOMES[o] for o in row] for row in outcomes] == [["blackjack", "push", "lose"],
+                                                                ["push", "player_bust", "push"]]
+    assert payouts.tolist() == [[25, 10, 0], [10, 0, 10]]
+
+
+def test_single_seat_table_matches_blackjack_round():
+    table_player, round_player = Player("Стіл"), Player("Раунд")
+    table_player.chips = round_player.chips = 10 ** 6
+    table = TableRound([table_player], Shoe(6, seed=32))
+    game_round = BlackjackRound(round_player, Shoe(6, seed=32))
+    for _ in range(500):
+        play_table(table, [10])
+        play_round(game_round, 10, stand_on_policy())
+        assert cards(table_player.hand) == cards(round_player.hand)
+        assert cards(table.dealer.hand) == cards(game_round.dealer.hand)
+        assert (table.outcomes[0], int(table.payouts[0])) == (game_round.outcome, game_round.payout)
+    assert table_player.chips == round_player.chips
+
+
+def test_seats_without_bet_sit_out():
+    players = [Player(f"Місце {i}") for i in range(3)]
+    table = TableRound(players, Shoe(6, seed=33))
+    play_table(table, [10, 0, 20])
+    assert players[1].hand.cards == []
+    assert table.outcomes[1] is None
+    assert players[1].chips == 1000
+    for i, bet in ((0, 10), (2, 20)):
+        assert players[i].chips == 1000 - bet + table.payouts[i]
+
+
+def test_dealer_skips_drawing_when_every_seat_busts():
+    players = [Player("А"), Player("Б")]
+    table = TableRound(players, Shoe(6, seed=34))
+    all_bust = 0
+    for _ in range(200):
+        # Місце з 21 на двох картах не ходить, тому перебирають не всі раунди
+        play_table(table, [10, 10], stand_on=22)
+        if all(outcome == "player_bust" for outcome in table.outcomes):
+            all_bust += 1
+            assert len(table.dealer.hand.cards) == 2
+        for player in players:
+            player.reset_chips()
+    assert all_bust
+
+
+@pytest.mark.parametrize("seats", [0, MAX_SEATS + 1])
+def test_table_size_is_limited(seats):
+    with pytest.raises(ValueError):
+        TableRound([Player(str(i)) for i in range(seats)])
+
+
+@pytest.mark.parametrize("bets", [[0, 0], [10], [10, 5000], [-10, 10]])
+def test_invalid_table_bets_are_rejected(bets):
+    players = [Player("А"), Player("Б")]
+    table = TableRound(players, Shoe(6, seed=35))
+    with pytest.raises(ValueError):
+        table.start(bets)
+    assert [player.chips for player in players] == [1000, 1000]
+    assert table.finished
@@ -0,0 +1,173 @@
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from PIL import Image, ImageTk
+
+
+class WheelRenderer(ABC):
+    """Базовий клас малювання колеса рулетки.
+
+    Усі елементи створюються один раз у конструкторі, а draw() лише
+    переміщує їх, тому за кадр не створюється і не знищується жоден елемент.
+    """
+
+    def __init__(self, canvas, game):
+        self.canvas = canvas
+        self.game = game
+        self.ball = None
+
+    @abstractmethod
+    def draw(self, angle: float, ball_angle: float, show_ball: bool) -> None:
+        pass
+
+    def _create_ball(self) -> None:
+        self.ball = self.canvas.create_oval(0, 0, 0, 0, fill="white", state="hidden")
+
+    def _move_ball(self, ball_angle: float, show_ball: bool) -> None:
+        if not show_ball:
+            self.canvas.itemconfig(self.ball, state="hidden")
+            return
+        game = self.game
+        ball_x = game.center_x + game.ball_distance * math.cos(ball_angle)
+        ball_y = game.center_y - game.ball_distance * math.sin(ball_angle)
+        self.canvas.coords(self.ball, ball_x - game.ball_radius, ball_y - game.ball_radius,
+                           ball_x + game.ball_radius, ball_y + game.ball_radius)
+        self.canvas.itemconfig(self.ball, state="normal")
+
+
+class CanvasWheelRenderer(WheelRenderer):
+    """Колесо з елементів Canvas: сектори і числа оновлюються на місці."""
+
+    def __init__(self, canvas, game):
+        super().__init__(canvas, game)
+        self.arcs: List[int] = []
+        self.labels: List[int] = []
+        self.last_angle: Optional[float] = None
+
+        bbox = (game.center_x - game.wheel_radius, game.center_y - game.wheel_radius,
+                game.center_x + game.wheel_radius, game.center_y + game.wheel_radius)
+        canvas.create_oval(*bbox, fill="#333333")
+        angle_step = 360 / len(game.numbers)
+        for num in game.numbers:
+            color = game.number_colors[num]
+            self.arcs.append(canvas.create_arc(*bbox, start=0, extent=angle_step, fill=color, outline="#ffffff"))
+        for num in game.numbers:
+            color = game.number_colors[num]
+            self.labels.append(canvas.create_text(0, 0, text=str(num), fill="white" if color != "green" else "black",
+                                                  font=("Arial", 8, "bold")))
+        self._create_ball()
+
+    def draw(self, angle: float, ball_angle: float, show_ball: bool) -> None:
+        if angle != self.last_angle:
+            game = self.game
+            angle_step = 360 / len(game.numbers)
+            for i, (arc, label) in enumerate(zip(self.arcs, self.labels)):
+                start_angle = i * angle_step + angle
+                self.canvas.itemconfig(arc, start=start_angle)
+                text_angle = math.radians(start_angle + angle_step / 2)
+                self.canvas.coords(label,
+                                   game.center_x + (game.wheel_radius - 30) * math.cos(text_angle),
+                                   game.center_y - (game.wheel_radius - 30) * math.sin(text_angle))
+            self.last_angle = angle
+        self._move_ball(ball_angle, show_ball)
+
+
+class BitmapWheelRenderer(WheelRenderer):
+    """Колесо як одне зображення, заздалегідь намальоване для фіксованого набору кутів.
+
+    За кадр змінюється лише зображення одного елемента і позиція кульки,
+    тому вартість кадру не залежить від кількості секторів. PIL імпортується
+    лише тут, щоб режим canvas не платив за нього під час запуску.
+    """
+
+    def __init__(self, canvas, game, angle_step: float = 0.5, max_frames: int = 240):
+        super().__init__(canvas, game)
+        self.angle_step = angle_step
+        self.max_frames = max_frames
+        self.frames: "OrderedDict[int, ImageTk.PhotoImage]" = OrderedDict()
+        self.current_index: Optional[int] = None
+        self.background = canvas.cget("bg")
+        self.font = self._load_font()
+        self.image_item = canvas.create_image(game.center_x, game.center_y)
+        self._create_ball()
+
+    def draw(self, angle: float, ball_angle: float, show_ball: bool) -> None:
+        steps = int(round(360 / self.angle_step))
+        index = int(round(angle / self.angle_step)) % steps
+        if index != self.current_index:
+            self.canvas.itemconfig(self.image_item, image=self._frame(index))
+            self.current_index = index
+        self._move_ball(ball_angle, show_ball)
+
+    def prerender(self, count: Optional[int] = None) -> None:
+        """Намалювати наперед перші count кадрів (за замовчуванням — скільки влізе в кеш)."""
+        count = self.max_frames if count is None else min(count, self.max_frames)
+        for index in range(count):
+            self._frame(index)
+
+    def _frame(self, index: int) -> "ImageTk.PhotoImage":
+        photo = self.frames.get(index)
+        if photo is not None:
+            self.frames.move_to_end(index)
+            return photo
+        from PIL import ImageTk
+
+        photo = ImageTk.PhotoImage(self.render(index * self.angle_step))
+        self.frames[index] = photo
+        while len(self.frames) > self.max_frames:
+            self.frames.popitem(last=False)
+        return photo
+
+    def render(self, angle: float) -> "Image.Image":
+        """Намалювати колесо під кутом angle так само, як CanvasWheelRenderer."""
+        from PIL import Image, ImageDraw
+
+        game = self.game
+        radius = game.wheel_radius
+        size = 2 * radius + 2
+        image = Image.new("RGB", (size, size), self.background)
+        draw = ImageDraw.Draw(image)
+        center = size / 2
+        bbox = (center - radius, center - radius, center + radius, center + radius)
+        draw.ellipse(bbox, fill="#333333")
+
+        angle_step = 360 / len(game.numbers)
+        for i, num in enumerate(game.numbers):
+            start_angle = i * angle_step + angle
+            # Tk рахує кути проти годинникової стрілки, PIL — за нею
+            draw.pieslice(bbox, start=-(start_angle + angle_step), end=-start_angle,
+                          fill=game.number_colors[num], outline="#ffffff")
+        for i, num in enumerate(game.numbers):
+            color = game.number_colors[num]
+            text_angle = math.radians(i * angle_step + angle + angle_step / 2)
+            text_x = center + (radius - 30) * math.cos(text_angle)
+            text_y = center - (radius - 30) * math.sin(text_angle)
+            draw.text((text_x, text_y), str(num), fill="white" if color != "green" else "black",
+                      font=self.font, anchor="mm")
+        return image
+
+    def _load_font(self):
+        from PIL import ImageFont
+
+        try:
+            return ImageFont.truetype("arialbd.ttf", 11)
+        except OSError:
+            return ImageFont.load_default()
+
+
+RENDERERS = {
+    "canvas": CanvasWheelRenderer,
+    "bitmap": BitmapWheelRenderer,
+}
+
+
+def create_wheel_renderer(mode: str, canvas, game) -> WheelRenderer:
+    """Створити рендерер колеса за назвою режиму ('canvas' або 'bitmap')."""
+    try:
+        renderer_class = RENDERERS[mode]
+    except KeyError:
+        raise ValueError(f"Невідомий режим малювання колеса: {mode}")
+    return renderer_class(canvas, game)
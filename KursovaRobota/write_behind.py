@@ -0,0 +1,86 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+_STOP = object()
+
+
+class WriteBehind(ABC):
+    """Черга записів з окремим потоком, що зберігає їх пачками.
+
+    _put() лише кладе запис у чергу, тому потік, що грає, не чекає на
+    диск. Потік запису збирає до batch_size записів (скільки є в черзі) і
+    передає їх у _write_batch() одним викликом. Підклас налаштовує
+    сховище і викликає super().__init__() останнім: саме тоді стартує потік.
+    """
+
+    closed_message = "Журнал закрито"
+
+    def __init__(self, thread_name: str, batch_size: int, flush_interval: float):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._flushed = threading.Condition()
+        self._pending = 0
+        self._closed = False
+
+        self._writer = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._writer.start()
+
+    def _put(self, item) -> None:
+        if self._closed:
+            raise RuntimeError(self.closed_message)
+        with self._flushed:
+            self._pending += 1
+        self._queue.put(item)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Дочекатися, поки всі записи з черги потраплять на диск."""
+        with self._flushed:
+            return self._flushed.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self) -> None:
+        """Записати все, що залишилось, і зупинити потік запису."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+
+    def _writer_started(self) -> None:
+        """Викликається в потоці запису до першої пачки (наприклад, щоб відкрити з'єднання)."""
+
+    @abstractmethod
+    def _write_batch(self, batch: list) -> None:
+        """Зберегти непорожню пачку записів (у потоці запису)."""
+
+    def _writer_stopped(self) -> None:
+        """Викликається в потоці запису після останньої пачки."""
+
+    def _run(self) -> None:
+        self._writer_started()
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            stopping = item is _STOP
+
+            if batch:
+                self._write_batch(batch)
+                with self._flushed:
+                    self._pending -= len(batch)
+                    self._flushed.notify_all()
+        self._writer_stopped()